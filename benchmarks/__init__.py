@@ -0,0 +1,9 @@
+"""
+WHIXPI Pro V1.0 - Benchmarks
+============================
+GPU/model gerektirmeyen, sentetik veriyle çalışan performans ölçümleri.
+
+Kullanım (proje kökünden):
+    python -m benchmarks.bench_solver
+    python -m benchmarks.suite --out sonuc.json   (Tüm logic.py motorları, JSON rapor)
+"""
@@ -0,0 +1,185 @@
+"""
+Chronos Benchmark'ı
+===================
+Eski dict dict çalışan Chronos döngüleri ile sütunlu WordTable üzerindeki
+vektörel sürümlerin karşılaştırması. Zamanların bit düzeyinde aynı olduğu
+da doğrulanır.
+
+Kullanım:
+    python -m benchmarks.bench_chronos [--words 1000000] [--repeat 3]
+"""
+
+import sys
+import time
+import copy
+import argparse
+
+import numpy as np
+
+from src.engine.logic import (
+    WordTable, bridge_table, distribute_gaps_table,
+    chronos_seamless_core, waveform_finetune_chronos
+)
+from benchmarks.bench_miller import make_aligned
+
+
+# =============================================================================
+# ESKİ DÖNGÜLER (Referans)
+# =============================================================================
+
+def legacy_seamless_core(segments, threshold_sec, min_dur=0.2):
+    """Eski chronos_seamless_core (Referans): Dict dict sıralı döngü."""
+    if not segments:
+        return segments
+    
+    for i in range(len(segments) - 1):
+        gap = segments[i+1]["start"] - segments[i]["end"]
+        
+        # 1. Zero-Gap Bridge: Küçük boşlukları kapat
+        if gap <= threshold_sec:
+            segments[i]["end"] = segments[i+1]["start"]
+        
+        # 2. Overlap Fixer: Örtüşmeleri düzelt
+        if segments[i]["end"] > segments[i+1]["start"]:
+            segments[i]["end"] = segments[i+1]["start"]
+
+        # 3. Minimum Duration Guard: Minimum süreyi garantile
+        if segments[i]["end"] - segments[i]["start"] < min_dur:
+            segments[i]["end"] = segments[i]["start"] + min_dur
+    
+    # Son segment için de minimum süre kontrolü
+    if segments[-1]["end"] - segments[-1]["start"] < min_dur:
+        segments[-1]["end"] = segments[-1]["start"] + min_dur
+    
+    return segments
+
+
+def legacy_finetune_chronos(segments):
+    """Eski waveform_finetune_chronos (Referans): Dict dict sıralı döngü."""
+    refined_segments = []
+    
+    for seg in segments:
+        if "words" not in seg or not seg["words"]:
+            refined_segments.append(seg)
+            continue
+        
+        words = seg["words"]
+        
+        for i in range(len(words) - 1):
+            try:
+                w1, w2 = words[i], words[i+1]
+                gap = w2["start"] - w1["end"]
+                
+                if 0 < gap < 0.3:
+                    # Dinamik dağıtım: %40-40 paylaştır, %20 emniyet
+                    dist = min(gap * 0.4, 0.08)
+                    w1["end"] += dist
+                    w2["start"] -= dist
+            except:
+                pass
+        
+        # Segment sınırlarını rafine edilmiş kelimelere göre güncelle
+        if words:
+            seg["start"] = words[0]["start"]
+            seg["end"] = words[-1]["end"]
+        
+        refined_segments.append(seg)
+    
+    return refined_segments
+
+
+# =============================================================================
+# ÖLÇÜM
+# =============================================================================
+
+def _bits(items):
+    """Zamanların float64 bit desenleri (Bire bir karşılaştırma için)."""
+    times = np.array([(d["start"], d["end"]) for d in items], dtype=np.float64)
+    return times.view(np.int64)
+
+
+def _time(fn, make_input, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        data = make_input()
+        t0 = time.perf_counter()
+        out = fn(data)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def run(words=1000000, repeat=3, seed=0, bridge_ms=300):
+    """
+    Benchmark'ı çalıştırır.
+
+    Returns:
+        {"adım": {"legacy_s", "table_s", "kernel_s", "speedup", "identical"}}
+    """
+    aligned = make_aligned(words, seed=seed)
+    flat = [w for s in aligned["segments"] for w in s["words"]]
+    thr = bridge_ms / 1000.0
+
+    cases = {
+        "finetune": (
+            lambda: copy.deepcopy(aligned["segments"]),
+            legacy_finetune_chronos,
+            waveform_finetune_chronos,
+            lambda segs: distribute_gaps_table(WordTable.from_segments(segs)),
+            lambda segs: [w for s in segs for w in s["words"]]
+        ),
+        "seamless": (
+            lambda: [dict(w) for w in flat],
+            lambda items: legacy_seamless_core(items, thr, 0.08),
+            lambda items: chronos_seamless_core(items, thr, 0.08),
+            lambda items: bridge_table(WordTable.from_dicts(items), thr, 0.08),
+            lambda items: items
+        )
+    }
+
+    results = {}
+    for name, (make_input, legacy, vector, kernel, flatten) in cases.items():
+        t_old, ref = _time(legacy, make_input, repeat)
+        t_new, out = _time(vector, make_input, repeat)
+
+        # Sadece vektörel çekirdek (Dönüşüm hariç)
+        table = kernel(make_input())
+        start, end = table.start.copy(), table.end.copy()
+        t_kernel = float("inf")
+        for _ in range(repeat):
+            table.start, table.end = start.copy(), end.copy()
+            t0 = time.perf_counter()
+            (distribute_gaps_table if name == "finetune" else lambda t: bridge_table(t, thr, 0.08))(table)
+            t_kernel = min(t_kernel, time.perf_counter() - t0)
+
+        results[name] = {
+            "items": len(flat),
+            "legacy_s": t_old,
+            "table_s": t_new,
+            "kernel_s": t_kernel,
+            "speedup": t_old / t_new if t_new > 0 else float("inf"),
+            "identical": bool(np.array_equal(_bits(flatten(ref)), _bits(flatten(out))))
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_chronos")
+    parser.add_argument("--words", type=int, default=1000000, help="Sentetik kelime sayısı")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(args.words, args.repeat)
+    ok = True
+    for name, r in results.items():
+        ok &= r["identical"]
+        print(
+            f"{name:<9} {r['items']:>8} kelime | eski: {r['legacy_s'] * 1000:8.1f} ms | "
+            f"tablo: {r['table_s'] * 1000:7.1f} ms (çekirdek {r['kernel_s'] * 1000:.1f} ms) | "
+            f"x{r['speedup']:.1f} | {'AYNI' if r['identical'] else 'FARKLI!'}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
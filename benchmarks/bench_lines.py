@@ -0,0 +1,205 @@
+"""
+Satır Dengeleme Benchmark'ı
+===========================
+Eski Miller satır dengeleme (textwrap + birleştirme + anti-dangle + bağlaç
+düzeltmeleri) ile dinamik programlamalı _balance_lines() karşılaştırması.
+Çıktılar bilerek farklıdır; hız yanında yerleşim kalitesi de raporlanır:
+limit aşan satırlar, satır sayısı aşımı, tek kelimelik son satırlar,
+bağlaçla biten satırlar ve satır uzunluklarının ortalama standart sapması.
+DP'de limit aşan veya bağlaçla biten satır sayısı eskisinden fazlaysa
+FARKLI! yazılır ve çıkış kodu 1 olur.
+
+Bloklar benchmarks.synthetic'in gerçekçi Türkçe transkriptinden gelir (Zipf
+sözlük, birbirinden farklı metin); aynı blokları yeniden oynatan ölçüm
+yapılmaz.
+
+Kullanım:
+    python -m benchmarks.bench_lines [--words 200000] [--repeat 3]
+"""
+
+import sys
+import time
+import argparse
+import textwrap
+
+import numpy as np
+
+from src.engine.logic import iter_miller_blocks, miller_limits, _balance_lines
+from src.engine.rules import DEFAULT_PACK
+from benchmarks.synthetic import make_transcript
+
+
+# DP'nin eski dengelemeden kötü olmaması gereken ölçütler
+GUARDED = ("over_limit", "conjunction_end")
+
+# Ayar profilleri: max_lines / base_limit
+PROFILES = {
+    "2x42": {"max_words": "0", "max_lines": "2", "base_limit": 42},
+    "3x32": {"max_words": "0", "max_lines": "3", "base_limit": 32}
+}
+
+
+# =============================================================================
+# SENTETİK VERİ
+# =============================================================================
+
+def make_blocks(words, config, seed=0):
+    """Miller bloklarının dengelenmemiş metinleri (Tek satır)."""
+    aligned = make_transcript(words, language="tr", seed=seed)
+    stream = (w for s in aligned["segments"] for w in s["words"])
+    return [b["text"].replace("\n", " ") for b in iter_miller_blocks(stream, config)]
+
+
+# =============================================================================
+# ESKİ DENGELEME (Referans)
+# =============================================================================
+
+def legacy_balance_lines(txt_content, ml, base_l):
+    """Eski Miller Balancing (Referans): textwrap + düzeltme geçişleri."""
+    # --- MILLER BALANCING (v28 - Force Box Logic) ---
+    if ml > 1:
+        total_chars = len(txt_content)
+        
+        # İdeal satır sayısını belirle (Simetri için)
+        target_lines = max(1, int(total_chars / base_l) + (1 if total_chars % base_l > (base_l * 0.1) else 0))
+        target_lines = min(target_lines, ml)
+        
+        # Hedef genişlik: Metni mevcut satır sayısına bölecek en tatlı genişlik
+        target_w = max(15, int(total_chars / target_lines))
+        
+        # 1. İlk Kesim (Tentative Wrap)
+        lines = textwrap.wrap(txt_content, width=target_w + 5) # Esnek tolerans
+        
+        # 2. Hard Limit Enforcement (Duvar Kontrolü)
+        # Eğer satır sayısı limiti aştıysa, alttan yukarı doğru birleştir.
+        while len(lines) > ml:
+            last = lines.pop()
+            lines[-1] += " " + last
+        
+        # 3. Estetik Rötuşlar (Sadece çok satırlıysa)
+        if len(lines) > 1:
+            # A) Anti-Dangle (Tek kelime kalmasın)
+            if len(lines[-1].split()) == 1:
+                prev_words = lines[-2].split()
+                if len(prev_words) > 1:
+                    val = prev_words.pop()
+                    # Eğer çok uzun bir kelime değilse aşağı at
+                    if len(val) < 15:
+                        lines[-1] = val + " " + lines[-1]
+                        lines[-2] = " ".join(prev_words)
+            
+            # B) Bağlaç Koruması (Bağlaç satır sonunda kalmasın)
+            for j in range(len(lines)-1):
+                l_w = lines[j].split()
+                if l_w:
+                    last_word = l_w[-1]
+                    clean_last = last_word.lower().strip(".,?!:;")
+                    if clean_last in DEFAULT_PACK.conjunctions:
+                        # Bağlacı aşağı at
+                        lines[j] = " ".join(l_w[:-1])
+                        lines[j+1] = last_word + " " + lines[j+1]
+        
+        return "\n".join(lines)
+    
+    elif ml == 1:
+        # Tek satır disiplini
+        return "\n".join(textwrap.wrap(txt_content, width=base_l))
+    
+    return txt_content
+
+
+# =============================================================================
+# ÖLÇÜM
+# =============================================================================
+
+def quality(texts, ml, base_l):
+    """
+    Returns:
+        {"over_limit", "too_many_lines", "dangling", "conjunction_end", "mean_std"}
+    """
+    over = too_many = dangling = conj = 0
+    stds = []
+    for text in texts:
+        lines = text.split("\n")
+        over += sum(len(line) > base_l for line in lines)
+        too_many += len(lines) > ml
+        if len(lines) > 1:
+            dangling += len(lines[-1].split()) == 1
+            conj += sum(
+                bool(line.split()) and line.split()[-1].lower().strip(".,?!:;") in DEFAULT_PACK.conjunctions
+                for line in lines[:-1]
+            )
+            stds.append(float(np.std([len(line) for line in lines])))
+    return {
+        "over_limit": over,
+        "too_many_lines": too_many,
+        "dangling": dangling,
+        "conjunction_end": conj,
+        "mean_std": float(np.mean(stds)) if stds else 0.0
+    }
+
+
+def _time(fn, blocks, ml, base_l, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = [fn(t, ml, base_l) for t in blocks]
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def run(words=200000, repeat=3, seed=0):
+    """
+    Benchmark'ı çalıştırır.
+
+    Returns:
+        {"profil": {"blocks", "legacy_s", "dp_s", "legacy", "dp"}}
+    """
+    results = {}
+    for name, config in PROFILES.items():
+        _, ml, base_l = miller_limits(config)
+        blocks = make_blocks(words, config, seed=seed)
+
+        t_old, ref = _time(legacy_balance_lines, blocks, ml, base_l, repeat)
+        t_dp, out = _time(_balance_lines, blocks, ml, base_l, repeat)
+
+        results[name] = {
+            "blocks": len(blocks),
+            "legacy_s": t_old,
+            "dp_s": t_dp,
+            "legacy": quality(ref, ml, base_l),
+            "dp": quality(out, ml, base_l)
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_lines")
+    parser.add_argument("--words", type=int, default=200000, help="Sentetik kelime sayısı")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(args.words, args.repeat)
+    ok = True
+    for name, r in results.items():
+        n = r["blocks"]
+        print(
+            f"{name:<5} {n:>7} blok | eski: {n / r['legacy_s']:9.0f} blok/s | "
+            f"DP: {n / r['dp_s']:9.0f} blok/s | x{r['legacy_s'] / r['dp_s']:.1f}"
+        )
+        for label in ("legacy", "dp"):
+            q = r[label]
+            print(
+                f"      {'eski' if label == 'legacy' else 'DP':<4} | limit aşan satır: {q['over_limit']:>5} | "
+                f"fazla satır: {q['too_many_lines']:>4} | tek kelime: {q['dangling']:>5} | "
+                f"bağlaç sonu: {q['conjunction_end']:>5} | ort. std: {q['mean_std']:5.2f}"
+            )
+        worse = [k for k in GUARDED if r["dp"][k] > r["legacy"][k]]
+        ok = ok and not worse
+        print(f"      kalite: {'TAMAM' if not worse else 'FARKLI! (DP daha kötü: ' + ', '.join(worse) + ')'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+Miller Bölücü Benchmark'ı
+=========================
+Eski miller_hybrid_split (grup uzunluğunu her kelimede yeniden toplar) ile
+akış halindeki iter_miller_blocks() karşılaştırması, milyon kelimelik
+sentetik girdilerle. Çıktıların bire bir aynı olduğu da doğrulanır
+(Satır dengeleme iki tarafta da güncel _balance_lines(); bkz. bench_lines).
+
+Kullanım:
+    python -m benchmarks.bench_miller [--words 1000000] [--repeat 1]
+"""
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from src.engine.logic import iter_miller_blocks, miller_hybrid_split, _balance_lines
+
+
+# Ayar profilleri: Standart altyazı ve satır sınırı olmayan (uzun gruplar)
+PROFILES = {
+    "standart": {"max_words": "0", "max_lines": "2", "base_limit": 42},
+    "sinirsiz": {"max_words": "0", "max_lines": "0", "base_limit": 75}
+}
+
+
+# =============================================================================
+# SENTETİK VERİ
+# =============================================================================
+
+VOCAB = ["ve", "ama", "bir", "bu", "çok", "daha", "sonra", "merhaba", "dünya", "zaman",
+         "because", "and", "the", "subtitle", "anlatıyor", "gerçekten", "işte", "yani"]
+
+
+def make_aligned(words, seed=0):
+    """
+    Sentetik hizalanmış sonuç: Seyrek noktalama ve kısa boşluklu uzun konuşma.
+
+    Returns:
+        {"segments": [...]} (Segment başına ~40 kelime)
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(VOCAB)
+    picks = vocab[rng.integers(0, len(vocab), words)]
+    punct = rng.random(words)
+    durs = rng.uniform(0.08, 0.45, words)
+    # Çoğunlukla kısa boşluk, arada nefes (>0.5 s)
+    gaps = np.where(rng.random(words) < 0.003, rng.uniform(0.6, 1.5, words), rng.uniform(0.0, 0.15, words))
+    starts = np.cumsum(gaps + np.concatenate(([0.0], durs[:-1])))
+
+    segments = []
+    seg_words = []
+    for i in range(words):
+        text = str(picks[i])
+        if punct[i] < 0.01:
+            text += "."
+        elif punct[i] < 0.03:
+            text += ","
+        seg_words.append({
+            "word": text,
+            "start": round(float(starts[i]), 3),
+            "end": round(float(starts[i] + durs[i]), 3),
+            "score": 0.9
+        })
+        if len(seg_words) >= 40:
+            segments.append(_segment(seg_words))
+            seg_words = []
+    if seg_words:
+        segments.append(_segment(seg_words))
+    return {"segments": segments}
+
+
+def _segment(words):
+    return {
+        "start": words[0]["start"],
+        "end": words[-1]["end"],
+        "text": " ".join(w["word"] for w in words),
+        "words": words
+    }
+
+
+# =============================================================================
+# ESKİ BÖLÜCÜ (Referans)
+# =============================================================================
+
+def legacy_miller_split(result, config):
+    """Eski miller_hybrid_split (Referans): Grup uzunluğunu her kelimede baştan toplar."""
+    
+    def safe_int(val, default=0):
+        try:
+            return int(str(val).strip()) if val else default
+        except:
+            return default
+    
+    mw = safe_int(config.get("max_words"), 0)
+    ml = safe_int(config.get("max_lines"), 0)
+    base_l = safe_int(config.get("base_limit"), 75)
+    
+    # Segment kapasitesi hesapla
+    seg_capacity = (base_l * ml) if ml > 0 else 9999
+    
+    # Tüm kelimeleri düz listeye çıkar
+    words = []
+    for s in result.get("segments", []):
+        for w in s.get("words", []):
+            if "start" in w:
+                words.append(w)
+    
+    # Eğer kelime yoksa veya sınır yoksa, orijinal segmentleri döndür
+    if not words or (mw == 0 and ml == 0 and base_l == 0):
+        return [
+            {"start": s["start"], "end": s["end"], "text": s["text"].strip()} 
+            for s in result.get("segments", [])
+        ]
+    
+    new_segs = []
+    group = []
+    
+    def commit_group(grp):
+        """Kelime grubunu segment olarak tamamla."""
+        if not grp:
+            return
+        
+        txt_content = " ".join([x.get("word", "") for x in grp]).strip()
+        
+        # Satır dengeleme güncel koddan (Bu benchmark sadece bölmeyi karşılaştırır)
+        txt_content = _balance_lines(txt_content, ml, base_l)
+        
+        new_segs.append({
+            "start": grp[0]["start"], 
+            "end": grp[-1]["end"], 
+            "text": txt_content
+        })
+    
+    # Kelimeleri segmentlere böl
+    for w in words:
+        if not group:
+            group.append(w)
+            continue
+        
+        last_text = group[-1].get("word", "").lower().strip(".,?!:;")
+        split = False
+        
+        # 1. Sert Limit Check: Kelime Sayısı
+        if mw > 0 and len(group) >= mw:
+            split = True
+        
+        # 2. Sert Limit Check: Karakter Kapasitesi
+        if not split and base_l > 0:
+            current_len = sum(len(x.get("word", "")) for x in group) + len(group)
+            
+            # v26.1: Absolute Boundary Enforcement
+            if current_len + len(w.get("word", "")) > seg_capacity:
+                split = True
+            
+            # 3. Disiplinli Kesim: Noktalama & Bağlaç
+            elif current_len >= (base_l * 0.7):
+                if any(p in group[-1].get("word", "") for p in [".", "?", "!", ":"]):
+                    split = True
+                elif any(p in group[-1].get("word", "") for p in [",", ";"]) and current_len >= base_l:
+                    split = True
+        
+        # 4. Sessizlik Yasası (Silence is Law)
+        if not split:
+            gap = w["start"] - group[-1]["end"]
+            if gap > 0.5:
+                split = True  # Yarım saniyelik nefes bölünür
+            elif any(p in group[-1].get("word", "") for p in [".", "?", "!"]) and gap > 0.2:
+                split = True
+        
+        if split:
+            commit_group(group)
+            group = [w]
+        else:
+            group.append(w)
+    
+    # Son grubu tamamla
+    commit_group(group)
+    
+    # Segment geçişlerini düzelt
+    for i in range(1, len(new_segs)):
+        if new_segs[i]["start"] - new_segs[i-1]["end"] < 0.2:
+            new_segs[i-1]["end"] = new_segs[i]["start"]
+    
+    return new_segs
+
+
+# =============================================================================
+# ÖLÇÜM
+# =============================================================================
+
+def _time(fn, repeat):
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def _first_block(aligned, config):
+    """Akış modunda ilk bloğun gelme süresi (saniye)."""
+    t0 = time.perf_counter()
+    words = (w for s in aligned["segments"] for w in s.get("words", []))
+    next(iter_miller_blocks(words, config), None)
+    return time.perf_counter() - t0
+
+
+def run(words=1000000, repeat=1, seed=0):
+    """
+    Benchmark'ı çalıştırır.
+
+    Returns:
+        {"profil": {"blocks", "legacy_s", "stream_s", "first_block_ms", "speedup", "identical"}}
+    """
+    aligned = make_aligned(words, seed=seed)
+    results = {}
+    for name, config in PROFILES.items():
+        t_old, ref = _time(lambda: legacy_miller_split(aligned, config), repeat)
+        t_new, out = _time(lambda: miller_hybrid_split(aligned, config), repeat)
+        results[name] = {
+            "blocks": len(out),
+            "legacy_s": t_old,
+            "stream_s": t_new,
+            "first_block_ms": _first_block(aligned, config) * 1000,
+            "speedup": t_old / t_new if t_new > 0 else float("inf"),
+            "identical": ref == out
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_miller")
+    parser.add_argument("--words", type=int, default=1000000, help="Sentetik kelime sayısı")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    results = run(args.words, args.repeat)
+    ok = True
+    for name, r in results.items():
+        ok &= r["identical"]
+        print(
+            f"{name:<9} {args.words:>8} kelime -> {r['blocks']:>7} blok | eski: {r['legacy_s']:6.2f} s | "
+            f"akış: {r['stream_s']:6.2f} s | x{r['speedup']:.1f} | ilk blok: {r['first_block_ms']:.2f} ms | "
+            f"{'AYNI' if r['identical'] else 'FARKLI!'}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""
+Diamond Refinery Sınır Çözücüsü Benchmark'ı
+===========================================
+Eski döngü tabanlı çözücü ile vektörel solve_boundaries() karşılaştırması.
+Sonuçların bire bir aynı olduğu da doğrulanır.
+
+Kullanım:
+    python -m benchmarks.bench_solver [--minutes 180] [--words 60000]
+"""
+
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from src.engine.vad import VadAnalysis, VAD_HOP, solve_boundaries
+
+
+# =============================================================================
+# SENTETİK VERİ
+# =============================================================================
+
+def make_vad(minutes, seed=0, sr=16000):
+    """Konuşma/sessizlik bloklarından oluşan sentetik ses ve VAD haritası."""
+    rng = np.random.default_rng(seed)
+    n = int(minutes * 60 * sr)
+    m = -(-n // VAD_HOP)
+
+    # 0.3-3 s konuşma, 0.1-1 s sessizlik
+    speech = np.zeros(m, dtype=bool)
+    pos = 0
+    while pos < m:
+        on = int(rng.uniform(0.3, 3.0) * sr / VAD_HOP)
+        off = int(rng.uniform(0.1, 1.0) * sr / VAD_HOP)
+        speech[pos:pos + on] = True
+        pos += on + off
+
+    probs = np.where(speech, rng.uniform(0.3, 1.0, m), rng.uniform(0.0, 0.12, m)).astype(np.float32)
+    env = np.repeat(np.where(speech, 0.3, 0.003), VAD_HOP)[:n].astype(np.float32)
+    audio = (rng.standard_normal(n).astype(np.float32) * env)
+    # Eşitlik durumları (tie-break) için tam sessiz bölgeler
+    audio[::7919] = 0.0
+
+    return VadAnalysis(audio, probs, 0.08, 0.5, 0.5, 0.5, sr=sr)
+
+
+def make_segments(duration, count, seed=1):
+    """Sıralı, kısa kelime segmentleri."""
+    rng = np.random.default_rng(seed)
+    starts = np.sort(rng.uniform(0, duration - 0.5, count))
+    lens = rng.uniform(0.08, 0.6, count)
+    return [{"start": round(float(s), 3), "end": round(float(s + l), 3)} for s, l in zip(starts, lens)]
+
+
+# =============================================================================
+# ESKİ ÇÖZÜCÜ (Referans)
+# =============================================================================
+
+def legacy_solver(vad, segments, mode="sentence"):
+    """diamond_refinery'nin eski segment segment çalışan çözücüsü (Referans)."""
+    sr = vad.sr
+    audio_np = vad.audio
+    full_map = vad.probs
+    vad_threshold, dyn_pad_s, dyn_pad_e, dyn_min_sil = vad.calibration
+
+    seg_count = len(segments)
+    starts = np.array([s["start"] for s in segments])
+    ends = np.array([s["end"] for s in segments])
+
+    SAFETY = 0.02
+    prev_ends = np.concatenate(([0], ends[:-1] + SAFETY))
+    next_starts = np.concatenate((starts[1:] - SAFETY, [len(audio_np)/sr]))
+
+    w_starts = np.maximum(prev_ends, starts - dyn_pad_s)
+    w_ends = np.minimum(next_starts, ends + dyn_pad_e)
+
+    idx_starts = (w_starts * sr / 512).astype(int)
+    idx_ends = (w_ends * sr / 512).astype(int)
+    idx_starts = np.clip(idx_starts, 0, len(full_map))
+    idx_ends = np.clip(idx_ends, 0, len(full_map))
+
+    MAX_S_DRIFT = 0.30 if mode == "sentence" else 0.15
+    MAX_E_DRIFT = dyn_min_sil
+    SNAP_WIN = 1200
+
+    for i in range(seg_count):
+        s_idx, e_idx = idx_starts[i], idx_ends[i]
+        if s_idx >= e_idx: continue
+
+        local_probs = full_map[s_idx:e_idx]
+        hits = np.where(local_probs > vad_threshold)[0]
+
+        if hits.size > 0:
+            first_hit = s_idx + hits[0]
+            last_hit = s_idx + hits[-1]
+
+            raw_s = first_hit * 512
+            raw_e = (last_hit * 512) + 512
+
+            sw1 = max(0, raw_s - SNAP_WIN)
+            ew1 = min(len(audio_np), raw_s + SNAP_WIN)
+            if ew1 > sw1: snap_s = sw1 + np.argmin(np.abs(audio_np[sw1:ew1]))
+            else: snap_s = raw_s
+
+            sw2 = max(0, raw_e - SNAP_WIN)
+            ew2 = min(len(audio_np), raw_e + SNAP_WIN)
+            if ew2 > sw2: snap_e = sw2 + np.argmin(np.abs(audio_np[sw2:ew2]))
+            else: snap_e = raw_e
+
+            cand_s = snap_s / sr
+            cand_e = (snap_e / sr) + 0.04
+
+            if abs(cand_s - starts[i]) < MAX_S_DRIFT:
+                segments[i]["start"] = round(max(prev_ends[i], cand_s), 3)
+            if abs(cand_e - ends[i]) < MAX_E_DRIFT:
+                segments[i]["end"] = round(min(next_starts[i] - 0.01, cand_e), 3)
+
+        if segments[i]["end"] <= segments[i]["start"]:
+            segments[i]["end"] = segments[i]["start"] + 0.1
+
+    return segments
+
+
+def vector_solver(vad, segments, mode="sentence"):
+    """Worker'daki kullanım: solve_boundaries + değişen alanların yazımı."""
+    starts = np.array([s["start"] for s in segments])
+    ends = np.array([s["end"] for s in segments])
+    new_s, new_e, set_s, set_e = solve_boundaries(vad, starts, ends, mode=mode)
+    for i in np.flatnonzero(set_s):
+        segments[i]["start"] = new_s[i]
+    for i in np.flatnonzero(set_e):
+        segments[i]["end"] = new_e[i]
+    return segments
+
+
+# =============================================================================
+# ÇALIŞTIRMA
+# =============================================================================
+
+def _time(fn, vad, segments, mode, repeat):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        segs = [dict(s) for s in segments]
+        t0 = time.perf_counter()
+        out = fn(vad, segs, mode)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def run(minutes=180, words=60000, repeat=3, seed=0):
+    """
+    Benchmark'ı çalıştırır.
+
+    Returns:
+        {"mode": {"legacy_s", "vector_s", "speedup", "identical"}}
+    """
+    vad = make_vad(minutes, seed=seed)
+    results = {}
+    for mode, count in (("sentence", max(1, words // 8)), ("word", words)):
+        segments = make_segments(vad.duration, count, seed=seed + 1)
+        t_old, ref = _time(legacy_solver, vad, segments, mode, repeat)
+        t_new, out = _time(vector_solver, vad, segments, mode, repeat)
+        results[mode] = {
+            "segments": count,
+            "legacy_s": t_old,
+            "vector_s": t_new,
+            "speedup": t_old / t_new if t_new > 0 else float("inf"),
+            "identical": ref == out
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_solver")
+    parser.add_argument("--minutes", type=float, default=180, help="Sentetik ses süresi (dk)")
+    parser.add_argument("--words", type=int, default=60000, help="Kelime segmenti sayısı")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(args.minutes, args.words, args.repeat)
+    ok = True
+    for mode, r in results.items():
+        ok &= r["identical"]
+        print(
+            f"{mode:<9} {r['segments']:>7} seg | eski: {r['legacy_s'] * 1000:8.1f} ms | "
+            f"vektörel: {r['vector_s'] * 1000:7.1f} ms | x{r['speedup']:.1f} | "
+            f"{'AYNI' if r['identical'] else 'FARKLI!'}"
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Transkript Bellek Benchmark'ı
+=============================
+Kelime/segment dict'leri ile __slots__ tabanlı Word/Segment kayıtlarının
+karşılaştırması: Worker'ın UI'a gönderdiği sonuç (raw + segments_s +
+segments_w) için bellek (tracemalloc) ve pickle boyutu/süresi. Pickle'dan
+dönen sonuçta segment kelimeleri word_segments ile aynı nesneler mi diye de
+bakılır (Paylaşım kaybolursa FARKLI! ve çıkış kodu 1).
+
+Kullanım:
+    python -m benchmarks.bench_transcript [--words 100000]
+"""
+
+import gc
+import sys
+import time
+import copy
+import pickle
+import argparse
+import tracemalloc
+
+from src.engine.logic import reformat_aligned
+from src.engine.transcript import compact_aligned
+from benchmarks.bench_miller import make_aligned
+
+
+CONFIG = {"max_words": "0", "max_lines": "2", "base_limit": 42}
+
+
+def build_result(aligned, compact):
+    """Worker sonucunu üretir (compact=True: Hizalamadan sonra Word/Segment)."""
+    aligned["word_segments"] = [w for s in aligned["segments"] for w in s["words"]]
+    if compact:
+        compact_aligned(aligned)
+    segments_s, segments_w = reformat_aligned(aligned, CONFIG, 300, 100)
+    return {"base_name": "bench", "segments_s": segments_s, "segments_w": segments_w, "raw": aligned}
+
+
+def shares_words(aligned):
+    """Segment kelimeleri word_segments'teki nesnelerin aynısı mı (Kimlik)?"""
+    ids = set(map(id, aligned["word_segments"]))
+    return all(id(w) in ids for s in aligned["segments"] for w in s["words"])
+
+
+def measure(source, compact):
+    """
+    Returns:
+        {"memory_mb", "pickle_mb", "dumps_s", "loads_s", "shared"}
+    """
+    gc.collect()
+    tracemalloc.start()
+    res = build_result(copy.deepcopy(source), compact)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    payload = pickle.dumps(res, protocol=pickle.HIGHEST_PROTOCOL)
+    t1 = time.perf_counter()
+    loaded = pickle.loads(payload)
+    t2 = time.perf_counter()
+
+    return {
+        "memory_mb": memory / 1048576,
+        "pickle_mb": len(payload) / 1048576,
+        "dumps_s": t1 - t0,
+        "loads_s": t2 - t1,
+        "shared": shares_words(loaded["raw"])
+    }
+
+
+def run(words=100000, seed=0):
+    """
+    Benchmark'ı çalıştırır.
+
+    Returns:
+        {"dict": measure(), "slots": measure()}
+    """
+    source = make_aligned(words, seed=seed)
+    return {"dict": measure(source, False), "slots": measure(source, True)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_transcript")
+    parser.add_argument("--words", type=int, default=100000, help="Sentetik kelime sayısı")
+    args = parser.parse_args(argv)
+
+    results = run(args.words)
+    for name, r in results.items():
+        print(
+            f"{name:<6} {args.words:>7} kelime | bellek: {r['memory_mb']:6.1f} MB | "
+            f"pickle: {r['pickle_mb']:5.1f} MB | dumps: {r['dumps_s'] * 1000:6.1f} ms | "
+            f"loads: {r['loads_s'] * 1000:6.1f} ms | paylaşım: {'AYNI' if r['shared'] else 'FARKLI!'}"
+        )
+    old, new = results["dict"], results["slots"]
+    print(
+        f"Kazanç: bellek x{old['memory_mb'] / new['memory_mb']:.2f} | "
+        f"pickle x{old['pickle_mb'] / new['pickle_mb']:.2f}"
+    )
+    return 0 if all(r["shared"] for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
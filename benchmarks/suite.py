@@ -0,0 +1,290 @@
+"""
+logic.py Motorları Mikro-Benchmark Paketi
+=========================================
+Sentetik Türkçe/İngilizce transkriptlerle (1 bin - 1 milyon kelime)
+miller_hybrid_split, chronos_seamless_core, waveform_finetune_chronos,
+format_timestamp ve Diamond sınır çözücüsünü (solve_boundaries) ölçer:
+en iyi süre, kelime/saniye ve tepe bellek (tracemalloc). Sonuçlar JSON'a
+yazılır; iki derlemenin sonuçları --compare ile karşılaştırılır.
+
+Sadece CPU, numpy ve proje kodu gerekir (whisperx/torch ağırlığı yok).
+
+Kullanım:
+    python -m benchmarks.suite [--sizes 1k,10k,100k] [--languages tr,en] [--out sonuc.json]
+    python -m benchmarks.suite --sizes 1m --repeat 1 --no-memory
+    python -m benchmarks.suite --compare eski.json --out yeni.json
+"""
+
+import gc
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from src.engine.logic import (
+    miller_hybrid_split, chronos_seamless_core, waveform_finetune_chronos, format_timestamp
+)
+from src.engine.vad import solve_boundaries
+from benchmarks.synthetic import LANGUAGES, make_transcript, copy_aligned, make_vad_for
+
+
+# Miller ayarları (UI varsayılanlarına yakın) ve köprüleme eşikleri (ms)
+MILLER_CONFIG = {"max_words": "0", "max_lines": "2", "base_limit": 42}
+BRIDGE_MS = 700
+WORD_BRIDGE_MS = 300
+
+# Diamond çözücüsü için sentetik sesin üst sınırı (Bellek: 16 kHz float32)
+SOLVER_MAX_SECONDS = 1800
+
+
+# =============================================================================
+# ÖLÇÜLEN İŞLER
+# =============================================================================
+# Her iş: hazırlık(aligned, vad) -> girdi (Süreye dahil değil), çalıştır(girdi),
+# kelime sayısı(girdi). Girdiyi yerinde değiştiren işler her turda kopya alır;
+# önbellekli işlerin önbelleği her turdan önce boşaltılır (Sonuç tur sayısına
+# bağlı olmasın).
+
+def _words(aligned):
+    return [w for s in aligned["segments"] for w in s["words"] if "start" in w]
+
+
+def _prep_miller(aligned, vad):
+    return {**aligned, "config": {**MILLER_CONFIG, "language": aligned.get("language")}}
+
+
+def _run_miller(inp):
+    return miller_hybrid_split(inp, inp["config"])
+
+
+def _prep_chronos(aligned, vad):
+    return [dict(w) for w in _words(aligned)]
+
+
+def _run_chronos(words):
+    return chronos_seamless_core(words, WORD_BRIDGE_MS / 1000.0, min_dur=0.08)
+
+
+def _prep_finetune(aligned, vad):
+    return copy_aligned(aligned)["segments"]
+
+
+def _run_finetune(segments):
+    return waveform_finetune_chronos(segments)
+
+
+def _prep_timestamp(aligned, vad):
+    return [t for w in _words(aligned) for t in (w["start"], w["end"])]
+
+
+def _run_timestamp(times):
+    return [format_timestamp(t) for t in times]
+
+
+def _prep_solver(aligned, vad):
+    words = [w for w in _words(aligned) if w["end"] < vad.duration]
+    return (
+        vad,
+        np.array([w["start"] for w in words]),
+        np.array([w["end"] for w in words])
+    )
+
+
+def _run_solver(inp):
+    vad, starts, ends = inp
+    return solve_boundaries(vad, starts, ends, mode="word")
+
+
+def _count_segments_words(segments):
+    return sum(1 for s in segments for w in s["words"] if "start" in w)
+
+
+# ad -> (hazırlık, çalıştır, kelime sayısı, girdiyi değiştirir mi)
+TASKS = {
+    "miller_hybrid_split": (_prep_miller, _run_miller, lambda inp: len(_words(inp)), False),
+    "chronos_seamless_core": (_prep_chronos, _run_chronos, len, True),
+    "waveform_finetune_chronos": (_prep_finetune, _run_finetune, _count_segments_words, True),
+    "format_timestamp": (_prep_timestamp, _run_timestamp, lambda times: len(times) // 2, False),
+    "solve_boundaries": (_prep_solver, _run_solver, lambda inp: len(inp[1]), False)
+}
+
+
+# =============================================================================
+# ÖLÇÜM
+# =============================================================================
+
+def _fresh(prep, aligned, vad, mutates, cached):
+    if mutates or cached is None:
+        return prep(aligned, vad)
+    return cached
+
+
+def measure(task, aligned, vad, repeat=3, memory=True):
+    """
+    Tek bir işi ölçer.
+
+    Returns:
+        {"words", "seconds", "words_per_s", "peak_mb"} (peak_mb: memory=False ise None)
+    """
+    prep, fn, count, mutates = TASKS[task]
+    inp = prep(aligned, vad)
+    words = count(inp)
+
+    best = float("inf")
+    for _ in range(repeat):
+        inp = _fresh(prep, aligned, vad, mutates, inp)
+        gc.collect()
+        t0 = time.perf_counter()
+        fn(inp)
+        best = min(best, time.perf_counter() - t0)
+
+    peak = None
+    if memory:
+        inp = _fresh(prep, aligned, vad, mutates, inp)
+        gc.collect()
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        out = fn(inp)
+        peak = (tracemalloc.get_traced_memory()[1] - base) / 1048576
+        tracemalloc.stop()
+        del out
+
+    return {
+        "words": words,
+        "seconds": best,
+        "words_per_s": words / best if best > 0 else float("inf"),
+        "peak_mb": peak
+    }
+
+
+def parse_sizes(text):
+    """ "1k,10k,1m" -> [1000, 10000, 1000000] """
+    sizes = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        mult = {"k": 1000, "m": 1000000}.get(part[-1], 1)
+        sizes.append(int(float(part.rstrip("km")) * mult))
+    return sizes
+
+
+def run(sizes=(1000, 10000, 100000), languages=("tr", "en"), tasks=None, repeat=3, memory=True, seed=0,
+        progress=None):
+    """
+    Paketi çalıştırır.
+
+    Args:
+        progress: Her sonuçta çağrılır (sonuç dict'i), isteğe bağlı
+
+    Returns:
+        Sonuç dict'leri listesi {"function", "language", "size", "words", "seconds", "words_per_s", "peak_mb"}
+    """
+    tasks = list(tasks or TASKS)
+    results = []
+    for language in languages:
+        for size in sizes:
+            aligned = make_transcript(size, language=language, seed=seed)
+            vad = make_vad_for(aligned, SOLVER_MAX_SECONDS, seed=seed) if "solve_boundaries" in tasks else None
+            for task in tasks:
+                r = {"function": task, "language": language, "size": size}
+                r.update(measure(task, aligned, vad, repeat=repeat, memory=memory))
+                results.append(r)
+                if progress is not None:
+                    progress(r)
+            del aligned, vad
+            gc.collect()
+    return results
+
+
+def environment():
+    """Sonuç dosyasına yazılan ortam bilgisi (Derlemeleri ayırt etmek için)."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine()
+    }
+
+
+def compare(old, new):
+    """
+    İki sonuç listesini (function, language, size) ile eşleştirir.
+
+    Returns:
+        [(anahtar, eski words_per_s, yeni words_per_s, hız oranı), ...]
+    """
+    base = {(r["function"], r["language"], r["size"]): r for r in old}
+    rows = []
+    for r in new:
+        key = (r["function"], r["language"], r["size"])
+        if key in base:
+            o = base[key]["words_per_s"]
+            rows.append((key, o, r["words_per_s"], r["words_per_s"] / o if o else float("inf")))
+    return rows
+
+
+def _print_result(r):
+    peak = f"{r['peak_mb']:8.1f} MB" if r["peak_mb"] is not None else "       - MB"
+    print(
+        f"{r['function']:<26} {r['language']:<2} {r['size']:>8} | {r['words']:>8} kelime | "
+        f"{r['seconds'] * 1000:9.1f} ms | {r['words_per_s']:12,.0f} kelime/s | tepe: {peak}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("--sizes", default="1k,10k,100k", help="Kelime sayıları (örn. 1k,10k,100k,1m)")
+    parser.add_argument("--languages", default="tr,en", help=f"Diller ({','.join(LANGUAGES)})")
+    parser.add_argument("--functions", default="", help=f"Sadece bu işler ({','.join(TASKS)})")
+    parser.add_argument("--repeat", type=int, default=3, help="Tur sayısı (En iyi süre raporlanır)")
+    parser.add_argument("--no-memory", action="store_true", help="Tepe bellek ölçümünü atla (tracemalloc yavaştır)")
+    parser.add_argument("--out", default="", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", default="", help="Karşılaştırılacak önceki JSON sonucu")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    languages = [l.strip() for l in args.languages.split(",") if l.strip()]
+    tasks = [t.strip() for t in args.functions.split(",") if t.strip()] or list(TASKS)
+    unknown = [l for l in languages if l not in LANGUAGES] + [t for t in tasks if t not in TASKS]
+    if unknown:
+        parser.error(f"Bilinmeyen dil/iş: {', '.join(unknown)}")
+
+    results = run(
+        parse_sizes(args.sizes), languages, tasks, repeat=max(1, args.repeat),
+        memory=not args.no_memory, seed=args.seed, progress=_print_result
+    )
+
+    report = {"environment": environment(), "args": vars(args), "results": results}
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Sonuçlar yazıldı: {args.out}")
+
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        rows = compare(old.get("results", []), results)
+        print(f"Karşılaştırma: {old.get('environment', {}).get('commit')} -> {report['environment']['commit']}")
+        for (fn, lang, size), o, n, ratio in rows:
+            print(f"{fn:<26} {lang:<2} {size:>8} | {o:12,.0f} -> {n:12,.0f} kelime/s | x{ratio:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
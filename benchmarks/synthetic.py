@@ -0,0 +1,204 @@
+"""
+Sentetik Hizalanmış Transkript Üreticisi
+========================================
+Benchmark'lar için whisperx hizalama çıktısı biçiminde gerçekçi veri:
+dile özgü kelime uzunluğu dağılımı (Zipf frekanslı sözlük), uzunlukla
+orantılı kelime süreleri, noktalamaya bağlı duraklamalar, nefes ve uzun
+sessizlikler, zamanı olmayan (hizalanamamış) kelimeler.
+
+GPU, whisperx veya model ağırlığı gerektirmez; sadece numpy.
+
+Kullanım:
+    from benchmarks.synthetic import make_transcript
+    aligned = make_transcript(100000, language="tr")
+"""
+
+import numpy as np
+
+from src.engine.rules import TR_CONJUNCTIONS, EN_CONJUNCTIONS
+from src.engine.vad import VadAnalysis, VAD_HOP, FIXED_CALIBRATION
+
+
+# =============================================================================
+# DİL PROFİLLERİ
+# =============================================================================
+
+# Sözlük kelime uzunluğu dağılımı (1..15 harf, göreli sıklık). Zipf
+# frekanslarıyla metin ortalaması: Türkçe (sondan eklemeli) ~6.1 harf,
+# İngilizce ~4.6 harf
+LANGUAGES = {
+    "tr": {
+        "alphabet": "abcçdefgğhıijklmnoöprsştuüvyz",
+        "lengths": [0, 1, 12, 30, 58, 80, 92, 90, 80, 66, 50, 36, 24, 15, 9],
+        "function_words": ("bir", "bu", "da", "de", "için", "ne", "çok", "daha", "gibi", "o") + TR_CONJUNCTIONS
+    },
+    "en": {
+        "alphabet": "abcdefghijklmnopqrstuvwxyz",
+        "lengths": [0, 30, 170, 200, 160, 110, 85, 75, 55, 40, 28, 17, 10, 6, 3],
+        "function_words": ("the", "of", "to", "a", "in", "is", "it", "you", "that", "was") + EN_CONJUNCTIONS
+    }
+}
+
+# Sözlük büyüklüğü (Benzersiz kelime) ve Zipf üssü
+VOCAB_SIZE = 20000
+ZIPF_S = 1.07
+
+# Konuşma hızı: Kelime süresi = taban + harf başına süre (± %25)
+WORD_BASE_S = 0.06
+WORD_PER_CHAR_S = 0.055
+
+# Noktalama olasılıkları (Kelime başına)
+P_SENTENCE = 0.08   # . ? !
+P_COMMA = 0.09      # ,
+P_COLON = 0.005     # : ;
+P_UNALIGNED = 0.005  # Zamanı olmayan kelime (Sayılar vb.)
+
+# whisperx segment uzunluğu üst sınırı (Kelime)
+SEGMENT_MAX_WORDS = 30
+
+
+def make_vocab(language, size=VOCAB_SIZE, seed=0):
+    """
+    Dilin uzunluk dağılımına uyan sözde kelimeler (En sık olanlar işlev kelimeleri).
+
+    Returns:
+        (kelimeler dizisi, Zipf olasılıkları)
+    """
+    profile = LANGUAGES[language]
+    rng = np.random.default_rng(seed)
+    alphabet = np.array(list(profile["alphabet"]))
+    weights = np.asarray(profile["lengths"], dtype=np.float64)
+    lengths = rng.choice(np.arange(1, len(weights) + 1), size=size, p=weights / weights.sum())
+
+    words = list(dict.fromkeys(profile["function_words"]))
+    seen = set(words)
+    for length in lengths:
+        if len(words) >= size:
+            break
+        w = "".join(rng.choice(alphabet, length))
+        if w not in seen:
+            seen.add(w)
+            words.append(w)
+
+    ranks = np.arange(1, len(words) + 1, dtype=np.float64)
+    probs = ranks ** -ZIPF_S
+    return np.array(words), probs / probs.sum()
+
+
+def make_transcript(words, language="tr", seed=0):
+    """
+    Sentetik hizalanmış sonuç (whisperx align çıktısı biçiminde).
+
+    Args:
+        words: Kelime sayısı
+        language: "tr" veya "en"
+        seed: Rastgelelik tohumu
+
+    Returns:
+        {"segments": [{"start", "end", "text", "words": [...]}, ...], "language": dil}
+    """
+    rng = np.random.default_rng(seed)
+    vocab, probs = make_vocab(language, seed=seed)
+    picks = vocab[rng.choice(len(vocab), size=words, p=probs)]
+
+    lens = np.char.str_len(picks)
+    durs = (WORD_BASE_S + WORD_PER_CHAR_S * lens) * rng.uniform(0.75, 1.25, words)
+
+    punct = rng.random(words)
+    sentence = punct < P_SENTENCE
+    comma = (punct >= P_SENTENCE) & (punct < P_SENTENCE + P_COMMA)
+    colon = (punct >= P_SENTENCE + P_COMMA) & (punct < P_SENTENCE + P_COMMA + P_COLON)
+
+    # Kelimeden sonraki boşluk: Cümle içi kısa, noktalamada duraklama,
+    # arada nefes (>0.5 s) ve nadiren uzun sessizlik
+    gaps = rng.exponential(0.04, words)
+    gaps = np.where(comma | colon, rng.uniform(0.12, 0.35, words), gaps)
+    gaps = np.where(sentence, rng.uniform(0.25, 0.9, words), gaps)
+    breath = rng.random(words)
+    gaps = np.where(breath < 0.02, rng.uniform(0.5, 1.2, words), gaps)
+    gaps = np.where(breath < 0.002, rng.uniform(2.0, 8.0, words), gaps)
+
+    starts = np.concatenate(([0.5], 0.5 + np.cumsum(durs + gaps)[:-1]))
+    ends = starts + durs
+    unaligned = rng.random(words) < P_UNALIGNED
+    scores = rng.uniform(0.4, 1.0, words)
+    marks = np.where(rng.random(words) < 0.8, ".", np.where(rng.random(words) < 0.75, "?", "!"))
+
+    segments = []
+    seg_words = []
+    capital = True
+    for i in range(words):
+        text = str(picks[i])
+        if capital:
+            text = text[:1].upper() + text[1:]
+        capital = bool(sentence[i])
+        if sentence[i]:
+            text += str(marks[i])
+        elif comma[i]:
+            text += ","
+        elif colon[i]:
+            text += ":" if punct[i] < P_SENTENCE + P_COMMA + P_COLON / 2 else ";"
+
+        if unaligned[i]:
+            seg_words.append({"word": text})
+        else:
+            seg_words.append({
+                "word": text,
+                "start": round(float(starts[i]), 3),
+                "end": round(float(ends[i]), 3),
+                "score": round(float(scores[i]), 3)
+            })
+        if sentence[i] or len(seg_words) >= SEGMENT_MAX_WORDS:
+            segments.append(_segment(seg_words))
+            seg_words = []
+    if seg_words:
+        segments.append(_segment(seg_words))
+    return {"segments": segments, "language": language}
+
+
+def _segment(words):
+    timed = [w for w in words if "start" in w]
+    return {
+        "start": timed[0]["start"] if timed else 0.0,
+        "end": timed[-1]["end"] if timed else 0.0,
+        "text": " ".join(w["word"] for w in words),
+        "words": words
+    }
+
+
+def copy_aligned(aligned):
+    """Segment ve kelime dict'lerinin kopyası (Chronos yerinde değiştirir)."""
+    return {
+        **aligned,
+        "segments": [
+            {**s, "words": [dict(w) for w in s.get("words", [])]} for s in aligned["segments"]
+        ]
+    }
+
+
+def make_vad_for(aligned, max_seconds, sr=16000, seed=0):
+    """
+    Transkriptin ilk max_seconds saniyesi için uyumlu ses ve VAD haritası.
+
+    Kelimelerin olduğu yerler konuşma (yüksek olasılık, yüksek genlik),
+    aralar sessizliktir.
+
+    Returns:
+        VadAnalysis (Sabit kalibrasyon)
+    """
+    rng = np.random.default_rng(seed)
+    last = max((w["end"] for s in aligned["segments"] for w in s["words"] if "end" in w), default=1.0)
+    duration = min(float(max_seconds), last + 1.0)
+    n = int(duration * sr)
+    m = -(-n // VAD_HOP)
+
+    speech = np.zeros(m, dtype=bool)
+    for s in aligned["segments"]:
+        for w in s["words"]:
+            if "start" in w and w["start"] < duration:
+                speech[int(w["start"] * sr) // VAD_HOP:int(w["end"] * sr) // VAD_HOP + 1] = True
+
+    probs = np.where(speech, rng.uniform(0.3, 1.0, m), rng.uniform(0.0, 0.12, m)).astype(np.float32)
+    env = np.repeat(np.where(speech, 0.3, 0.003), VAD_HOP)[:n].astype(np.float32)
+    audio = rng.standard_normal(n).astype(np.float32) * env
+    return VadAnalysis(audio, probs, *FIXED_CALIBRATION, sr=sr)
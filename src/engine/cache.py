@@ -0,0 +1,375 @@
+"""
+WHIXPI Pro V1.0 - Aşama Önbelleği (Stage Cache)
+================================================
+Her işlem aşamasının çıktısını (ham Whisper segmentleri, hizalanmış
+segmentler, VAD olasılık haritası) diskte saklar.
+
+Anahtar = ses dosyasının örneklenmiş içerik hash'i (boyut + mtime + eşit
+aralıklı bloklar) + aşama parametreleri.
+Böylece çöken/durdurulan bir toplu iş kaldığı yerden devam eder ve
+sadece formatlama ayarı değişen tekrar çalıştırmalar GPU'ya uğramaz.
+
+Komut satırı:
+    python -m src.engine.cache stats [--dir KLASÖR]
+    python -m src.engine.cache purge [--dir KLASÖR] [--stage AŞAMA]
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+
+import numpy as np
+
+
+# Aşama adları (Klasör isimleri)
+STAGES = ("transcribe", "align", "vad")
+
+# Hash okuma bloğu (1 MB) ve örneklenen blok sayısı (Baş ve son dahil)
+_HASH_CHUNK = 1 << 20
+_SAMPLE_BLOCKS = 8
+
+
+def default_cache_dir():
+    """
+    Varsayılan önbellek klasörü: EXE veya proje kökü yanında "cache/".
+
+    Returns:
+        Klasör yolu (string)
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.getcwd()
+    return os.path.join(base_path, "cache")
+
+
+def sample_hash(path, size):
+    """
+    Dosyanın örneklenmiş BLAKE2b özetini hesaplar (Yol/isimden bağımsız).
+
+    Boyut + baştan sona eşit aralıklı _SAMPLE_BLOCKS adet 1 MB blok okunur;
+    saatlik bir kayıtta da okuma birkaç MB ile sınırlı kalır. Bu boyuttan
+    küçük dosyalar tamamen okunur.
+
+    Args:
+        path: Ses/video dosyası yolu
+        size: Dosya boyutu (bayt)
+
+    Returns:
+        32 karakterlik hex özet
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(size).encode("ascii"))
+    with open(path, "rb") as f:
+        if size <= _HASH_CHUNK * _SAMPLE_BLOCKS:
+            while True:
+                chunk = f.read(_HASH_CHUNK)
+                if not chunk:
+                    break
+                h.update(chunk)
+        else:
+            step = (size - _HASH_CHUNK) / (_SAMPLE_BLOCKS - 1)
+            for i in range(_SAMPLE_BLOCKS):
+                f.seek(int(i * step))
+                h.update(f.read(_HASH_CHUNK))
+    return h.hexdigest()
+
+
+def _json_default(obj):
+    """numpy skalerlerini (np.float32 vb.) ve Word/Segment kayıtlarını JSON'a çevirir."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "item"):
+        return obj.item()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(obj).__name__}")
+
+
+class StageCache:
+    """
+    İçerik adresli, boyut sınırlı disk önbelleği.
+
+    Düzen: <root>/<aşama>/<anahtar[:2]>/<anahtar>.json|.npy
+    Okunan her kayıt "dokunulur" (mtime güncellenir); boyut sınırı aşılınca
+    en uzun süredir kullanılmayan kayıtlar silinir (LRU).
+
+    Toplam boyut ilk yazmada bir kez taranır, sonra yazılanlarla güncellenir;
+    klasör sadece sınır aşıldığında yeniden taranır (Diğer işçi süreçlerinin
+    yazdıkları da o taramada sayılır).
+    """
+
+    def __init__(self, root=None, max_mb=4096):
+        """
+        Args:
+            root: Önbellek klasörü (None = default_cache_dir())
+            max_mb: Toplam boyut sınırı (MB, 0 = sınırsız)
+        """
+        self.root = root or default_cache_dir()
+        self.max_bytes = int(max_mb) * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._hashes = {}
+        self._total = None  # Bilinen toplam boyut (None = henüz taranmadı)
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Kilit pickle'lanamaz (Worker süreçleri spawn ile başlatılır)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # --- ANAHTARLAR ---
+
+    def audio_key(self, path):
+        """
+        Ses dosyasının anahtarı: örneklenmiş içerik hash'i + boyut + mtime.
+
+        Tam içerik okunmaz (GPU thread'ini bekletmesin); mtime sayesinde
+        örneklenmeyen bir bölgesi düzenlenen dosya da yeni anahtar alır.
+        Süreç içinde (yol, boyut, mtime) ile önbelleklenir.
+        """
+        st = os.stat(path)
+        sig = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        with self._lock:
+            if sig in self._hashes:
+                return self._hashes[sig]
+        digest = hashlib.blake2b(
+            f"{sample_hash(path, st.st_size)}:{st.st_mtime_ns}".encode("ascii"), digest_size=16
+        ).hexdigest()
+        with self._lock:
+            self._hashes[sig] = digest
+        return digest
+
+    @staticmethod
+    def make_key(stage, audio_key, **params):
+        """
+        Aşama anahtarı üretir.
+
+        Args:
+            stage: Aşama adı ("transcribe", "align", "vad")
+            audio_key: audio_key() sonucu
+            **params: Çıktıyı etkileyen tüm parametreler (model, beam, dil...)
+
+        Returns:
+            Hex anahtar (string)
+        """
+        payload = json.dumps(
+            {"stage": stage, "audio": audio_key, "params": params},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    # --- OKUMA / YAZMA ---
+
+    def _path(self, stage, key, ext):
+        return os.path.join(self.root, stage, key[:2], key + ext)
+
+    def _touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _write_atomic(self, path, writer):
+        """Yarım kalmış dosya bırakmamak için geçici dosyaya yazıp taşır."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        try:
+            with open(tmp, "wb") as f:
+                writer(f)
+                new_size = f.tell()
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self._account(new_size - old_size)
+
+    def _account(self, delta):
+        """Yazılan baytları toplam boyuta ekler; sınır aşıldıysa LRU temizliği yapar."""
+        if self.max_bytes <= 0:
+            return
+        with self._lock:
+            if self._total is not None:
+                self._total += delta
+                if self._total <= self.max_bytes:
+                    return
+        self.enforce_limit()
+
+    def get_json(self, stage, key):
+        """Kayıtlı JSON çıktısını döndürür (Yoksa None)."""
+        path = self._path(stage, key, ".json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self._touch(path)
+        self.hits += 1
+        return data
+
+    def put_json(self, stage, key, data):
+        """JSON çıktısını kaydeder."""
+        payload = json.dumps(data, ensure_ascii=False, default=_json_default).encode("utf-8")
+        self._write_atomic(self._path(stage, key, ".json"), lambda f: f.write(payload))
+
+    def get_array(self, stage, key, mmap=False):
+        """
+        Kayıtlı numpy dizisini döndürür (Yoksa None).
+
+        Args:
+            mmap: True ise dosya belleğe kopyalanmaz, salt okunur eşlenir
+        """
+        path = self._path(stage, key, ".npy")
+        try:
+            arr = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self._touch(path)
+        self.hits += 1
+        return arr
+
+    def put_array(self, stage, key, arr):
+        """Numpy dizisini .npy olarak kaydeder."""
+        self._write_atomic(
+            self._path(stage, key, ".npy"),
+            lambda f: np.save(f, np.asarray(arr), allow_pickle=False)
+        )
+
+    # --- BAKIM ---
+
+    def _entries(self, stage=None):
+        """(yol, boyut, mtime) listesi."""
+        stages = [stage] if stage else STAGES
+        out = []
+        for st in stages:
+            base = os.path.join(self.root, st)
+            if not os.path.isdir(base):
+                continue
+            for dirpath, _, files in os.walk(base):
+                for name in files:
+                    if name.endswith(".tmp"):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    try:
+                        info = os.stat(path)
+                    except OSError:
+                        continue
+                    out.append((path, info.st_size, info.st_mtime))
+        return out
+
+    def enforce_limit(self):
+        """
+        Boyut sınırı aşıldıysa en eski kayıtları siler (LRU).
+
+        Returns:
+            Silinen kayıt sayısı
+        """
+        if self.max_bytes <= 0:
+            return 0
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            with self._lock:
+                self._total = total
+            return 0
+
+        removed = 0
+        for path, size, _ in sorted(entries, key=lambda e: e[2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        with self._lock:
+            self._total = total
+        return removed
+
+    def stats(self):
+        """
+        Aşama bazında kayıt sayısı ve boyut özeti.
+
+        Returns:
+            {"aşama": {"count": int, "bytes": int}, ..., "total_bytes": int}
+        """
+        out = {}
+        total = 0
+        for stage in STAGES:
+            entries = self._entries(stage)
+            size = sum(s for _, s, _ in entries)
+            out[stage] = {"count": len(entries), "bytes": size}
+            total += size
+        out["total_bytes"] = total
+        return out
+
+    def purge(self, stage=None):
+        """
+        Önbelleği (veya tek bir aşamayı) temizler.
+
+        Returns:
+            Silinen kayıt sayısı
+        """
+        removed = 0
+        for path, _, _ in self._entries(stage):
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        with self._lock:
+            self._total = None
+        return removed
+
+
+# =============================================================================
+# KOMUT SATIRI
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m src.engine.cache",
+        description="WHIXPI aşama önbelleğini incele veya temizle."
+    )
+    parser.add_argument("command", choices=("stats", "purge"))
+    parser.add_argument("--dir", default=None, help="Önbellek klasörü (varsayılan: ./cache)")
+    parser.add_argument("--stage", choices=STAGES, default=None, help="Sadece bu aşama")
+    args = parser.parse_args(argv)
+
+    cache = StageCache(args.dir, max_mb=0)
+
+    if args.command == "stats":
+        info = cache.stats()
+        print(f"📁 {cache.root}")
+        for stage in STAGES:
+            if args.stage and stage != args.stage:
+                continue
+            s = info[stage]
+            print(f"   {stage:<11} {s['count']:>6} kayıt  {s['bytes'] / 1048576:>9.1f} MB")
+        print(f"   {'TOPLAM':<11} {'':>6}        {info['total_bytes'] / 1048576:>9.1f} MB")
+    else:
+        t0 = time.time()
+        removed = cache.purge(args.stage)
+        print(f"🧹 {removed} kayıt silindi ({time.time() - t0:.1f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
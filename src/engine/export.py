@@ -0,0 +1,193 @@
+"""
+WHIXPI Pro V1.0 - Çıktı Yazıcı
+==============================
+Sonuç dosyalarını (SRT, TXT, JSON) üretir ve ham JSON çıktılarından
+GPU'suz "Yeniden Formatla" modunu çalıştırır.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from src.engine.logic import reformat_aligned, format_timestamp
+from src.engine.transcript import json_default
+from src.utils.helpers import get_unique_path
+
+
+# Format anahtarı -> dosya uzantısı
+FORMAT_EXT = {
+    "sentence": "srt",
+    "word": "srt",
+    "json": "json",
+    "txt_flat": "txt",
+    "txt_time": "txt"
+}
+
+# Ham JSON dosya adlarından ayıklanacak bilinen sonekler (tr/en)
+RAW_SUFFIXES = ("_veri", "_data", "_json")
+
+
+# =============================================================================
+# YAZMA
+# =============================================================================
+
+def write_results(res, out_dir, formats, names=None, suffixes=None, overwrite=False):
+    """
+    Bir dosyanın sonuçlarını seçili formatlarda diske yazar.
+
+    Args:
+        res: Worker sonucu {"base_name", "segments_s", "segments_w", "raw"}
+        out_dir: Çıktı klasörü
+        formats: {"sentence": bool, "word": bool, "json": bool, ...}
+        names: Özel dosya adları {format: isim} (Uzantısız)
+        suffixes: Format sonekleri {format: "_cumle"} (Yoksa "_format")
+        overwrite: True ise mevcut dosyaların üzerine yazılır
+
+    Returns:
+        Yazılan dosya yollarının listesi
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    names = names or {}
+    suffixes = suffixes or {}
+    f_t = format_timestamp
+
+    written = []
+    for k, ext in FORMAT_EXT.items():
+        if not formats.get(k):
+            continue
+
+        name = names.get(k, f"{res['base_name']}{suffixes.get(k, f'_{k}')}")
+        path = out / f"{name}.{ext}"
+        if not overwrite:
+            path = get_unique_path(path)
+
+        with open(path, "w", encoding="utf-8", newline="\r\n") as f:
+            if k == "sentence":
+                for i, s in enumerate(res['segments_s'], 1):
+                    f.write(f"{i}\n{f_t(s['start'])} --> {f_t(s['end'])}\n{s['text']}\n\n")
+
+            elif k == "word":
+                for i, w in enumerate(res['segments_w'], 1):
+                    word_text = w.get('word', w.get('text', ''))
+                    f.write(f"{i}\n{f_t(w['start'])} --> {f_t(w['end'])}\n{word_text}\n\n")
+
+            elif k == "json":
+                json.dump(res['raw'], f, ensure_ascii=False, indent=2, default=json_default)
+
+            elif k == "txt_flat":
+                f.write(" ".join([s["text"].strip() for s in res['segments_s']]))
+
+            elif k == "txt_time":
+                for s in res['segments_s']:
+                    f.write(f"[{f_t(s['start'])}] {s['text'].strip()} [{f_t(s['end'])}]\n")
+
+        written.append(str(path))
+
+    return written
+
+
+def partial_srt_path(out_dir, base_name):
+    """Akış sırasında büyüyen ara SRT dosyasının yolu (video.partial.srt)."""
+    return Path(out_dir) / f"{base_name}.partial.srt"
+
+
+def append_srt(path, segments, start_index=1):
+    """
+    SRT bloklarını dosyanın sonuna ekler (Akış modu).
+
+    Her çağrıda dosya kapatılır; süreç çökse bile o ana kadar yazılanlar kalır.
+
+    Args:
+        path: Hedef .srt yolu
+        segments: [{"start", "end", "text"}, ...]
+        start_index: İlk bloğun SRT numarası
+
+    Returns:
+        Sonraki blok numarası
+    """
+    f_t = format_timestamp
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8", newline="\r\n") as f:
+        for i, s in enumerate(segments, start_index):
+            f.write(f"{i}\n{f_t(s['start'])} --> {f_t(s['end'])}\n{s['text']}\n\n")
+    return start_index + len(segments)
+
+
+# =============================================================================
+# YENİDEN FORMATLA (Re-Format)
+# =============================================================================
+
+def _base_name(json_path, suffixes):
+    """Ham JSON adından kaynak dosyanın adını çıkarır (video_veri.json -> video)."""
+    stem = Path(json_path).stem
+    for suffix in suffixes:
+        if suffix and stem.endswith(suffix):
+            return stem[:-len(suffix)]
+    return stem
+
+
+def load_raw_results(path, suffixes=RAW_SUFFIXES):
+    """
+    Ham (aligned) JSON çıktılarını yükler.
+
+    Args:
+        path: Tek bir .json dosyası veya içinde .json bulunan klasör
+        suffixes: Dosya adından ayıklanacak sonekler
+
+    Returns:
+        [{"base_name", "raw", "source"}, ...] (Hizalama içermeyen JSON'lar atlanır)
+    """
+    p = Path(path)
+    files = sorted(p.glob("*.json")) if p.is_dir() else [p]
+
+    loaded = []
+    for fp in files:
+        try:
+            with open(fp, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(raw, dict) or not isinstance(raw.get("segments"), list):
+            continue
+        loaded.append({
+            "base_name": _base_name(fp, suffixes),
+            "raw": raw,
+            "source": str(fp)
+        })
+    return loaded
+
+
+def reformat_results(paths, config, bridge_ms, word_bridge_ms, suffixes=RAW_SUFFIXES):
+    """
+    Ham JSON'lardan sadece Chronos + Miller adımlarını yeniden çalıştırır.
+
+    Whisper, Wav2Vec2 ve Silero'ya dokunmaz; GPU worker'ı başlatılmaz.
+
+    Args:
+        paths: .json dosyaları ve/veya klasörler
+        config: Ayarlar dict'i (max_words, max_lines, base_limit)
+        bridge_ms: Cümle köprüleme eşiği (ms)
+        word_bridge_ms: Kelime köprüleme eşiği (ms)
+        suffixes: Ham JSON sonekleri
+
+    Yields:
+        (sonuç dict'i, süre saniye) - write_results() ile yazılmaya hazır
+    """
+    if isinstance(paths, (str, Path)):
+        paths = [paths]
+
+    for path in paths:
+        for item in load_raw_results(path, suffixes):
+            t_start = time.perf_counter()
+            raw = item["raw"]
+            segments_s, segments_w = reformat_aligned(raw, config, bridge_ms, word_bridge_ms)
+            res = {
+                "base_name": item["base_name"],
+                "segments_s": segments_s,
+                "segments_w": segments_w,
+                "raw": raw,
+                "source": item["source"]
+            }
+            yield res, time.perf_counter() - t_start
@@ -5,18 +5,176 @@ Miller Hybrid Splitter ve Chronos Timing algoritmaları.
 Bu modül, AI çıktılarını profesyonel altyazı formatına dönüştürür.
 """
 
-import textwrap
+import operator
+from collections import deque
+from itertools import repeat
+
+import numpy as np
+
+from src.engine.rules import (
+    BLOCK_END, CLAUSE_END, CONJUNCTION, DEFAULT_PACK, SENTENCE_END, get_rule_pack
+)
+from src.engine.transcript import Record, Segment, SegmentList, WordList
 
 
 # =============================================================================
 # CHRONOS TIMING ENGINE (v26.5)
 # =============================================================================
 
+class WordTable:
+    """
+    Sütunlu kelime/segment zamanlaması: start ve end float64 dizileri.
+
+    Metin ve diğer alanlar kaynak dict'lerde veya Word/Segment kayıtlarında
+    kalır (items); Chronos adımları
+    sadece sütunlar üzerinde vektörel çalışır. write_back() değişen zamanları
+    kaynak dict'lere geri yazar, to_dicts() yeni dict listesi üretir.
+
+    Eksik veya sayısal olmayan zamanlar NaN olur; NaN içeren karşılaştırmalar
+    yanlış döndüğü için bu kayıtlar eski döngülerdeki try/except gibi atlanır.
+
+    seg_last: Her kaydın kendi segmentinin son kelimesi olup olmadığı
+    (from_segments ile kurulursa; segmentler arası boşluklar dağıtılmaz).
+    """
+
+    def __init__(self, start, end, items=None, seg_last=None):
+        self.start = np.asarray(start, dtype=np.float64)
+        self.end = np.asarray(end, dtype=np.float64)
+        self.items = items
+        self.seg_last = seg_last
+        self._start0 = self.start.copy()
+        self._end0 = self.end.copy()
+        # Kayıtların tamamı Word/Segment ise zamanlar slot'lardan okunur/yazılır
+        self._slotted = bool(items) and all(isinstance(d, Record) for d in items)
+
+    def __len__(self):
+        return len(self.start)
+
+    @classmethod
+    def from_dicts(cls, items, seg_last=None):
+        """Dict listesinden tablo kurar (Dict'ler kopyalanmaz)."""
+        items = items if isinstance(items, list) else list(items)
+        slotted = bool(items) and isinstance(items[0], Record)
+        return cls(
+            _time_column(items, "start", slotted), _time_column(items, "end", slotted), items, seg_last
+        )
+
+    @classmethod
+    def from_segments(cls, segments):
+        """Segmentlerin kelimelerinden (segment sırasıyla) tek tablo kurar."""
+        items = []
+        last = []
+        for seg in segments:
+            words = seg.get("words") or []
+            items.extend(words)
+            last.extend([False] * (len(words) - 1) + [True] if words else [])
+        return cls.from_dicts(items, np.array(last, dtype=bool))
+
+    @property
+    def text(self):
+        """Kelime/segment metinleri (Kaynak dict'lerden)."""
+        return [d.get("word", d.get("text", "")) for d in self.items or []]
+
+    def write_back(self):
+        """
+        Değişen zamanları kaynak dict'lere yazar (Değişmeyenlere dokunulmaz).
+
+        Returns:
+            Kaynak dict listesi
+        """
+        for key, col, col0 in (("start", self.start, self._start0), ("end", self.end, self._end0)):
+            # Eksik (NaN) zamanlar hiçbir adımda değişmez; dict'e yazılmaz
+            changed = np.flatnonzero((col != col0) & ~np.isnan(col0))
+            if changed.size:
+                if changed.size == len(self.items):
+                    targets = self.items
+                else:
+                    targets = [self.items[i] for i in changed.tolist()]
+                # map(setitem) Python döngüsünden ~%30 hızlı (Milyonlarca kelimede)
+                setter = setattr if self._slotted else operator.setitem
+                deque(map(setter, targets, repeat(key), col[changed].tolist()), maxlen=0)
+                col0[changed] = col[changed]
+        return self.items
+
+    def to_dicts(self):
+        """Güncel zamanlarla yeni dict listesi (Kaynak alanlar kopyalanır)."""
+        return [
+            {**d, "start": s, "end": e}
+            for d, s, e in zip(self.items, self.start.tolist(), self.end.tolist())
+        ]
+
+
+def _time_column(items, key, slotted=False):
+    """Dict'lerden float64 zaman sütunu (Eksik/sayısal olmayan -> NaN)."""
+    # Kayıtlarda slot okuma (attrgetter) C hızında; dict arayüzü Python'da kalır
+    getter = operator.attrgetter(key) if slotted else operator.itemgetter(key)
+    try:
+        return np.fromiter(map(getter, items), dtype=np.float64, count=len(items))
+    except (KeyError, AttributeError, TypeError, ValueError):
+        col = np.full(len(items), np.nan)
+        for i, d in enumerate(items):
+            v = d.get(key)
+            if isinstance(v, (int, float)):
+                col[i] = v
+        return col
+
+
+def bridge_table(table, threshold_sec, min_dur=0.2):
+    """
+    Chronos Core (Vektörel): Boşluk köprüleme, örtüşme düzeltme, minimum süre.
+
+    Sadece end sütunu değişir; her kaydın yeni bitişi kendi bitişi ve bir
+    sonrakinin (değişmeyen) başlangıcıyla belirlendiği için sıralı döngüyle
+    bire bir aynı sonucu verir.
+    """
+    start, end = table.start, table.end
+    if len(start) == 0:
+        return table
+
+    nxt = start[1:]
+    head = end[:-1]
+    gap = nxt - head
+    
+    # 1. Zero-Gap Bridge + 2. Overlap Fixer
+    head = np.where(gap <= threshold_sec, nxt, head)
+    head = np.where(head > nxt, nxt, head)
+    end[:-1] = head
+
+    # 3. Minimum Duration Guard (Son segment dahil)
+    short = end - start < min_dur
+    end[short] = start[short] + min_dur
+    return table
+
+
+def distribute_gaps_table(table):
+    """
+    Dynamic Gap Distribution (Vektörel): 0-0.3 s boşlukların %40'ı (en fazla
+    0.08 s) önceki kelimenin bitişine, %40'ı sonrakinin başlangıcına verilir.
+
+    Her boşluk iki kelimenin orijinal zamanlarından hesaplanır; segment
+    sınırları (seg_last) aşılmaz.
+    """
+    start, end = table.start, table.end
+    if len(start) < 2:
+        return table
+
+    gap = start[1:] - end[:-1]
+    ok = (gap > 0) & (gap < 0.3)
+    if table.seg_last is not None:
+        ok &= ~table.seg_last[:-1]
+    idx = np.flatnonzero(ok)
+    dist = np.minimum(gap[idx] * 0.4, 0.08)
+    end[idx] += dist
+    start[idx + 1] -= dist
+    return table
+
+
 def chronos_seamless_core(segments, threshold_sec, min_dur=0.2):
     """
     v26.5 Chronos Core: Seamless transition & duration guard.
     
     Segmentler arası boşlukları köprüler ve minimum süreyi garantiler.
+    (WordTable üzerinde vektörel; değişen bitişler dict'lere geri yazılır.)
     
     Args:
         segments: Segment listesi [{"start": float, "end": float, ...}, ...]
@@ -29,25 +187,9 @@ def chronos_seamless_core(segments, threshold_sec, min_dur=0.2):
     if not segments:
         return segments
     
-    for i in range(len(segments) - 1):
-        gap = segments[i+1]["start"] - segments[i]["end"]
-        
-        # 1. Zero-Gap Bridge: Küçük boşlukları kapat
-        if gap <= threshold_sec:
-            segments[i]["end"] = segments[i+1]["start"]
-        
-        # 2. Overlap Fixer: Örtüşmeleri düzelt
-        if segments[i]["end"] > segments[i+1]["start"]:
-            segments[i]["end"] = segments[i+1]["start"]
-
-        # 3. Minimum Duration Guard: Minimum süreyi garantile
-        if segments[i]["end"] - segments[i]["start"] < min_dur:
-            segments[i]["end"] = segments[i]["start"] + min_dur
-    
-    # Son segment için de minimum süre kontrolü
-    if segments[-1]["end"] - segments[-1]["start"] < min_dur:
-        segments[-1]["end"] = segments[-1]["start"] + min_dur
-    
+    table = WordTable.from_dicts(segments)
+    bridge_table(table, threshold_sec, min_dur)
+    table.write_back()
     return segments
 
 
@@ -64,165 +206,268 @@ def waveform_finetune_chronos(segments):
     Returns:
         Rafine edilmiş segment listesi
     """
-    refined_segments = []
+    table = WordTable.from_segments(segments)
+    distribute_gaps_table(table)
+    table.write_back()
     
+    # Segment sınırlarını rafine edilmiş kelimelere göre güncelle
+    # (Zamanı olmayan kelimeler, örn. hizalanamayan sayılar, atlanır)
     for seg in segments:
-        if "words" not in seg or not seg["words"]:
-            refined_segments.append(seg)
-            continue
-        
-        words = seg["words"]
-        
-        for i in range(len(words) - 1):
-            try:
-                w1, w2 = words[i], words[i+1]
-                gap = w2["start"] - w1["end"]
-                
-                if 0 < gap < 0.3:
-                    # Dinamik dağıtım: %40-40 paylaştır, %20 emniyet
-                    dist = min(gap * 0.4, 0.08)
-                    w1["end"] += dist
-                    w2["start"] -= dist
-            except:
-                pass
-        
-        # Segment sınırlarını rafine edilmiş kelimelere göre güncelle
+        words = seg.get("words")
         if words:
-            seg["start"] = words[0]["start"]
-            seg["end"] = words[-1]["end"]
-        
-        refined_segments.append(seg)
+            first = words[0] if "start" in words[0] else next((w for w in words if "start" in w), None)
+            last = words[-1] if "end" in words[-1] else next((w for w in reversed(words) if "end" in w), None)
+            if first is not None:
+                seg["start"] = first["start"]
+            if last is not None:
+                seg["end"] = last["end"]
     
-    return refined_segments
+    # Yeni liste (Eski davranış); SegmentList ise tipi ve word_segments paylaşımı korunur
+    if isinstance(segments, SegmentList):
+        return SegmentList(segments, segments.shared_words)
+    return list(segments)
 
 
 # =============================================================================
 # MILLER HYBRID SPLITTER (v26)
 # =============================================================================
 
-def miller_hybrid_split(result, config):
+def _safe_int(val, default=0):
+    try:
+        return int(str(val).strip()) if val else default
+    except:
+        return default
+
+
+def miller_limits(config):
     """
-    v26 Miller Hybrid Architecture: Absolute Symmetry & Rhythmic Logic.
+    Ayarlardan Miller limitlerini okur.
+
+    Returns:
+        (max_words, max_lines, base_limit) tuple'ı
+    """
+    mw = _safe_int(config.get("max_words"), 0)
+    ml = _safe_int(config.get("max_lines"), 0)
+    base_l = _safe_int(config.get("base_limit"), 75)
+    return mw, ml, base_l
+
+
+# Satır kırma cezaları
+# Son satırda tek kelime kalması: base_limit² oranında (Dengesizlik maliyeti satır uzunluğunun karesi)
+DANGLE_PENALTY = 0.25
+# Satırın bağlaçla bitmesi: Bir satırın bu kadar karakter taşmasına eşdeğer (Aşım
+# önceliğinde sayılır). Dengesizlik cezası bağlacı aşağı atmaya yetmez; asıl engel,
+# atılan bağlacın alt satırı taşırmasıdır. Eski düzeltme geçişi her koşulda atardı.
+CONJUNCTION_OVERFLOW = 6
+
+
+def _line_breaks(lengths, conj, ml, base_l):
+    """
+    Optimal satır kırılımları (Dinamik programlama, açgözlü yerleşimin aşımıyla budanmış).
     
-    AI çıktısını profesyonel, dengeli altyazı segmentlerine böler.
+    Öncelik sırası: 1) base_limit aşımı (aşan karakterlerin kareler toplamı;
+    bağlaçla biten her satır CONJUNCTION_OVERFLOW karakterlik aşım sayılır),
+    2) satır sayısı (en az), 3) satır uzunluklarının kareler toplamı + tek
+    kelimelik son satır cezası.
+    Satır sayısı sabitken kareler toplamını küçültmek varyansı küçültmekle
+    aynıdır (Toplam uzunluk sabit).
     
     Args:
-        result: WhisperX aligned sonucu {"segments": [...]}
-        config: Ayarlar dict'i {
-            "max_words": int,      # Segment başına max kelime (0 = sınırsız)
-            "max_lines": int,      # Segment başına max satır (0 = sınırsız)
-            "base_limit": int      # Satır başına max karakter
-        }
+        lengths: Kelime uzunlukları tuple'ı
+        conj: Kelimenin bağlaç olup olmadığı (Doğruluk değeri tuple'ı)
+        ml: Maksimum satır sayısı (>= 1)
+        base_l: Satır başına maksimum karakter
     
     Returns:
-        Formatlanmış segment listesi [{"start", "end", "text"}, ...]
+        Satır başlangıç indeksleri tuple'ı (İlki 0)
     """
+    n = len(lengths)
+    pre = [0]
+    for length in lengths:
+        pre.append(pre[-1] + length)
     
-    def safe_int(val, default=0):
-        try:
-            return int(str(val).strip()) if val else default
-        except:
-            return default
+    limit2 = base_l * base_l
+    dangle = DANGLE_PENALTY * limit2
+    conj_over = CONJUNCTION_OVERFLOW * CONJUNCTION_OVERFLOW
     
-    mw = safe_int(config.get("max_words"), 0)
-    ml = safe_int(config.get("max_lines"), 0)
-    base_l = safe_int(config.get("base_limit"), 75)
+    # Üst sınır: Açgözlü yerleşimin (satırı base_limit'e kadar doldur) aşımı.
+    # Optimum bundan kötü olamaz ve aşım yol boyunca sadece artar; sınırı
+    # geçen durumlar ve adaylar elenir (Sonuç değişmez). Metin sığıyorsa
+    # satırlar en fazla base_limit + CONJUNCTION_OVERFLOW kadar uzar.
+    bound = 0
+    lines = 1
+    width = lengths[0]
+    for t in range(1, n):
+        if lines < ml and width + 1 + lengths[t] > base_l:
+            lo = width - base_l
+            bound += (lo * lo if lo > 0 else 0) + (conj_over if conj[t - 1] else 0)
+            lines += 1
+            width = lengths[t]
+        else:
+            width += 1 + lengths[t]
+    lo = width - base_l
+    bound += lo * lo if lo > 0 else 0
     
-    # Segment kapasitesi hesapla
-    seg_capacity = (base_l * ml) if ml > 0 else 9999
+    # overs[k][j], costs[k][j], backs[k][j]: İlk j kelimeyi k ara satıra (son
+    # satır hariç) dizmenin aşımı, maliyeti ve önceki kırılımı (Paralel
+    # listeler); overs None = ulaşılamaz veya sınırı aşıyor
+    k_max = min(ml, n)
+    overs = [[0] + [None] * n]
+    costs = [[0] * (n + 1)]
+    backs = [[-1] * (n + 1)]
+    # reaches[k]: Ulaşılabilir kırılımlar (Azalan sırada)
+    reaches = [[0]]
+    for k in range(1, k_max):
+        p_over = overs[-1]
+        p_cost = costs[-1]
+        o_row = [None] * (n + 1)
+        c_row = [0] * (n + 1)
+        b_row = [-1] * (n + 1)
+        # Ulaşılabilir her kırılımdan satırı ileri doğru uzat (Azalan sırada;
+        # eşitlikte büyük kırılım kalır). Satır uzadıkça aşım artar; sınırı
+        # geçince daha uzun satırlar denenmez
+        for i in reaches[-1]:
+            p_o = p_over[i]
+            p_c = p_cost[i]
+            base = pre[i] + i + 1
+            for j in range(i + 1, n):
+                width = pre[j] + j - base
+                lo = width - base_l
+                if lo > 0:
+                    over = p_o + lo * lo
+                    if over > bound:
+                        break
+                else:
+                    over = p_o
+                cost = p_c + width * width
+                cur = o_row[j]
+                if cur is None or over < cur or (over == cur and cost < c_row[j]):
+                    o_row[j] = over
+                    c_row[j] = cost
+                    b_row[j] = i
+        
+        # Bağlaçla biten satır cezası (Tüm adaylar için aynı, seçimden sonra).
+        # Kalan kelimeler kalan m satıra sınır içinde sığamıyorsa durum elenir:
+        # Aşım dışbükey olduğundan m satırın aşımı en az m * (ort. aşım)²
+        m = ml - k
+        reach = []
+        for j in range(n - 1, k - 1, -1):
+            over = o_row[j]
+            if over is None:
+                continue
+            if conj[j - 1]:
+                over += conj_over
+                o_row[j] = over
+            ex = pre[n] - pre[j] + (n - j) - m * (base_l + 1)
+            if over > bound or (ex > 0 and over * m + ex * ex > bound * m):
+                o_row[j] = None
+                continue
+            reach.append(j)
+        if not reach:
+            break
+        overs.append(o_row)
+        costs.append(c_row)
+        backs.append(b_row)
+        reaches.append(reach)
     
-    # Tüm kelimeleri düz listeye çıkar
-    words = []
-    for s in result.get("segments", []):
-        for w in s.get("words", []):
-            if "start" in w:
-                words.append(w)
+    # Son satır: Tüm satır sayıları arasında (aşım, satır sayısı, maliyet) ile seçim
+    choice = None
+    for k in range(1, len(overs) + 1):
+        p_over = overs[k - 1]
+        p_cost = costs[k - 1]
+        for i in reaches[k - 1]:
+            over = p_over[i]
+            width = pre[n] - pre[i] + (n - i - 1)
+            lo = width - base_l
+            lo = lo * lo if lo > 0 else 0
+            if lo > bound or (choice is not None and lo > choice[0]):
+                break
+            cost = p_cost[i] + width * width + (dangle if k > 1 and n - i == 1 else 0)
+            key = (over + lo, k, cost, i)
+            if choice is None or key < choice:
+                choice = key
     
-    # Eğer kelime yoksa veya sınır yoksa, orijinal segmentleri döndür
-    if not words or (mw == 0 and ml == 0 and base_l == 0):
-        return [
-            {"start": s["start"], "end": s["end"], "text": s["text"].strip()} 
-            for s in result.get("segments", [])
-        ]
+    # Kırılımları geri izle
+    _, k, _, i = choice
+    starts = [i]
+    for kk in range(k - 1, 0, -1):
+        i = backs[kk][i]
+        starts.append(i)
+    return tuple(reversed(starts))
+
+
+def _balance_lines(txt_content, ml, base_l, rules=DEFAULT_PACK):
+    """
+    Blok metnini satırlara böler (Miller Balancing, optimal kırılım).
+    
+    Satır sayısı en fazla ml, satır uzunluğu mümkünse en fazla base_l;
+    bu sınırlar içinde satır uzunlukları dengelenir, son satırda tek kelime
+    kalması ve satırın bağlaçla bitmesi (rules paketine göre) cezalandırılır.
+    Tek kelime hiçbir zaman bölünmez.
+    """
+    if ml < 1 or base_l < 1:
+        return txt_content
+    
+    tokens = txt_content.split()
+    line = " ".join(tokens)
+    # Tek satıra sığan blok: Aşımsız ve en az satırlı, DP'nin de seçeceği yerleşim
+    if len(tokens) < 2 or len(line) <= base_l:
+        return line
+    
+    flags = rules.flags
+    starts = _line_breaks(
+        tuple(map(len, tokens)), tuple(flags(t) & CONJUNCTION for t in tokens), ml, base_l
+    )
+    ends = starts[1:] + (len(tokens),)
+    return "\n".join(" ".join(tokens[a:b]) for a, b in zip(starts, ends))
+
+
+def iter_miller_blocks(words, config):
+    """
+    Akış halinde Miller bölücü: Kelimeleri okudukça altyazı bloklarını üretir.
     
-    # Bağlaçlar - satır başına düşmemeleri gerekir
-    conjunctions = [
-        "ve", "ama", "fakat", "çünkü", "veya", "lakin", "ancak",
-        "and", "but", "or", "so", "because", "while"
-    ]
+    Grup uzunluğu sayaçlarla tutulur (Kelime başına O(1)); kelime listesi ve
+    blok listesi bellekte biriktirilmez. Bir blok, sonraki bloğun başlangıcı
+    görülünce verilir: Segment geçişi düzeltmesi (< 0.2 s boşlukta bitişi
+    uzatma) bir blok ileriye bakar.
+    
+    Args:
+        words: Kelime dict'leri üreten herhangi bir iterable ("start" içermeyenler atlanır)
+        config: Ayarlar dict'i (max_words, max_lines, base_limit, language)
+    
+    Yields:
+        Segment blokları (start, end, text; miller_hybrid_split ile bire bir aynı)
+    """
+    mw, ml, base_l = miller_limits(config)
+    rules = get_rule_pack(config.get("language"))
+    
+    # Segment kapasitesi hesapla
+    seg_capacity = (base_l * ml) if ml > 0 else 9999
     
-    new_segs = []
     group = []
+    # Gruptaki kelimelerin karakter toplamı (Boşluklar hariç)
+    group_chars = 0
+    # Gruptaki son kelimenin bayrakları
+    last_flags = 0
+    pending = None
     
-    def commit_group(grp):
+    def make_block(grp):
         """Kelime grubunu segment olarak tamamla."""
-        if not grp:
-            return
-        
         txt_content = " ".join([x.get("word", "") for x in grp]).strip()
-        
-        # --- MILLER BALANCING (v28 - Force Box Logic) ---
-        if ml > 1:
-            total_chars = len(txt_content)
-            
-            # İdeal satır sayısını belirle (Simetri için)
-            target_lines = max(1, int(total_chars / base_l) + (1 if total_chars % base_l > (base_l * 0.1) else 0))
-            target_lines = min(target_lines, ml)
-            
-            # Hedef genişlik: Metni mevcut satır sayısına bölecek en tatlı genişlik
-            target_w = max(15, int(total_chars / target_lines))
-            
-            # 1. İlk Kesim (Tentative Wrap)
-            lines = textwrap.wrap(txt_content, width=target_w + 5) # Esnek tolerans
-            
-            # 2. Hard Limit Enforcement (Duvar Kontrolü)
-            # Eğer satır sayısı limiti aştıysa, alttan yukarı doğru birleştir.
-            while len(lines) > ml:
-                last = lines.pop()
-                lines[-1] += " " + last
-            
-            # 3. Estetik Rötuşlar (Sadece çok satırlıysa)
-            if len(lines) > 1:
-                # A) Anti-Dangle (Tek kelime kalmasın)
-                if len(lines[-1].split()) == 1:
-                    prev_words = lines[-2].split()
-                    if len(prev_words) > 1:
-                        val = prev_words.pop()
-                        # Eğer çok uzun bir kelime değilse aşağı at
-                        if len(val) < 15:
-                            lines[-1] = val + " " + lines[-1]
-                            lines[-2] = " ".join(prev_words)
-                
-                # B) Bağlaç Koruması (Bağlaç satır sonunda kalmasın)
-                for j in range(len(lines)-1):
-                    l_w = lines[j].split()
-                    if l_w:
-                        last_word = l_w[-1]
-                        clean_last = last_word.lower().strip(".,?!:;")
-                        if clean_last in conjunctions:
-                            # Bağlacı aşağı at
-                            lines[j] = " ".join(l_w[:-1])
-                            lines[j+1] = last_word + " " + lines[j+1]
-            
-            txt_content = "\n".join(lines)
-        
-        elif ml == 1:
-            # Tek satır disiplini
-            txt_content = "\n".join(textwrap.wrap(txt_content, width=base_l))
-        
-        new_segs.append({
-            "start": grp[0]["start"], 
-            "end": grp[-1]["end"], 
-            "text": txt_content
-        })
-    
-    # Kelimeleri segmentlere böl
-    for w in words:
+        return Segment(
+            start=grp[0]["start"], 
+            end=grp[-1]["end"], 
+            text=_balance_lines(txt_content, ml, base_l, rules)
+        )
+    
+    # Kelimeleri segmentlere böl (Bayraklar ön geçişte hesaplanır)
+    for w, w_text, w_flags in rules.annotate(words):
         if not group:
             group.append(w)
+            group_chars = len(w_text)
+            last_flags = w_flags
             continue
         
-        last_text = group[-1].get("word", "").lower().strip(".,?!:;")
         split = False
         
         # 1. Sert Limit Check: Kelime Sayısı
@@ -231,17 +476,17 @@ def miller_hybrid_split(result, config):
         
         # 2. Sert Limit Check: Karakter Kapasitesi
         if not split and base_l > 0:
-            current_len = sum(len(x.get("word", "")) for x in group) + len(group)
+            current_len = group_chars + len(group)
             
             # v26.1: Absolute Boundary Enforcement
-            if current_len + len(w.get("word", "")) > seg_capacity:
+            if current_len + len(w_text) > seg_capacity:
                 split = True
             
             # 3. Disiplinli Kesim: Noktalama & Bağlaç
             elif current_len >= (base_l * 0.7):
-                if any(p in group[-1].get("word", "") for p in [".", "?", "!", ":"]):
+                if last_flags & BLOCK_END:
                     split = True
-                elif any(p in group[-1].get("word", "") for p in [",", ";"]) and current_len >= base_l:
+                elif last_flags & CLAUSE_END and current_len >= base_l:
                     split = True
         
         # 4. Sessizlik Yasası (Silence is Law)
@@ -249,24 +494,125 @@ def miller_hybrid_split(result, config):
             gap = w["start"] - group[-1]["end"]
             if gap > 0.5:
                 split = True  # Yarım saniyelik nefes bölünür
-            elif any(p in group[-1].get("word", "") for p in [".", "?", "!"]) and gap > 0.2:
+            elif last_flags & SENTENCE_END and gap > 0.2:
                 split = True
         
         if split:
-            commit_group(group)
+            block = make_block(group)
+            # Segment geçişlerini düzelt
+            if pending is not None:
+                if block["start"] - pending["end"] < 0.2:
+                    pending["end"] = block["start"]
+                yield pending
+            pending = block
             group = [w]
+            group_chars = len(w_text)
         else:
             group.append(w)
+            group_chars += len(w_text)
+        last_flags = w_flags
     
     # Son grubu tamamla
-    commit_group(group)
+    if group:
+        block = make_block(group)
+        if pending is not None:
+            if block["start"] - pending["end"] < 0.2:
+                pending["end"] = block["start"]
+            yield pending
+        pending = block
+    
+    if pending is not None:
+        yield pending
+
+
+def miller_hybrid_split(result, config):
+    """
+    v26 Miller Hybrid Architecture: Absolute Symmetry & Rhythmic Logic.
+    
+    AI çıktısını profesyonel, dengeli altyazı segmentlerine böler.
+    
+    Args:
+        result: WhisperX aligned sonucu {"segments": [...]}
+        config: Ayarlar dict'i {
+            "max_words": int,      # Segment başına max kelime (0 = sınırsız)
+            "max_lines": int,      # Segment başına max satır (0 = sınırsız)
+            "base_limit": int,     # Satır başına max karakter
+            "language": str        # Kural paketi ("tr", "en"; yoksa birleşik paket)
+        }
+    
+    Returns:
+        Formatlanmış segment listesi [Segment(start, end, text), ...]
+    """
+    mw, ml, base_l = miller_limits(config)
+    segments = result.get("segments", [])
+    
+    # Eğer kelime yoksa veya sınır yoksa, orijinal segmentleri döndür
+    has_words = any("start" in w for s in segments for w in s.get("words", []))
+    if not has_words or (mw == 0 and ml == 0 and base_l == 0):
+        return SegmentList(
+            Segment(start=s["start"], end=s["end"], text=s["text"].strip()) 
+            for s in segments
+        )
+    
+    words = (w for s in segments for w in s.get("words", []))
+    return SegmentList(iter_miller_blocks(words, config))
+
+
+# =============================================================================
+# FORMATLAMA BORU HATTI (Re-Format)
+# =============================================================================
+
+def reformat_aligned(aligned, config, bridge_ms, word_bridge_ms):
+    """
+    Hizalanmış sonuçtan altyazı segmentlerini üretir (Adım 4: Miller + Chronos).
+    
+    Worker'ın son adımı ve GPU'suz "Yeniden Formatla" modu aynı fonksiyonu
+    kullanır; böylece iki yol bire bir aynı çıktıyı verir.
+    
+    aligned["chronos"]["finetuned"] False ise (köprüleme kapalıyken işlenmiş
+    sonuç) ve artık köprüleme açıksa waveform_finetune_chronos da uygulanır.
+    Kelime dict'leri kopyalanır; aligned (ham JSON) köprülemeden etkilenmez.
+    
+    Args:
+        aligned: Hizalanmış sonuç {"segments": [...]} (ham JSON)
+        config: Ayarlar dict'i (max_words, max_lines, base_limit)
+        bridge_ms: Cümle köprüleme eşiği (ms)
+        word_bridge_ms: Kelime köprüleme eşiği (ms)
+    
+    Returns:
+        (segments_s, segments_w) tuple'ı
+    """
+    stage = aligned.get("chronos")
+    if stage is not None and not stage.get("finetuned") and (bridge_ms > 0 or word_bridge_ms > 0):
+        aligned["segments"] = waveform_finetune_chronos(aligned["segments"])
+        stage["finetuned"] = True
+    
+    segments_s = miller_hybrid_split(aligned, config)
+    
+    # Sentence level seamless bridge
+    if bridge_ms > 0:
+        segments_s = chronos_seamless_core(
+            segments_s, 
+            bridge_ms / 1000.0, 
+            min_dur=0.2
+        )
+    
+    # Word-Based Segment Collection
+    segments_w = WordList()
+    for s in aligned.get("segments", []):
+        for w in s.get("words", []):
+            if "start" in w:
+                segments_w.append(w.copy())
     
-    # Segment geçişlerini düzelt
-    for i in range(1, len(new_segs)):
-        if new_segs[i]["start"] - new_segs[i-1]["end"] < 0.2:
-            new_segs[i-1]["end"] = new_segs[i]["start"]
+    # Word level seamless bridge
+    if word_bridge_ms > 0 and segments_w:
+        segments_w = chronos_seamless_core(
+            segments_w, 
+            word_bridge_ms / 1000.0, 
+            min_dur=0.08
+        )
     
-    return new_segs
+    return segments_s, segments_w
 
 
 # =============================================================================
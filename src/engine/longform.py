@@ -0,0 +1,168 @@
+"""
+WHIXPI Pro V1.0 - Uzun Dosya Modu (Long-Form)
+==============================================
+Saatler süren kayıtları tek parça belleğe yüklemeden, VAD ile sessizlikten
+kesilen birkaç dakikalık pencerelerle işlemek için yardımcılar.
+
+Pencere sınırları konuşmanın ortasına değil sessizliğe denk geldiği için
+hiçbir kelime iki pencereye bölünmez; pencerelerin segmentleri zaman
+kaydırmasıyla (offset) tek bir zaman çizgisinde birleştirilir.
+"""
+
+import subprocess
+
+import numpy as np
+
+from src.engine.vad import SAMPLE_RATE, VAD_HOP
+
+
+# =============================================================================
+# SES ÇÖZME
+# =============================================================================
+
+class LongAudio:
+    """
+    Uzun dosya işaretçisi.
+
+    AudioPrefetcher uzun dosyaları önden çözmez; bunun yerine bu hafif nesne
+    döner ve ses, worker tarafından pencere pencere okunur.
+    """
+
+    # Prefetch bellek bütçesine yük bindirmez
+    nbytes = 0
+
+    def __init__(self, path, duration):
+        self.path = path
+        self.duration = float(duration)
+
+    def __len__(self):
+        return int(self.duration * SAMPLE_RATE)
+
+
+def probe_duration(path):
+    """
+    ffprobe ile dosya süresini okur.
+
+    Returns:
+        Süre (saniye) veya okunamazsa None
+    """
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        str(path)
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+        return float(out.decode().strip())
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+def load_audio_window(path, start, duration, sr=SAMPLE_RATE):
+    """
+    Dosyanın [start, start + duration) aralığını 16 kHz mono float32 olarak çözer.
+    (whisperx.load_audio ile aynı ffmpeg ayarları, sadece -ss/-t eklenmiş.)
+
+    Args:
+        path: Ses/video dosyası
+        start: Başlangıç (saniye)
+        duration: Süre (saniye)
+        sr: Örnekleme hızı
+
+    Returns:
+        np.ndarray (float32)
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-threads", "0",
+        "-ss", f"{start:.3f}", "-t", f"{duration:.3f}",
+        "-i", str(path),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sr),
+        "-"
+    ]
+    try:
+        out = subprocess.run(cmd, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Failed to load audio window: {e.stderr.decode(errors='ignore')}") from e
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def make_long_loader(loader, min_duration_s):
+    """
+    Uzun dosyalar için LongAudio, diğerleri için normal çözücü döndüren loader.
+
+    Args:
+        loader: Normal ses çözücü (örn: whisperx.load_audio)
+        min_duration_s: Bu süreden uzun dosyalar pencere modunda işlenir (0 = kapalı)
+    """
+    def load(path):
+        if min_duration_s > 0:
+            duration = probe_duration(path)
+            if duration is not None and duration >= min_duration_s:
+                return LongAudio(path, duration)
+        return loader(path)
+    return load
+
+
+# =============================================================================
+# PENCERE KESİMİ VE BİRLEŞTİRME
+# =============================================================================
+
+def find_silence_cut(vad_map, lo, hi, threshold=0.5, hop_s=VAD_HOP / SAMPLE_RATE):
+    """
+    [lo, hi) aralığındaki en uzun sessizliğin ortasını kesim noktası seçer.
+
+    Sessizlik yoksa (sürekli konuşma/müzik) VAD olasılığının en düşük olduğu
+    yarım saniyelik bölge kullanılır.
+
+    Args:
+        vad_map: Pencere için VAD olasılık haritası (VAD_HOP adımlı)
+        lo: Arama başlangıcı (saniye, pencereye göre)
+        hi: Arama sonu (saniye, pencereye göre)
+        threshold: Konuşma eşiği
+        hop_s: Harita adımı (saniye)
+
+    Returns:
+        Kesim noktası (saniye, pencereye göre)
+    """
+    i0 = max(0, int(lo / hop_s))
+    i1 = min(len(vad_map), int(hi / hop_s))
+    if i1 - i0 < 2:
+        return hi
+
+    region = np.asarray(vad_map[i0:i1], dtype=np.float32)
+    silent = np.concatenate(([0], (region < threshold).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(silent))
+    run_starts, run_ends = edges[0::2], edges[1::2]
+
+    if run_starts.size:
+        k = int(np.argmax(run_ends - run_starts))
+        best = (run_starts[k] + run_ends[k]) // 2
+    else:
+        win = max(1, min(len(region), int(0.5 / hop_s)))
+        smooth = np.convolve(region, np.ones(win, dtype=np.float32) / win, mode="same")
+        best = int(np.argmin(smooth))
+
+    return (i0 + best) * hop_s
+
+
+def offset_aligned(segments, offset):
+    """
+    Pencereye göre olan segment/kelime zamanlarını dosya zamanına kaydırır (yerinde).
+
+    Args:
+        segments: Hizalanmış segment listesi (kelimeler dahil)
+        offset: Pencere başlangıcı (saniye)
+
+    Returns:
+        Aynı liste
+    """
+    if offset == 0:
+        return segments
+    for s in segments:
+        for item in [s] + s.get("words", []):
+            if "start" in item:
+                item["start"] = round(item["start"] + offset, 3)
+            if "end" in item:
+                item["end"] = round(item["end"] + offset, 3)
+    return segments
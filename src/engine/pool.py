@@ -0,0 +1,236 @@
+"""
+WHIXPI Pro V1.0 - Worker Pool
+==============================
+Dosya kuyruğunu birden fazla motor süreci arasında paylaştırır.
+Her işçi bir cihaza (cuda:0, cuda:1, cpu) sabitlenir; akışlar UI için
+tek bir ilerleme görünümünde birleştirilir.
+"""
+
+import os
+import queue
+import threading
+
+import torch
+import torch.multiprocessing as mp
+
+from src.engine.worker import EngineDaemon
+
+
+# =============================================================================
+# YARDIMCI FONKSİYONLAR
+# =============================================================================
+
+def plan_devices(spec="auto", cpu_workers=1):
+    """
+    Worker Pool için cihaz listesini üretir.
+
+    Args:
+        spec: "auto", cihaz listesi (["cuda:0", "cpu"]) veya virgüllü metin
+              ("cuda:0,cuda:1")
+        cpu_workers: CUDA yoksa "auto" modunda açılacak CPU işçisi sayısı
+
+    Returns:
+        Cihaz listesi (örn: ["cuda:0", "cuda:1"] veya ["cpu", "cpu"])
+    """
+    if isinstance(spec, str) and spec != "auto":
+        spec = [d.strip() for d in spec.split(",") if d.strip()]
+
+    if spec == "auto" or not spec:
+        count = torch.cuda.device_count() if torch.cuda.is_available() else 0
+        if count > 0:
+            return [f"cuda:{i}" for i in range(count)]
+        return ["cpu"] * max(1, int(cpu_workers))
+
+    return list(spec)
+
+
+def split_cpu_threads(devices):
+    """CPU çekirdeklerini CPU işçileri arasında eşit paylaştırır."""
+    cpu_count = sum(1 for d in devices if d == "cpu")
+    if cpu_count == 0:
+        return 0
+    return max(1, (os.cpu_count() or 1) // cpu_count)
+
+
+class TaggedLogQueue:
+    """İşçi loglarının başına etiket ekleyen log_q sarmalayıcısı."""
+
+    def __init__(self, q, tag):
+        self.q = q
+        self.tag = tag
+
+    def put(self, msg):
+        self.q.put(f"[{self.tag}] {msg}")
+
+
+# =============================================================================
+# İŞÇİ HAVUZU (Worker Pool)
+# =============================================================================
+
+class EnginePool:
+    """
+    K adet kalıcı motor (EngineDaemon) süreci yönetir.
+
+    Bir işin dosyaları paylaşılan task_q'ya konur; boşta kalan işçi
+    sıradaki dosyayı çeker (work stealing), böylece uzun dosyalar tek bir
+    işçide yığılmaz. İşçilerin result akışı bir koordinatör thread'inde
+    birleştirilir: ilerleme tüm kuyruk üzerinden hesaplanır ve son dosya
+    "is_final" olarak işaretlenir.
+
+    EngineDaemon ile aynı arayüzü sunar (start, submit, cancel, shutdown,
+    is_alive), böylece UI ikisini ayırt etmeden kullanabilir.
+    """
+
+    def __init__(self, log_q, result_q, locale_dict, devices, idle_timeout=600, cpu_threads=None):
+        """
+        Args:
+            log_q: UI log kuyruğu
+            result_q: UI sonuç kuyruğu
+            locale_dict: Çeviri sözlüğü
+            devices: İşçi cihazları (bkz. plan_devices)
+            idle_timeout: Boşta model boşaltma süresi (saniye)
+            cpu_threads: CPU işçisi başına thread (None = çekirdekleri paylaştır)
+        """
+        self.log_q = log_q
+        self.result_q = result_q
+        self.devices = list(devices)
+        self.task_q = mp.Queue()
+        self._inner_q = mp.Queue()
+
+        if cpu_threads is None:
+            cpu_threads = split_cpu_threads(self.devices)
+
+        self.workers = []
+        for i, dev in enumerate(self.devices):
+            self.workers.append(EngineDaemon(
+                log_q=TaggedLogQueue(log_q, f"{dev.upper()}#{i + 1}"),
+                result_q=self._inner_q,
+                locale_dict=locale_dict,
+                idle_timeout=idle_timeout,
+                device=dev,
+                cpu_threads=cpu_threads if dev == "cpu" else 0,
+                task_q=self.task_q,
+                worker_id=i
+            ))
+
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._closing = threading.Event()
+        self._merger = threading.Thread(target=self._merge_loop, daemon=True)
+
+    # --- ARAYÜZ ---
+
+    def start(self):
+        for w in self.workers:
+            w.start()
+        self._merger.start()
+
+    def is_alive(self):
+        return any(w.is_alive() for w in self.workers)
+
+    def submit(self, job_id, **job):
+        """İşi tüm işçilere bildirir ve dosyaları paylaşılan kuyruğa koyar."""
+        audio_list = list(job.get("audio_list", []))
+        with self._lock:
+            self._jobs[job_id] = {
+                "total": len(audio_list),
+                "finished": 0,
+                "exits": 0,
+                "frac": {},
+                "held": None,
+                "shown": 0.0,
+                "L": job.get("locale_dict") or {}
+            }
+
+        for w in self.workers:
+            w.submit(job_id, **job)
+        for idx, path in enumerate(audio_list, 1):
+            self.task_q.put((job_id, idx, path))
+        # Her işçi kendi bitiş işaretini alır
+        for _ in self.workers:
+            self.task_q.put((job_id, None, None))
+
+    def cancel(self, job_id):
+        for w in self.workers:
+            w.cancel(job_id)
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def shutdown(self, timeout=3.0):
+        self._closing.set()
+        for w in self.workers:
+            if w.is_alive():
+                w.stop_event.set()
+                w.job_q.put(None)
+        for w in self.workers:
+            w.shutdown(timeout=timeout)
+
+    # --- BİRLEŞTİRİCİ (UI süreci içinde) ---
+
+    def _merge_loop(self):
+        """İşçi mesajlarını tek bir ilerleme akışına çevirip UI'a iletir."""
+        while not self._closing.is_set():
+            try:
+                msg = self._inner_q.get(timeout=0.5)
+            except queue.Empty:
+                self._check_dead_workers()
+                continue
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                job = self._jobs.get(msg.get("job_id"))
+                if job is None:
+                    continue
+                self._route(msg, job)
+
+    def _route(self, msg, job):
+        job_id = msg["job_id"]
+        kind = msg.get("type")
+
+        if kind == "progress":
+            job["frac"][msg.get("worker")] = msg["value"]
+            self._post_progress(job_id, job)
+
+        elif kind == "done":
+            job["finished"] += 1
+            job["frac"].pop(msg.get("worker"), None)
+            self._post_progress(job_id, job)
+            if msg.get("data") is not None:
+                # Son dosyayı "final" olarak işaretleyebilmek için bir mesaj geride tutulur
+                if job["held"] is not None:
+                    self.result_q.put(job["held"])
+                job["held"] = {"type": "done", "data": msg["data"], "is_final": False, "job_id": job_id}
+
+        elif kind == "partial":
+            self.result_q.put(msg)
+        
+        elif kind == "worker_exit":
+            job["exits"] += 1
+            if job["exits"] >= len(self.workers):
+                self._finish_job(job_id, job)
+
+    def _post_progress(self, job_id, job):
+        if job["total"] <= 0:
+            return
+        value = (job["finished"] + sum(job["frac"].values())) / job["total"]
+        # Paralel işçiler arasında çubuğun geri gitmemesi için
+        job["shown"] = max(job["shown"], min(1.0, value))
+        self.result_q.put({"type": "progress", "value": job["shown"], "job_id": job_id})
+
+    def _finish_job(self, job_id, job):
+        final = job["held"] or {"type": "done", "data": None, "job_id": job_id}
+        final["is_final"] = True
+        # %100 final "done"dan önce: UI final mesajından sonra bu işin mesajlarını yok sayar
+        self.result_q.put({"type": "progress", "value": 1.0, "job_id": job_id})
+        self.result_q.put(final)
+        self.log_q.put(job["L"].get("all_done", "🏁 TÜM İŞLEMLER TAMAMLANDI!"))
+        self._jobs.pop(job_id, None)
+
+    def _check_dead_workers(self):
+        """Çöken işçiler yüzünden işin asılı kalmasını önler."""
+        alive = sum(1 for w in self.workers if w.is_alive())
+        with self._lock:
+            for job_id, job in list(self._jobs.items()):
+                if job["exits"] + (len(self.workers) - alive) >= len(self.workers):
+                    self._finish_job(job_id, job)
@@ -0,0 +1,133 @@
+"""
+WHIXPI Pro V1.0 - Dil Kural Paketleri
+=====================================
+Miller bölücünün dile bağlı kuralları: bağlaçlar ve noktalama sınıfları.
+
+Her paket bir kez derlenir (frozenset'ler); kelime başına bayraklar
+(cümle sonu, güçlü duraklama, yan cümle sonu, bağlaç) tek bir ön geçişte
+hesaplanır ve kelime metni başına önbelleklenir. Bölme döngüsü sadece tam
+sayı/bit kontrolü yapar.
+
+Yeni dil eklemek:
+    register_rule_pack(RulePack("de", conjunctions=["und", "aber", "oder", ...]))
+"""
+
+
+# Kelime bayrakları (Bit maskesi)
+SENTENCE_END = 1    # . ? !  -> Cümle sonu
+STRONG_PAUSE = 2    # :      -> Blok kesimi için cümle sonu gibi sayılır
+CLAUSE_END = 4      # , ;    -> Yan cümle sonu
+CONJUNCTION = 8     # Satır sonunda kalmaması gereken bağlaç
+
+# Disiplinli kesim: Cümle sonu veya güçlü duraklama
+BLOCK_END = SENTENCE_END | STRONG_PAUSE
+
+# Bayrak önbelleği sınırı (Aşılınca sıfırlanır; süreç ömrü boyunca büyümesin)
+_MEMO_MAX = 200000
+
+
+class RulePack:
+    """
+    Derlenmiş dil kuralları.
+
+    Noktalama işaretleri kelimenin herhangi bir yerinde aranır (Eski
+    any(p in word ...) taramasıyla aynı); bağlaç kontrolü küçük harfe
+    çevrilmiş ve strip_chars'tan arındırılmış kelimeyle yapılır.
+    """
+
+    def __init__(self, name, conjunctions, sentence_marks=".?!", strong_marks=":",
+                 clause_marks=",;", strip_chars=".,?!:;"):
+        """
+        Args:
+            name: Dil kodu ("tr", "en", ...)
+            conjunctions: Bağlaçlar (Küçük harf)
+            sentence_marks: Cümle sonu işaretleri
+            strong_marks: Güçlü duraklama işaretleri
+            clause_marks: Yan cümle sonu işaretleri
+            strip_chars: Bağlaç kontrolünden önce kelimeden atılan karakterler
+        """
+        self.name = name
+        self.conjunctions = frozenset(c.lower() for c in conjunctions)
+        self.sentence_marks = frozenset(sentence_marks)
+        self.strong_marks = frozenset(strong_marks)
+        self.clause_marks = frozenset(clause_marks)
+        self.strip_chars = strip_chars
+        self._memo = {}
+
+    def _compile(self, text):
+        chars = set(text)
+        flags = 0
+        if not chars.isdisjoint(self.sentence_marks):
+            flags |= SENTENCE_END
+        if not chars.isdisjoint(self.strong_marks):
+            flags |= STRONG_PAUSE
+        if not chars.isdisjoint(self.clause_marks):
+            flags |= CLAUSE_END
+        if text.lower().strip(self.strip_chars) in self.conjunctions:
+            flags |= CONJUNCTION
+        return flags
+
+    def flags(self, text):
+        """Kelime metninin bayrakları (Metin başına önbellekli)."""
+        flags = self._memo.get(text)
+        if flags is None:
+            if len(self._memo) >= _MEMO_MAX:
+                self._memo.clear()
+            flags = self._memo[text] = self._compile(text)
+        return flags
+
+    def annotate(self, words):
+        """
+        Kelime akışına bayrak ekleyen ön geçiş ("start" içermeyenler atlanır).
+
+        Yields:
+            (kelime, metin, bayraklar)
+        """
+        memo = self._memo
+        for w in words:
+            if "start" not in w:
+                continue
+            text = w.get("word", "")
+            flags = memo.get(text)
+            if flags is None:
+                flags = self.flags(text)
+            yield w, text, flags
+
+    def __repr__(self):
+        return f"RulePack({self.name!r}, {len(self.conjunctions)} bağlaç)"
+
+
+# =============================================================================
+# KAYIT DEFTERİ
+# =============================================================================
+
+TR_CONJUNCTIONS = ("ve", "ama", "fakat", "çünkü", "veya", "lakin", "ancak")
+EN_CONJUNCTIONS = ("and", "but", "or", "so", "because", "while")
+
+_PACKS = {}
+
+
+def register_rule_pack(pack):
+    """Dil paketini kaydeder (Aynı adlı paketin yerine geçer)."""
+    _PACKS[pack.name] = pack
+    return pack
+
+
+register_rule_pack(RulePack("tr", TR_CONJUNCTIONS))
+register_rule_pack(RulePack("en", EN_CONJUNCTIONS))
+
+# Dil bilinmiyorsa: Eski birleşik liste (Türkçe + İngilizce)
+DEFAULT_PACK = RulePack("default", TR_CONJUNCTIONS + EN_CONJUNCTIONS)
+
+
+def get_rule_pack(language=None):
+    """
+    Dil koduna göre kural paketi ("tr-TR" gibi bölge ekleri yok sayılır).
+
+    Returns:
+        RulePack (Kayıtlı değilse DEFAULT_PACK)
+    """
+    if not language:
+        return DEFAULT_PACK
+    code = str(language).lower().replace("_", "-").split("-")[0]
+    return _PACKS.get(code, DEFAULT_PACK)
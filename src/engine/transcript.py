@@ -0,0 +1,446 @@
+"""
+WHIXPI Pro V1.0 - Transkript Kayıtları
+======================================
+Kelime ve segmentler için __slots__ tabanlı kompakt tipler (Word, Segment).
+
+whisperx çıktısı dict listesidir; motor hizalamadan hemen sonra bunları
+compact_aligned() ile Word/Segment'e çevirir. Tipler dict arayüzünü
+(w["start"], w.get("word", ""), "start" in w, dict(w), w.copy()) taklit
+ettiği için Refinery, Miller, Chronos ve dışa aktarım kodu değişmeden
+çalışır. Eksik alan, dict'teki eksik anahtar gibi davranır (KeyError /
+get varsayılanı); tanımsız anahtarlar ayrı bir dict'te (_extra) tutulur.
+
+Düz dict'e sadece sınırda dönülür: JSON yazımı json_default() ile,
+gerekirse to_plain() ile.
+
+Bellek: 4 alanlı kelime dict'i 184 bayt, Word 72 bayt (CPython 3.11).
+Pickle'da (UI'a giden result_q) anahtar adları yazılmaz; kelime listeleri
+(WordList, SegmentList) kayıt kayıt değil sütun sütun yazılır. Segment
+kelimeleri word_segments'e aralık olarak yazılır; açılınca aynı Word
+nesnelerini paylaşmaya devam ederler.
+"""
+
+import gc
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import repeat
+from operator import attrgetter, is_
+
+
+class Record:
+    """
+    Word ve Segment'in ortak tabanı: Sabit alanlar slot, diğerleri _extra dict'i.
+
+    Alt sınıflar FIELDS (sıralı alan adları) ve aynı adlarla __slots__ tanımlar.
+    Atanmamış slot = eksik anahtar.
+    """
+
+    __slots__ = ("_extra",)
+
+    FIELDS = ()
+    _FIELD_SET = frozenset()
+
+    def __init__(self, data=None, **fields):
+        self._extra = None
+        if data:
+            for k, v in data.items():
+                self[k] = v
+        for k, v in fields.items():
+            self[k] = v
+
+    @classmethod
+    def from_dict(cls, d):
+        """Dict'ten kayıt üretir (Değerler kopyalanmaz)."""
+        return cls(d)
+
+    # --- DICT ARAYÜZÜ ---
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = [f for f in self.FIELDS if hasattr(self, f)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def values(self):
+        return [self[k] for k in self.keys()]
+
+    def items(self):
+        return [(k, self[k]) for k in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def pop(self, key, *default):
+        try:
+            value = self[key]
+        except KeyError:
+            if default:
+                return default[0]
+            raise
+        del self[key]
+        return value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, other=(), **kwargs):
+        items = other.items() if hasattr(other, "items") else other
+        for k, v in items:
+            self[k] = v
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def copy(self):
+        """Yüzeysel kopya (dict.copy gibi; listeler paylaşılır)."""
+        new = type(self).__new__(type(self))
+        new._extra = dict(self._extra) if self._extra else None
+        for f in self.FIELDS:
+            try:
+                setattr(new, f, getattr(self, f))
+            except AttributeError:
+                pass
+        return new
+
+    def to_dict(self):
+        """Yüzeysel düz dict (İç içe kayıtlar olduğu gibi kalır)."""
+        return {k: self[k] for k in self.keys()}
+
+    def __eq__(self, other):
+        if isinstance(other, (Record, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    # --- PICKLE (Anahtar adları yazılmaz) ---
+
+    def __reduce__(self):
+        mask = 0
+        values = []
+        for i, f in enumerate(self.FIELDS):
+            try:
+                values.append(getattr(self, f))
+            except AttributeError:
+                continue
+            mask |= 1 << i
+        return _restore, (type(self), mask, self._extra, *values)
+
+
+def _restore(cls, mask, extra, *values):
+    obj = cls.__new__(cls)
+    obj._extra = extra
+    it = iter(values)
+    for i, f in enumerate(cls.FIELDS):
+        if mask & (1 << i):
+            setattr(obj, f, next(it))
+    return obj
+
+
+class Word(Record):
+    """Hizalanmış kelime: word, start, end, score."""
+
+    __slots__ = ("word", "start", "end", "score")
+
+    FIELDS = ("word", "start", "end", "score")
+    _FIELD_SET = frozenset(FIELDS)
+
+
+class Segment(Record):
+    """Segment / altyazı bloğu: start, end, text, words (Word listesi)."""
+
+    __slots__ = ("start", "end", "text", "words")
+
+    FIELDS = ("start", "end", "text", "words")
+    _FIELD_SET = frozenset(FIELDS)
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Toplu kayıt üretimi sırasında çöp toplayıcıyı durdurur.
+
+    Slot'lu nesneler (dict'lerin aksine) her zaman GC takibindedir; yüz
+    binlerce Word üretilirken tetiklenen tam taramalar süreyi katlar.
+    Kayıtlar döngü oluşturmadığı için duraklatma güvenlidir.
+    """
+    enabled = gc.isenabled()
+    if enabled:
+        gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# Eksik slot işareti (Sütun paketleme)
+_MISSING = object()
+
+# Sayısal alanlar: Pickle'da float64 dizisi olarak yazılır
+_FLOAT_FIELDS = frozenset(("start", "end", "score"))
+
+
+def _pack_columns(records, fields):
+    """
+    Kayıtların alanlarını sütunlara açar.
+
+    Returns:
+        ((sütun, eksik indeksler veya None), ...) - alan sırasıyla
+    """
+    columns = []
+    for f in fields:
+        try:
+            col = list(map(attrgetter(f), records))
+            missing = None
+        except AttributeError:
+            col = [getattr(r, f, _MISSING) for r in records]
+            missing = [i for i, v in enumerate(col) if v is _MISSING]
+            for i in missing:
+                col[i] = 0.0 if f in _FLOAT_FIELDS else None
+        # Sadece tamamı float olan sütun diziye çevrilir (int/None tipi korunur)
+        if f in _FLOAT_FIELDS and set(map(type, col)) == {float}:
+            col = array("d", col)
+        columns.append((col, missing))
+    return tuple(columns)
+
+
+def _new_records(cls, n, fields, columns, extras):
+    """_pack_columns() sütunlarından n adet kayıt üretir (GC duraklatılmış çağrılmalı)."""
+    new = cls.__new__
+    records = [new(cls) for _ in range(n)]
+    for f, (col, missing) in zip(fields, columns):
+        if isinstance(col, array):
+            col = col.tolist()
+        deque(map(setattr, records, repeat(f), col), maxlen=0)
+        for i in missing or ():
+            delattr(records[i], f)
+    deque(map(setattr, records, repeat("_extra"), extras or repeat(None, n)), maxlen=0)
+    return records
+
+
+def _extras(records):
+    extras = list(map(attrgetter("_extra"), records))
+    return extras if any(extras) else None
+
+
+class WordList(list):
+    """
+    Word listesi: Pickle'da sütunlara açılır.
+
+    Kelime başına __reduce__ çağrısı yerine her alan tek bir liste/float64
+    dizisi olarak yazılır. Liste Word dışı öğe içeriyorsa normal liste gibi
+    pickle'lanır.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        if not self or set(map(type, self)) != {Word}:
+            return WordList, (list(self),)
+        return _restore_words, (len(self), _pack_columns(self, Word.FIELDS), _extras(self))
+
+
+def _restore_words(n, columns, extras):
+    with _gc_paused():
+        return WordList(_new_records(Word, n, Word.FIELDS, columns, extras))
+
+
+# Segment alanları (words ayrı, düzleştirilmiş WordList olarak yazılır)
+_SEGMENT_COLUMNS = ("start", "end", "text")
+
+
+class SegmentList(list):
+    """
+    Segment listesi: Pickle'da sütunlara açılır.
+
+    shared_words (genelde aligned["word_segments"]) verilmişse segment
+    kelimeleri o listedeki (başlangıç, sayı) aralıkları olarak yazılır.
+    Liste pickle'da bir kez yer alır (pickle memo) ve açılınca segmentler
+    ile word_segments yine aynı Word nesnelerini paylaşır. Aralığa uymayan
+    kelimeler ayrı, düzleştirilmiş bir WordList'e gider.
+    """
+
+    __slots__ = ("shared_words",)
+
+    def __init__(self, iterable=(), shared_words=None):
+        super().__init__(iterable)
+        self.shared_words = shared_words
+
+    def __reduce__(self):
+        shared = getattr(self, "shared_words", None)
+        if not self or set(map(type, self)) != {Segment}:
+            return SegmentList, (list(self), shared)
+        starts, counts, flat = _word_ranges(self, shared)
+        return _restore_segments, (
+            len(self), _pack_columns(self, _SEGMENT_COLUMNS), _extras(self), starts, counts, shared, flat
+        )
+
+
+def _word_ranges(segments, shared):
+    """
+    Segment kelimelerini paylaşılan listedeki aralıklara çevirir.
+
+    Kelimeler genelde shared'da sırayla durduğu için önce kaldığı yerden
+    devam eden aralık denenir; uymazsa ilk kelimenin yeri kimlik
+    indeksinden bulunur (Sadece gerekirse kurulur).
+
+    Returns:
+        (başlangıçlar, sayılar, düz WordList) - başlangıç -1 ise kelimeler
+        düz listeden sırayla alınır, sayı -1 ise segmentin words alanı yoktur
+    """
+    starts, counts = array("q"), array("q")
+    flat = WordList()
+    n_shared = len(shared) if shared is not None else 0
+    cursor = 0
+    index = None
+    for seg in segments:
+        ws = getattr(seg, "words", None)
+        if ws is None:
+            starts.append(-1)
+            counts.append(-1)
+            continue
+        count = len(ws)
+        counts.append(count)
+        if count and n_shared:
+            pos = cursor
+            if pos + count > n_shared or shared[pos] is not ws[0]:
+                if index is None:
+                    index = {id(w): i for i, w in enumerate(shared)}
+                pos = index.get(id(ws[0]), -1)
+            if pos >= 0 and pos + count <= n_shared and all(map(is_, ws, shared[pos:pos + count])):
+                starts.append(pos)
+                cursor = pos + count
+                continue
+        starts.append(-1)
+        flat.extend(ws)
+    return starts, counts, flat
+
+
+def _restore_segments(n, columns, extras, starts, counts, shared, flat):
+    with _gc_paused():
+        segments = _new_records(Segment, n, _SEGMENT_COLUMNS, columns, extras)
+        pos = 0
+        for seg, start, count in zip(segments, starts, counts):
+            if count < 0:
+                continue
+            if start >= 0:
+                seg.words = WordList(shared[start:start + count])
+            else:
+                seg.words = WordList(flat[pos:pos + count])
+                pos += count
+    return SegmentList(segments, shared)
+
+
+# =============================================================================
+# DÖNÜŞÜM
+# =============================================================================
+
+def compact_aligned(aligned):
+    """
+    Hizalanmış sonucun segment ve kelimelerini Word/Segment'e çevirir (yerinde).
+
+    whisperx'te word_segments segmentlerin kelime dict'lerini paylaşır; bu
+    paylaşım korunur (Aynı dict -> aynı Word) ve pickle'da da sürer
+    (SegmentList.shared_words). Zaten çevrilmiş kayıtlara dokunulmaz.
+
+    Args:
+        aligned: {"segments": [...], "word_segments": [...], ...}
+
+    Returns:
+        Aynı dict
+    """
+    memo = {}
+
+    def word(w):
+        if isinstance(w, Record):
+            return w
+        rec = memo.get(id(w))
+        if rec is None:
+            rec = memo[id(w)] = Word.from_dict(w)
+        return rec
+
+    with _gc_paused():
+        segments = []
+        for s in aligned.get("segments", []):
+            if not isinstance(s, Record):
+                words = s.get("words")
+                s = Segment.from_dict(s)
+                if words is not None:
+                    s.words = WordList(word(w) for w in words)
+            segments.append(s)
+        shared = None
+        if aligned.get("word_segments") is not None:
+            shared = aligned["word_segments"] = WordList(word(w) for w in aligned["word_segments"])
+        aligned["segments"] = SegmentList(segments, shared)
+    return aligned
+
+
+def to_plain(obj):
+    """Kayıtları (iç içe listeler ve dict'ler dahil) düz dict'e çevirir."""
+    if isinstance(obj, Record):
+        return {k: to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [to_plain(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: to_plain(v) for k, v in obj.items()}
+    return obj
+
+
+def json_default(obj):
+    """json.dump(default=...) için: Kayıtlar dict, numpy skalerleri Python sayısı olur."""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    if hasattr(obj, "item"):
+        return obj.item()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"JSON'a çevrilemeyen tip: {type(obj).__name__}")
@@ -0,0 +1,838 @@
+"""
+WHIXPI Pro V1.0 - VAD Analizi
+=============================
+Silero VAD olasılık haritası ve Smart VAD kalibrasyonu.
+
+Bir dosya için harita ve kalibrasyon tek sefer hesaplanır (VadAnalysis);
+Diamond Refinery'nin cümle ve kelime geçişleri ile diğer tüketiciler
+(uzun dosya kesimi vb.) aynı nesneyi sorgular.
+
+torch sadece harita hesaplanırken import edilir; hazır harita ile çalışan
+kodlar (çözücü, benchmark) torch olmadan da kullanılabilir.
+"""
+
+import sys
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000
+
+# Silero VAD pencere boyu (örnek)
+VAD_HOP = 512
+
+# Harita tipi: Olasılıklar float16 tutulur (Önbellekte pencere başına 2 bayt).
+# Taze ve önbellekten okunan haritalar aynı tipte olduğu için sonuçlar aynıdır.
+MAP_DTYPE = np.float16
+
+
+# =============================================================================
+# OLASILIK HARİTASI
+# =============================================================================
+
+# Pencere başına tahmini tepe bellek (Silero ara tensörleri; CUDA'da ilk toplu işten ölçülür)
+VAD_CHUNK_BYTES = 256 * 1024
+
+# Boş belleğin en fazla bu oranı VAD toplu işine ayrılır
+_MEM_FRACTION = 0.5
+
+MIN_META_BATCH = 256
+MAX_META_BATCH = 40000
+# CPU'da büyük toplu iş hız kazandırmaz, sadece geçici tensörleri büyütür
+CPU_MAX_META_BATCH = 4096
+
+
+def host_available_bytes():
+    """
+    Kullanılabilir sistem RAM'i (bayt).
+
+    Returns:
+        Bayt veya ölçülemezse None
+    """
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+
+    if sys.platform == "win32":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            stat = MEMORYSTATUSEX()
+            stat.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(stat)):
+                return int(stat.ullAvailPhys)
+        except Exception:
+            return None
+        return None
+
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def free_memory_bytes(device):
+    """
+    Cihazdaki boş bellek: CUDA için boş VRAM, CPU için kullanılabilir RAM.
+
+    Returns:
+        Bayt veya ölçülemezse None
+    """
+    if str(device).startswith("cuda"):
+        try:
+            import torch
+            free, _ = torch.cuda.mem_get_info(torch.device(device))
+            return int(free)
+        except Exception:
+            return None
+    return host_available_bytes()
+
+
+def plan_meta_batch(device, chunk_bytes=VAD_CHUNK_BYTES, free_bytes=None):
+    """
+    Boş belleğe ve pencere başına maliyete göre tek seferde VAD'a verilecek pencere sayısı.
+
+    Args:
+        device: Modelin cihazı ("cpu", "cuda", "cuda:1")
+        chunk_bytes: Pencere başına tepe bellek (bayt)
+        free_bytes: Ölçülmüş boş bellek (None = şimdi ölç)
+
+    Returns:
+        Pencere sayısı (int)
+    """
+    cap = MAX_META_BATCH if str(device).startswith("cuda") else CPU_MAX_META_BATCH
+    free = free_memory_bytes(device) if free_bytes is None else free_bytes
+    if free is None:
+        return min(cap, 2000)
+    n = int(free * _MEM_FRACTION / max(1, chunk_bytes))
+    return max(MIN_META_BATCH, min(cap, n))
+
+
+def _is_oom(exc):
+    """Bellek yetersizliği hatası mı? (CUDA OOM, CPU ayırıcı hatası, MemoryError)"""
+    if isinstance(exc, MemoryError):
+        return True
+    msg = str(exc).lower()
+    return "out of memory" in msg or "can't allocate memory" in msg
+
+
+def compute_vad_map(audio_np, model, device, meta_batch=None, stop_event=None, sr=SAMPLE_RATE, stats=None):
+    """
+    Silero VAD olasılık haritasını (VAD_HOP örneklik pencereler) hesaplar.
+
+    Toplu iş boyu verilmezse boş bellekten planlanır (plan_meta_batch). CUDA'da
+    ilk toplu işin gerçek tepe belleği ölçülüp boy yeniden planlanır; bellek
+    hatasında boy yarıya indirilip aynı dilim tekrar denenir.
+
+    Her çağrıdan önce modelin LSTM durumu sıfırlanır: pencereler birbirinden
+    bağımsız işlenir ve harita toplu iş boyundan etkilenmez.
+
+    Args:
+        audio_np: 16 kHz mono float32 ses
+        model: Silero VAD modeli (torch) veya predict_audio() sunan arka uç
+        device: Modelin cihazı
+        meta_batch: Tek seferde işlenecek pencere sayısı (None = otomatik)
+        stop_event: Set edilirse hesaplama yarıda bırakılır
+        stats: Verilirse {"meta_batch", "windows", "backoffs"} ile doldurulur
+
+    Returns:
+        np.ndarray olasılık haritası (MAP_DTYPE) veya durdurulduysa None
+    """
+    auto = meta_batch is None
+    if auto:
+        meta_batch = plan_meta_batch(device)
+
+    # torch dışı arka uçlar (ONNX) kendi toplu çıkarımını yapar
+    if hasattr(model, "predict_audio"):
+        if stats is not None:
+            stats.update(meta_batch=meta_batch, windows=-(-len(audio_np) // VAD_HOP), backoffs=0)
+        return model.predict_audio(audio_np, meta_batch=meta_batch, stop_event=stop_event, sr=sr)
+
+    import torch
+
+    audio_t = torch.from_numpy(audio_np).to(device)
+
+    # Padding
+    flat_len = len(audio_t)
+    pad_needed = VAD_HOP - (flat_len % VAD_HOP)
+    if pad_needed != VAD_HOP:
+        audio_t = torch.nn.functional.pad(audio_t, (0, pad_needed))
+
+    batched_audio = audio_t.view(-1, VAD_HOP)
+    total = len(batched_audio)
+    global_probs = []
+    on_cuda = str(device).startswith("cuda")
+    measure = auto and on_cuda
+    backoffs = 0
+    i = 0
+
+    model.eval()
+    with torch.no_grad():
+        while i < total:
+            if stop_event is not None and stop_event.is_set():
+                return None
+            b = batched_audio[i:i + meta_batch]
+            try:
+                if hasattr(model, "reset_states"):
+                    model.reset_states()
+                if measure:
+                    torch.cuda.reset_peak_memory_stats(device)
+                    base = torch.cuda.memory_allocated(device)
+                out = model(b, sr)
+            except (RuntimeError, MemoryError) as e:
+                if not _is_oom(e) or meta_batch <= MIN_META_BATCH:
+                    raise
+                # Geri çekilme: Aynı dilimi yarı boyla tekrar dene
+                meta_batch = max(MIN_META_BATCH, meta_batch // 2)
+                backoffs += 1
+                if on_cuda:
+                    torch.cuda.empty_cache()
+                continue
+
+            if measure:
+                # Gerçek pencere maliyetiyle yeniden planla (Tek sefer)
+                measure = False
+                peak = torch.cuda.max_memory_allocated(device) - base
+                if peak > 0 and len(b) >= MIN_META_BATCH:
+                    meta_batch = plan_meta_batch(device, chunk_bytes=peak / len(b))
+
+            if out.dim() > 1 and out.shape[-1] > 1:
+                global_probs.append(out[:, 1].cpu())
+            else:
+                global_probs.append(out.view(-1).cpu())
+            i += len(b)
+
+    if stats is not None:
+        stats.update(meta_batch=meta_batch, windows=total, backoffs=backoffs)
+    return torch.cat(global_probs).numpy().astype(MAP_DTYPE)
+
+
+# =============================================================================
+# DOSYA BAŞINA VAD ANALİZİ
+# =============================================================================
+
+class VadAnalysis:
+    """
+    Bir ses (dosya veya uzun dosya penceresi) için VAD sonucu.
+
+    İçerik:
+        audio: 16 kHz ses (Zero-crossing snap için)
+        probs: VAD olasılık haritası (VAD_HOP adımlı)
+        threshold, pad_start, pad_end, min_silence: Smart VAD kalibrasyonu
+        calib: Kalibrasyonu üreten Calibration (Ölçümler dahil, varsa)
+    """
+
+    def __init__(self, audio, probs, threshold, pad_start, pad_end, min_silence, sr=SAMPLE_RATE, calib=None):
+        self.audio = audio
+        self.probs = probs
+        self.threshold = threshold
+        self.pad_start = pad_start
+        self.pad_end = pad_end
+        self.min_silence = min_silence
+        self.sr = sr
+        self.calib = calib
+
+    @property
+    def duration(self):
+        """Ses süresi (saniye)."""
+        return len(self.audio) / self.sr
+
+    @property
+    def calibration(self):
+        """(threshold, pad_start, pad_end, min_silence) tuple'ı."""
+        return self.threshold, self.pad_start, self.pad_end, self.min_silence
+
+    def frames(self, seconds):
+        """Saniye değerlerini harita indekslerine çevirir (Haritaya kırpılmış)."""
+        idx = (np.asarray(seconds) * self.sr / VAD_HOP).astype(int)
+        return np.clip(idx, 0, len(self.probs))
+
+    def release(self):
+        """Büyük dizileri bırakır (Dosya bitince)."""
+        self.audio = None
+        self.probs = None
+
+
+# =============================================================================
+# SMART VAD KALİBRASYONU
+# =============================================================================
+
+# "adaptive": Ölçümden türetilir, "fixed": Sabit agresif preset
+CALIBRATION_MODES = ("adaptive", "fixed")
+
+# Sabit agresif preset (threshold, pad_start, pad_end, min_silence).
+# Kullanıcı geri bildirimine göre başlangıç gecikmelerini (Late Attack) önler:
+# çok düşük eşik fısıltıları yakalar, geniş pad kelimeden öncesini de alır.
+FIXED_CALIBRATION = (0.08, 0.50, 0.50, 0.50)
+
+# Seviye histogramı: 50 ms çerçeve RMS'i, -100..0 dBFS, 0.25 dB kutular
+LEVEL_FRAME = 800
+LEVEL_MIN_DB = -100.0
+LEVEL_BIN_DB = 0.25
+LEVEL_BINS = 400
+
+# Tek seferde işlenen çerçeve sayısı (Geçici bellek ses uzunluğundan bağımsız)
+_LEVEL_CHUNK_FRAMES = 4096
+
+# SNR aralığı (dB): Altı gürültülü, üstü temiz kayıt sayılır
+_SNR_NOISY = 10.0
+_SNR_CLEAN = 30.0
+
+# Duraklama istatistiği: Daha kısa düşüşler titreşim sayılır, yeterli örnek yoksa preset
+_MIN_PAUSE_S = 0.10
+_MIN_PAUSES = 5
+
+
+class LevelHistogram:
+    """
+    Çerçeve seviyelerinin (dBFS) akış histogramı.
+
+    Ses parça parça beslenir; bellek sadece kutu sayısı kadardır (Ses
+    uzunluğundan bağımsız). Quantile'lar kutu çözünürlüğünde okunur.
+    """
+
+    def __init__(self, frame=LEVEL_FRAME):
+        self.frame = frame
+        self.counts = np.zeros(LEVEL_BINS, dtype=np.int64)
+        self.total = 0
+
+    def update(self, audio):
+        """Bir ses parçasının tam çerçevelerini ekler (Artık örnekler atılır)."""
+        k = len(audio) // self.frame
+        if k == 0:
+            return
+        frames = np.asarray(audio[:k * self.frame], dtype=np.float32).reshape(k, self.frame)
+        power = np.einsum("ij,ij->i", frames, frames) / self.frame
+        db = 10.0 * np.log10(power + 1e-12)
+        idx = ((db - LEVEL_MIN_DB) / LEVEL_BIN_DB).astype(np.int64)
+        np.clip(idx, 0, LEVEL_BINS - 1, out=idx)
+        self.counts += np.bincount(idx, minlength=LEVEL_BINS)
+        self.total += k
+
+    def quantile(self, q):
+        """
+        Seviye quantile'ı.
+
+        Args:
+            q: 0-1 arası oran
+
+        Returns:
+            dBFS (Kutu ortası; boş histogramda LEVEL_MIN_DB)
+        """
+        if self.total == 0:
+            return LEVEL_MIN_DB
+        cum = np.cumsum(self.counts)
+        k = min(int(np.searchsorted(cum, q * self.total)), LEVEL_BINS - 1)
+        return LEVEL_MIN_DB + (k + 0.5) * LEVEL_BIN_DB
+
+
+def level_histogram(audio, frame=LEVEL_FRAME):
+    """Sesin tamamını tek geçişte, sabit boyutlu parçalarla histograma döker."""
+    hist = LevelHistogram(frame)
+    step = frame * _LEVEL_CHUNK_FRAMES
+    for i in range(0, len(audio), step):
+        hist.update(audio[i:i + step])
+    return hist
+
+
+def pause_lengths(probs, threshold, hop_s=VAD_HOP / SAMPLE_RATE):
+    """
+    Konuşmalar arasındaki duraklamaların süreleri (saniye).
+
+    Dosya başı/sonundaki sessizlikler duraklama sayılmaz.
+    """
+    speech = np.asarray(probs) > np.float32(threshold)
+    if not speech.any():
+        return np.zeros(0)
+    silent = np.concatenate(([0], (~speech).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(silent))
+    run_s, run_e = edges[0::2], edges[1::2]
+    inner = (run_s > 0) & (run_e < len(speech))
+    return (run_e[inner] - run_s[inner]) * hop_s
+
+
+class Calibration:
+    """
+    Smart VAD kalibrasyon sonucu ve dayandığı ölçümler.
+
+    values: VadAnalysis'e giden (threshold, pad_start, pad_end, min_silence).
+    mode: "adaptive", "fixed" veya ölçüm yetersizse "fallback".
+    """
+
+    def __init__(self, values, mode, noise_db=None, speech_db=None, pauses=0):
+        self.values = tuple(float(v) for v in values)
+        self.mode = mode
+        self.noise_db = noise_db
+        self.speech_db = speech_db
+        self.pauses = pauses
+
+    @property
+    def snr_db(self):
+        if self.noise_db is None or self.speech_db is None:
+            return None
+        return self.speech_db - self.noise_db
+
+    def describe(self):
+        """Log satırı."""
+        thr, pad_s, pad_e, min_sil = self.values
+        text = f"[{self.mode.upper()}] Thr={thr:g} | Pad={pad_s:g}/{pad_e:g}s | MinSil={min_sil:g}s"
+        if self.snr_db is not None:
+            text += f" | SNR={self.snr_db:.1f}dB | Duraklama={self.pauses}"
+        return text
+
+
+def calibrate_vad(audio, probs, mode="adaptive", sr=SAMPLE_RATE):
+    """
+    Dosyaya özel Smart VAD parametreleri.
+
+    Ses bir kez, sabit bellekle çerçeve seviyesi histogramına dökülür:
+    alt %10 gürültü tabanı, üst %10 konuşma seviyesi verir. Temiz kayıtta
+    (SNR >= 30 dB) sabit agresif preset'e ulaşılır; gürültü arttıkça eşik
+    yükselir ve pencere daralır (Düşük eşik + geniş pencere gürültüde
+    sahte konuşma başlangıcı yakalar). Bitiş sapma sınırı (min_silence)
+    haritadaki tipik duraklama süresinden gelir.
+
+    Args:
+        audio: 16 kHz ses
+        probs: VAD olasılık haritası
+        mode: "adaptive" veya "fixed"
+        sr: Örnekleme hızı
+
+    Returns:
+        Calibration
+    """
+    if mode == "fixed":
+        return Calibration(FIXED_CALIBRATION, "fixed")
+
+    hist = level_histogram(audio, frame=int(sr * LEVEL_FRAME / SAMPLE_RATE))
+    noise_db = hist.quantile(0.10)
+    speech_db = hist.quantile(0.90)
+
+    # Çok kısa veya neredeyse sessiz ses: Ölçüme güvenilmez
+    if hist.total < 20 or speech_db < -60.0:
+        return Calibration(FIXED_CALIBRATION, "fallback", noise_db, speech_db)
+
+    clean = float(np.clip((speech_db - noise_db - _SNR_NOISY) / (_SNR_CLEAN - _SNR_NOISY), 0.0, 1.0))
+    threshold = round(0.25 + (FIXED_CALIBRATION[0] - 0.25) * clean, 2)
+    pad_start = round(0.30 + (FIXED_CALIBRATION[1] - 0.30) * clean, 2)
+    pad_end = round(0.30 + (FIXED_CALIBRATION[2] - 0.30) * clean, 2)
+
+    pauses = pause_lengths(probs, threshold, hop_s=VAD_HOP / sr)
+    pauses = pauses[pauses >= _MIN_PAUSE_S]
+    if pauses.size >= _MIN_PAUSES:
+        min_silence = round(float(np.clip(np.median(pauses), 0.25, 0.80)), 2)
+    else:
+        min_silence = FIXED_CALIBRATION[3]
+
+    return Calibration((threshold, pad_start, pad_end, min_silence), "adaptive",
+                       noise_db, speech_db, int(pauses.size))
+
+
+# =============================================================================
+# SINIR ÇÖZÜCÜ (Vectorized Boundary Solver)
+# =============================================================================
+
+# Zero-crossing arama yarıçapı (örnek)
+SNAP_WIN = 1200
+
+# Toplu snap'te tek seferde kopyalanan pencere sayısı (~2.5 MB, önbelleğe sığar)
+_SNAP_CHUNK = 256
+
+
+def snap_to_quietest(audio, positions, snap_win=SNAP_WIN):
+    """
+    Her konum için [pos - snap_win, pos + snap_win) aralığındaki en sessiz
+    örneğin (min |genlik|) indeksini toplu olarak bulur.
+
+    Eşitlikte ilk indeks seçilir (np.argmin ile aynı). Boş aralıkta konumun
+    kendisi döner.
+
+    Args:
+        audio: 16 kHz ses (float32)
+        positions: Örnek indeksleri (int dizi)
+        snap_win: Arama yarıçapı
+
+    Returns:
+        Snap edilmiş indeksler (int64 dizi)
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    out = positions.copy()
+    n = len(audio)
+    if positions.size == 0 or n == 0:
+        return out
+
+    lo = positions - snap_win
+    interior = (lo >= 0) & (positions + snap_win <= n)
+
+    # İç pencereler: Sabit boylu, sliding view üzerinden toplu argmin
+    idx = np.flatnonzero(interior)
+    if idx.size and n >= 2 * snap_win:
+        windows = np.lib.stride_tricks.sliding_window_view(audio, 2 * snap_win)
+        for c in range(0, idx.size, _SNAP_CHUNK):
+            part = idx[c:c + _SNAP_CHUNK]
+            block = np.abs(windows[lo[part]])
+            out[part] = lo[part] + np.argmin(block, axis=1)
+
+    # Kenar pencereler (Dosya başı/sonu): Kırpılmış aralık, tek tek
+    for i in np.flatnonzero(~interior):
+        sw = max(0, positions[i] - snap_win)
+        ew = min(n, positions[i] + snap_win)
+        if ew > sw:
+            out[i] = sw + np.argmin(np.abs(audio[sw:ew]))
+
+    return out
+
+
+def solve_boundaries(vad, starts, ends, mode="sentence"):
+    """
+    Diamond Refinery sınır çözücüsü (Tüm segmentler tek seferde).
+
+    Her segment için genişletilmiş pencere içindeki ilk/son VAD eşiği aşımını
+    prefix-count ve sonraki/önceki-aşım indeks dizileriyle bulur, sınırları
+    en sessiz örneğe snap eder ve sapma toleransı içindeyse uygular.
+
+    Args:
+        vad: VadAnalysis
+        starts: Segment başlangıçları (saniye)
+        ends: Segment bitişleri (saniye)
+        mode: "sentence" veya "word" (Başlangıç toleransı)
+
+    Returns:
+        (new_starts, new_ends, set_start, set_end)
+        set_* maskeleri True olan segmentlere new_* değeri yazılmalıdır.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    n = len(starts)
+    new_starts = starts.copy()
+    new_ends = ends.copy()
+    set_start = np.zeros(n, dtype=bool)
+    set_end = np.zeros(n, dtype=bool)
+    if n == 0:
+        return new_starts, new_ends, set_start, set_end
+
+    sr = vad.sr
+    probs = vad.probs
+    audio = vad.audio
+    m = len(probs)
+
+    # Smart Padding Uygulaması
+    # VAD'ın bulduğu sınırları biraz esnetiyoruz (Nefes payı)
+    SAFETY = 0.02
+    prev_ends = np.concatenate(([0], ends[:-1] + SAFETY))
+    next_starts = np.concatenate((starts[1:] - SAFETY, [len(audio) / sr]))
+
+    w_starts = np.maximum(prev_ends, starts - vad.pad_start)
+    w_ends = np.minimum(next_starts, ends + vad.pad_end)
+
+    idx_starts = np.clip((w_starts * sr / VAD_HOP).astype(int), 0, m)
+    idx_ends = np.clip((w_ends * sr / VAD_HOP).astype(int), 0, m)
+
+    MAX_S_DRIFT = 0.30 if mode == "sentence" else 0.15
+    MAX_E_DRIFT = vad.min_silence
+
+    # Eşik aşımı: prefix-count + sonraki/önceki aşım indeksleri
+    # (Eşik float16'ya yuvarlanmasın diye karşılaştırma float32'de)
+    hit = probs > np.float32(vad.threshold)
+    counts = np.concatenate(([0], np.cumsum(hit, dtype=np.int64)))
+    pos = np.arange(m, dtype=np.int64)
+    next_hit = np.minimum.accumulate(np.where(hit, pos, m)[::-1])[::-1]
+    prev_hit = np.maximum.accumulate(np.where(hit, pos, -1))
+    next_hit = np.concatenate((next_hit, [m]))
+
+    valid = idx_starts < idx_ends
+    has_hits = valid & (counts[idx_ends] - counts[idx_starts] > 0)
+    sel = np.flatnonzero(has_hits)
+
+    if sel.size:
+        first_hit = next_hit[idx_starts[sel]]
+        last_hit = prev_hit[idx_ends[sel] - 1]
+
+        raw_s = first_hit * VAD_HOP
+        raw_e = last_hit * VAD_HOP + VAD_HOP
+
+        # Zero Crossing Snap (Toplu)
+        snap_s = snap_to_quietest(audio, raw_s)
+        snap_e = snap_to_quietest(audio, raw_e)
+
+        cand_s = snap_s / sr
+        cand_e = (snap_e / sr) + 0.04
+
+        ok_s = np.abs(cand_s - starts[sel]) < MAX_S_DRIFT
+        ok_e = np.abs(cand_e - ends[sel]) < MAX_E_DRIFT
+
+        new_starts[sel[ok_s]] = np.round(np.maximum(prev_ends[sel], cand_s), 3)[ok_s]
+        new_ends[sel[ok_e]] = np.round(np.minimum(next_starts[sel] - 0.01, cand_e), 3)[ok_e]
+        set_start[sel[ok_s]] = True
+        set_end[sel[ok_e]] = True
+
+    # Ters dönen segmentlere minimum süre (Sadece analiz edilen pencereler)
+    flipped = valid & (new_ends <= new_starts)
+    new_ends[flipped] = new_starts[flipped] + 0.1
+    set_end |= flipped
+
+    return new_starts, new_ends, set_start, set_end
+
+
+# =============================================================================
+# SESSİZLİK ATLAMA (Silence Skip)
+# =============================================================================
+
+class SpeechPlan:
+    """
+    Whisper'a sadece konuşma bölgelerini vermek için sıkıştırma planı.
+
+    spans: Korunan (başlangıç, bitiş) örnek aralıkları (Orijinal zaman çizgisi).
+    Sıkıştırılmış sesteki zamanlar to_original() ile dosya zamanına çevrilir.
+    """
+
+    def __init__(self, spans, total, sr=SAMPLE_RATE):
+        self.spans = np.asarray(spans, dtype=np.int64).reshape(-1, 2)
+        self.total = int(total)
+        self.sr = sr
+        self._lens = self.spans[:, 1] - self.spans[:, 0]
+        # Her bölgenin sıkıştırılmış sesteki başlangıcı
+        self._cum = np.concatenate(([0], np.cumsum(self._lens)))
+
+    @property
+    def kept(self):
+        """Korunan örnek sayısı."""
+        return int(self._cum[-1])
+
+    @property
+    def skipped_ratio(self):
+        """Atlanan sesin oranı (0-1)."""
+        return 1.0 - self.kept / self.total if self.total else 0.0
+
+    def compact(self, audio):
+        """Konuşma bölgelerini art arda ekler."""
+        if not len(self.spans):
+            return audio[:0]
+        return np.concatenate([audio[a:b] for a, b in self.spans])
+
+    def to_original(self, seconds, end=False):
+        """
+        Sıkıştırılmış zamanları orijinal zamana çevirir.
+
+        Tam bölge sınırına düşen bir zaman, başlangıçsa sonraki bölgenin başına,
+        bitişse (end=True) önceki bölgenin sonuna eşlenir; böylece atlanan
+        sessizlik hiçbir segmentin içine düşmez.
+        """
+        c = np.asarray(seconds, dtype=np.float64) * self.sr
+        k = np.searchsorted(self._cum, c, side="left" if end else "right") - 1
+        k = np.clip(k, 0, len(self.spans) - 1)
+        return (self.spans[k, 0] + np.clip(c - self._cum[k], 0, self._lens[k])) / self.sr
+
+    def remap_segments(self, segments):
+        """
+        Segment (ve varsa kelime) zamanlarını orijinal zaman çizgisine taşır (yerinde).
+
+        Returns:
+            Aynı liste
+        """
+        items = [it for s in segments for it in [s] + s.get("words", []) if "start" in it and "end" in it]
+        if not items or not len(self.spans):
+            return segments
+        starts = self.to_original([it["start"] for it in items])
+        ends = self.to_original([it["end"] for it in items], end=True)
+        for it, a, b in zip(items, starts, ends):
+            it["start"] = round(float(a), 3)
+            it["end"] = round(float(max(a, b)), 3)
+        return segments
+
+
+def plan_speech(probs, threshold, total, min_silence_s=2.0, pad_s=0.3, sr=SAMPLE_RATE):
+    """
+    VAD haritasından sıkıştırma planı çıkarır.
+
+    min_silence_s'den uzun konuşmasız aralıklar atılır; kalan bölgelerin iki
+    yanında pad_s kadar sessizlik bırakılır (Nefes payı + Whisper'ın cümleleri
+    ayırabilmesi için).
+
+    Args:
+        probs: VAD olasılık haritası (VAD_HOP adımlı)
+        threshold: Konuşma eşiği
+        total: Ses uzunluğu (örnek)
+        min_silence_s: Atlanacak en kısa sessizlik (saniye)
+        pad_s: Konuşma kenarlarında bırakılan pay (saniye)
+
+    Returns:
+        SpeechPlan (Hiç konuşma yoksa tüm ses korunur)
+    """
+    m = len(probs)
+    speech = np.asarray(probs) > np.float32(threshold)
+    if m == 0 or not speech.any():
+        return SpeechPlan([(0, total)], total, sr)
+
+    silent = np.concatenate(([0], (~speech).astype(np.int8), [0]))
+    edges = np.flatnonzero(np.diff(silent))
+    sil_s, sil_e = edges[0::2], edges[1::2]
+
+    # Dosya başı/sonu dışındaki sessizliklerde iki yana pay bırak
+    pad = int(round(pad_s * sr / VAD_HOP))
+    cut_s = np.where(sil_s > 0, sil_s + pad, 0)
+    cut_e = np.where(sil_e < m, sil_e - pad, m)
+    long_gap = (cut_e - cut_s) * VAD_HOP >= min_silence_s * sr
+    cut_s = np.minimum(cut_s[long_gap] * VAD_HOP, total)
+    cut_e = np.minimum(cut_e[long_gap] * VAD_HOP, total)
+
+    # Korunanlar = kesimlerin tümleyeni
+    keep_s = np.concatenate(([0], cut_e))
+    keep_e = np.concatenate((cut_s, [total]))
+    nonempty = keep_e > keep_s
+    return SpeechPlan(np.stack((keep_s[nonempty], keep_e[nonempty]), axis=1), total, sr)
+
+
+# =============================================================================
+# WHISPERX VAD YENİDEN KULLANIMI
+# =============================================================================
+
+# Yakalanan çıktı ancak sesin bu kadarını kapsıyorsa kullanılır
+REUSE_MIN_COVERAGE = 0.98
+
+# Kare skorlarında kabul edilen en kaba adım (saniye, Silero haritasının 2 katı)
+REUSE_MAX_STEP = 2 * VAD_HOP / SAMPLE_RATE
+
+
+class _CapturingVad:
+    """
+    whisperx pipeline'ının VAD modeline karışan sınıf: Her çağrının çıktısını saklar.
+
+    Sınıf, modelin kendi sınıfından türetilir; whisperx'in isinstance/issubclass
+    kontrolleri (Silero/Pyannote ayrımı) değişmez.
+    """
+
+    def __call__(self, *args, **kwargs):
+        out = super().__call__(*args, **kwargs)
+        self._vad_output = out
+        return out
+
+    def take_vad_output(self):
+        """Son çıktıyı döndürür ve unutur."""
+        out = getattr(self, "_vad_output", None)
+        self._vad_output = None
+        return out
+
+
+_CAPTURE_CLASSES = {}
+
+
+def install_vad_capture(pipeline):
+    """
+    whisperx ASR pipeline'ının vad_model'ine çıktı yakalayıcı takar (Bir kez).
+
+    Args:
+        pipeline: whisperx.load_model() sonucu
+
+    Returns:
+        Yakalayan VAD modeli veya takılamazsa None
+    """
+    model = getattr(pipeline, "vad_model", None)
+    if model is None:
+        return None
+    if isinstance(model, _CapturingVad):
+        return model
+
+    base = type(model)
+    cls = _CAPTURE_CLASSES.get(base)
+    if cls is None:
+        cls = type(f"Capturing{base.__name__}", (_CapturingVad, base), {})
+        _CAPTURE_CLASSES[base] = cls
+    try:
+        model.__class__ = cls
+    except TypeError:
+        # Uzantı (C/TorchScript) tipleri sınıf değişimine izin vermez
+        return None
+    model._vad_output = None
+    return model
+
+
+def _region_bounds(regions):
+    """Segment nesneleri, dict'ler veya (start, end) çiftlerinden saniye dizileri."""
+    starts, ends = [], []
+    for r in regions:
+        if isinstance(r, dict):
+            a, b = r.get("start"), r.get("end")
+        elif hasattr(r, "start") and hasattr(r, "end"):
+            a, b = r.start, r.end
+        else:
+            a, b = r[0], r[1]
+        starts.append(float(a))
+        ends.append(float(b))
+    return np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64)
+
+
+def vad_output_to_map(output, total, sr=SAMPLE_RATE):
+    """
+    whisperx VAD çıktısını Silero haritasıyla aynı ızgaraya (VAD_HOP) taşır.
+
+    Desteklenen çıktılar:
+        Kare skorları (pyannote SlidingWindowFeature: data + sliding_window)
+            -> skorlar harita pencere merkezlerine doğrusal aradeğerlenir
+        Konuşma bölgeleri (Silero segmentleri, dict'ler, (start, end) çiftleri)
+            -> bölge içi 1, dışı 0
+
+    Yetersiz çıktı (sesi REUSE_MIN_COVERAGE kadar kapsamayan ya da adımı
+    REUSE_MAX_STEP'ten kaba skorlar) reddedilir; o zaman Silero çalışır.
+
+    Args:
+        output: Yakalanan vad_model çıktısı
+        total: Ses uzunluğu (örnek)
+        sr: Örnekleme hızı
+
+    Returns:
+        (harita (MAP_DTYPE), "scores" | "regions") veya kullanılamazsa None
+    """
+    if output is None or total <= 0:
+        return None
+
+    m = -(-int(total) // VAD_HOP)
+    duration = total / sr
+    centers = (np.arange(m) + 0.5) * VAD_HOP / sr
+
+    window = getattr(output, "sliding_window", None)
+    if window is not None and hasattr(output, "data"):
+        data = np.asarray(output.data, dtype=np.float32)
+        if data.ndim > 1:
+            data = data.reshape(len(data), -1).max(axis=1)
+        if data.size == 0 or float(window.step) > REUSE_MAX_STEP:
+            return None
+        frame_t = float(window.start) + float(window.duration) / 2 + np.arange(data.size) * float(window.step)
+        covered = frame_t[-1] + float(window.step) / 2 - max(0.0, frame_t[0] - float(window.step) / 2)
+        if covered < REUSE_MIN_COVERAGE * duration:
+            return None
+        probs = np.interp(centers, frame_t, data)
+        return np.clip(probs, 0.0, 1.0).astype(MAP_DTYPE), "scores"
+
+    try:
+        starts, ends = _region_bounds(output)
+    except (TypeError, ValueError, IndexError, KeyError):
+        return None
+    if starts.size == 0:
+        return None
+
+    # Bölgeler whisperx'in tüm sesi işlediğini varsayar (Kapsam ölçülemez)
+    order = np.argsort(starts)
+    starts, ends = starts[order], ends[order]
+    idx = np.searchsorted(starts, centers, side="right") - 1
+    inside = (idx >= 0) & (centers < np.maximum.accumulate(ends)[np.maximum(idx, 0)])
+    return inside.astype(MAP_DTYPE), "regions"
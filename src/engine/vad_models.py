@@ -0,0 +1,266 @@
+"""
+WHIXPI Pro V1.0 - VAD Model Kayıt Defteri
+==========================================
+Silero VAD'ı torch.hub çözümlemesine (ağ/hub önbelleği) gitmeden yerel
+dosyalardan yükler ve CPU makineleri için isteğe bağlı ONNX Runtime
+arka ucu sunar.
+
+Aranan klasörler (EXE yanı veya proje kökü):
+    models/silero_vad/, resources/silero_vad/, models/, resources/
+Aranan dosyalar:
+    silero_vad.jit   -> torch arka ucu (torch.jit.load)
+    silero_vad.onnx  -> onnx arka ucu (onnxruntime gerekir)
+    models/silero-vad/hubconf.py (Deponun yerel kopyası) -> torch.hub, source="local"
+Hiçbiri yoksa eski davranış: torch.hub.load('snakers4/silero-vad').
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src.engine.vad import SAMPLE_RATE, VAD_HOP, MAP_DTYPE
+
+
+# Arka uç seçenekleri ("auto": CPU işçilerinde ONNX, diğerlerinde torch)
+BACKENDS = ("torch", "onnx", "auto")
+
+JIT_NAME = "silero_vad.jit"
+ONNX_NAME = "silero_vad.onnx"
+HUB_REPO = "snakers4/silero-vad"
+
+# Silero v5 ONNX: Her pencerenin önüne önceki 64 örnek (16 kHz) bağlam olarak eklenir
+_V5_CONTEXT = 64
+
+
+# =============================================================================
+# KAYIT DEFTERİ
+# =============================================================================
+
+def model_dirs():
+    """
+    Yerel VAD modellerinin aranacağı klasörler (Öncelik sırasıyla).
+
+    Returns:
+        Klasör yolları listesi
+    """
+    if getattr(sys, 'frozen', False):
+        bases = [os.path.dirname(sys.executable)]
+    else:
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        bases = [os.getcwd(), project_root]
+
+    dirs = []
+    for base in dict.fromkeys(bases):
+        for sub in (("models", "silero_vad"), ("resources", "silero_vad"), ("models",), ("resources",)):
+            dirs.append(os.path.join(base, *sub))
+    return dirs
+
+
+def _find_file(name):
+    for d in model_dirs():
+        path = os.path.join(d, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _find_hub_repo():
+    """Yerel silero-vad deposu kopyası (hubconf.py içeren klasör)."""
+    for d in model_dirs():
+        for name in ("silero-vad", "silero_vad"):
+            path = os.path.join(d, name)
+            if os.path.isfile(os.path.join(path, "hubconf.py")):
+                return path
+    return None
+
+
+def onnx_available():
+    """onnxruntime kurulu mu?"""
+    try:
+        import onnxruntime  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class VadSpec:
+    """
+    Yüklenecek VAD modelinin tarifi (Dosya araması yapar, model yüklemez).
+
+    tag, aşama önbelleği anahtarına girer: farklı model dosyası veya arka uç
+    farklı harita üretir. Hub yolunun etiketi eski anahtarlarla uyumlu kalır.
+    """
+
+    def __init__(self, backend, source, path=None):
+        """
+        Args:
+            backend: "torch" veya "onnx"
+            source: "jit", "onnx", "hub_local" veya "hub"
+            path: Dosya/klasör yolu (hub için depo adı)
+        """
+        self.backend = backend
+        self.source = source
+        self.path = path
+
+    @property
+    def tag(self):
+        if self.source == "hub":
+            return "silero_vad"
+        try:
+            size = os.path.getsize(self.path) if os.path.isfile(self.path) else 0
+        except OSError:
+            size = 0
+        return f"{self.backend}:{self.source}:{os.path.basename(self.path)}:{size}"
+
+    @property
+    def label(self):
+        """Log için kısa açıklama."""
+        return {
+            "jit": "Yerel TorchScript",
+            "onnx": "Yerel ONNX (CPU)",
+            "hub_local": "Yerel Hub Kopyası",
+            "hub": "torch.hub"
+        }.get(self.source, self.source)
+
+
+def resolve_vad(backend="torch", device="cpu"):
+    """
+    İstenen arka uç ve cihaz için kullanılacak VAD modelini bulur.
+
+    "onnx" istenip ONNX dosyası veya onnxruntime yoksa torch'a düşülür.
+
+    Args:
+        backend: "torch", "onnx" veya "auto"
+        device: İşçinin cihazı ("cpu", "cuda", "cuda:1")
+
+    Returns:
+        VadSpec
+    """
+    want_onnx = backend == "onnx" or (backend == "auto" and str(device).startswith("cpu"))
+    if want_onnx:
+        onnx_path = _find_file(ONNX_NAME)
+        if onnx_path and onnx_available():
+            return VadSpec("onnx", "onnx", onnx_path)
+
+    jit_path = _find_file(JIT_NAME)
+    if jit_path:
+        return VadSpec("torch", "jit", jit_path)
+
+    repo = _find_hub_repo()
+    if repo:
+        return VadSpec("torch", "hub_local", repo)
+
+    return VadSpec("torch", "hub", HUB_REPO)
+
+
+def load_vad(spec, device="cpu", threads=0):
+    """
+    VadSpec'e göre modeli yükler.
+
+    Args:
+        spec: resolve_vad() sonucu
+        device: torch arka ucu için cihaz
+        threads: ONNX için thread sayısı (0 = çekirdek sayısı)
+
+    Returns:
+        torch modeli veya OnnxVad
+    """
+    if spec.backend == "onnx":
+        return OnnxVad(spec.path, threads=threads)
+
+    import torch
+
+    if spec.source == "jit":
+        model = torch.jit.load(spec.path, map_location=device)
+    elif spec.source == "hub_local":
+        model, _ = torch.hub.load(repo_or_dir=spec.path, model='silero_vad', source='local',
+                                  trust_repo=True, verbose=False)
+    else:
+        model, _ = torch.hub.load(repo_or_dir=HUB_REPO, model='silero_vad',
+                                  force_reload=False, trust_repo=True, verbose=False)
+    return model.to(device)
+
+
+# =============================================================================
+# ONNX ARKA UCU (CPU)
+# =============================================================================
+
+class OnnxVad:
+    """
+    Silero VAD ONNX modeli (onnxruntime, CPU).
+
+    Her 512 örneklik pencere ayrı bir satır olarak toplu işlenir (durum sıfırdan
+    başlar); toplu iş thread'lere bölünür ve onnxruntime GIL'i bıraktığı için
+    paralel çalışır. compute_vad_map() bu nesneyi predict_audio() ile kullanır.
+    """
+
+    def __init__(self, path, threads=0):
+        """
+        Args:
+            path: silero_vad.onnx yolu
+            threads: Paralel oturum çağrısı sayısı (0 = çekirdek sayısı)
+        """
+        import onnxruntime as ort
+
+        self.threads = max(1, int(threads or os.cpu_count() or 1))
+
+        # Küçük LSTM: İç paralellik yerine toplu işi thread'lere bölmek daha verimli
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = 1
+        opts.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(path, sess_options=opts, providers=["CPUExecutionProvider"])
+
+        inputs = {i.name for i in self.session.get_inputs()}
+        # v5: "state" [2, B, 128] + bağlam; v4: "h"/"c" [2, B, 64]
+        self._v5 = "state" in inputs
+        self._sr = np.array(SAMPLE_RATE, dtype=np.int64)
+        self._pool = ThreadPoolExecutor(max_workers=self.threads) if self.threads > 1 else None
+
+    def _run(self, windows):
+        """Bir pencere bloğunun konuşma olasılıkları."""
+        x = np.ascontiguousarray(windows, dtype=np.float32)
+        k = len(x)
+        feeds = {"input": x, "sr": self._sr}
+        if self._v5:
+            feeds["state"] = np.zeros((2, k, 128), dtype=np.float32)
+        else:
+            feeds["h"] = np.zeros((2, k, 64), dtype=np.float32)
+            feeds["c"] = np.zeros((2, k, 64), dtype=np.float32)
+        return self.session.run(None, feeds)[0].reshape(-1)
+
+    def predict_audio(self, audio_np, meta_batch=20000, stop_event=None, sr=SAMPLE_RATE):
+        """
+        Tüm ses için olasılık haritası (compute_vad_map ile aynı biçim).
+
+        Returns:
+            np.ndarray (MAP_DTYPE) veya durdurulduysa None
+        """
+        n = len(audio_np)
+        m = -(-n // VAD_HOP)
+        ctx = _V5_CONTEXT if self._v5 else 0
+
+        padded = np.zeros(ctx + m * VAD_HOP, dtype=np.float32)
+        padded[ctx:ctx + n] = audio_np
+        windows = np.lib.stride_tricks.sliding_window_view(padded, VAD_HOP + ctx)[::VAD_HOP]
+
+        out = np.empty(m, dtype=np.float32)
+        for i in range(0, m, meta_batch):
+            if stop_event is not None and stop_event.is_set():
+                return None
+            block = windows[i:i + meta_batch]
+            parts = np.array_split(block, min(self.threads, len(block)))
+            if self._pool is not None and len(parts) > 1:
+                probs = list(self._pool.map(self._run, parts))
+            else:
+                probs = [self._run(p) for p in parts]
+            out[i:i + len(block)] = np.concatenate(probs)
+
+        return out.astype(MAP_DTYPE)
+
+    def close(self):
+        """Thread havuzunu kapatır."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
@@ -9,8 +9,13 @@ import os
 import sys
 import gc
 import time
+import queue
+import threading
 import numpy as np
 from pathlib import Path
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import torch
 import torch.multiprocessing as mp
@@ -20,9 +25,299 @@ whisperx = None
 
 from src.engine.logic import (
     waveform_finetune_chronos,
-    chronos_seamless_core,
-    miller_hybrid_split
+    reformat_aligned
 )
+from src.engine.cache import StageCache
+from src.engine.vad_models import resolve_vad, load_vad
+from src.engine.export import partial_srt_path, append_srt
+from src.engine.transcript import compact_aligned, SegmentList, WordList
+from src.engine.vad import (
+    VadAnalysis, MAP_DTYPE, compute_vad_map, plan_speech, solve_boundaries,
+    Calibration, FIXED_CALIBRATION, calibrate_vad,
+    install_vad_capture, vad_output_to_map
+)
+from src.engine.longform import (
+    LongAudio,
+    make_long_loader,
+    load_audio_window,
+    find_silence_cut,
+    offset_aligned
+)
+
+
+def flush_memory():
+    """Python çöp toplayıcısını ve CUDA önbelleğini boşaltır."""
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+# =============================================================================
+# MODEL YAŞAM DÖNGÜSÜ (Model Lifecycle)
+# =============================================================================
+
+class ModelManager:
+    """
+    Whisper modelini kuyruktaki tüm dosyalar boyunca bellekte tutar.
+
+    Model, (model yolu, cihaz, compute_type, dil, asr_options) anahtarıyla
+    bir kez yüklenir ve sonraki dosyalarda yeniden kullanılır. Anahtar
+    değiştiğinde veya bellek politikası gerektirdiğinde boşaltılır.
+
+    Politikalar:
+        "keep":  Model batch boyunca bellekte kalır (varsayılan)
+        "flush": Her dosyadan sonra boşaltılır (Agresif Bellek Temizliği / EKO)
+    """
+
+    POLICIES = ("keep", "flush")
+
+    def __init__(self, log_q, policy="keep"):
+        """
+        Args:
+            log_q: Log mesajları için multiprocessing.Queue
+            policy: Bellek politikası ("keep" veya "flush")
+        """
+        self.log_q = log_q
+        self.policy = policy if policy in self.POLICIES else "keep"
+
+        self._model = None
+        self._key = None
+        self.load_count = 0
+        self.reuse_count = 0
+        self.last_load_time = 0.0
+
+    @staticmethod
+    def make_key(model_path, device, compute_type, language, asr_options, **load_kwargs):
+        """Model önbellek anahtarını üretir (asr_options sıralı tuple olur)."""
+        opts = tuple(sorted((asr_options or {}).items()))
+        extra = tuple(sorted(load_kwargs.items()))
+        return (str(model_path), device, compute_type, language, opts, extra)
+
+    @property
+    def is_loaded(self):
+        return self._model is not None
+
+    def get(self, model_path, device, compute_type, language, asr_options, **load_kwargs):
+        """
+        Anahtara uyan modeli döndürür; yoksa yükler.
+
+        Args:
+            load_kwargs: whisperx.load_model'e aynen iletilen ek ayarlar
+                (device_index, threads)
+
+        Returns:
+            whisperx ASR pipeline nesnesi
+        """
+        key = self.make_key(model_path, device, compute_type, language, asr_options, **load_kwargs)
+
+        if self._model is not None and key == self._key:
+            self.reuse_count += 1
+            self.log_q.put(
+                f"   ♻️ Model Bellekte: Yeniden Kullanım #{self.reuse_count} "
+                f"(Tasarruf: ~{self.last_load_time:.1f}s)"
+            )
+            return self._model
+
+        if self._model is not None:
+            self.log_q.put("   🔄 Model ayarları değişti, eski model boşaltılıyor...")
+            self.release()
+
+        t_load = time.time()
+        self._model = whisperx.load_model(
+            model_path,
+            device,
+            compute_type=compute_type,
+            language=language,
+            asr_options=asr_options,
+            **load_kwargs
+        )
+        self.last_load_time = time.time() - t_load
+        self._key = key
+        self.load_count += 1
+        self.reuse_count = 0
+
+        self.log_q.put(
+            f"   📦 Model Yüklendi: {self.last_load_time:.1f}s "
+            f"[Politika: {self.policy.upper()} | Yükleme #{self.load_count}]"
+        )
+        return self._model
+
+    def after_file(self):
+        """Dosya bittiğinde politikaya göre modeli boşaltır."""
+        if self.policy == "flush" and self._model is not None:
+            self.release()
+            self.log_q.put("   🧹 VRAM Arındırıldı (Agresif Bellek Temizliği).")
+
+    def release(self):
+        """Modeli bellekten tamamen çıkarır."""
+        if self._model is None:
+            return
+        self._model = None
+        self._key = None
+        flush_memory()
+
+
+class AlignModelCache:
+    """
+    Wav2Vec2 hizalama modelleri için LRU önbelleği.
+
+    (dil, model adı, cihaz) anahtarıyla (model_a, metadata) çiftini worker
+    ömrü boyunca tutar. Kapasite aşılırsa en uzun süredir kullanılmayan
+    model boşaltılır.
+    """
+
+    def __init__(self, log_q, max_size=2):
+        """
+        Args:
+            log_q: Log mesajları için multiprocessing.Queue
+            max_size: Aynı anda bellekte tutulacak en fazla model sayısı
+        """
+        self.log_q = log_q
+        self.max_size = max(1, int(max_size))
+        self._cache = OrderedDict()
+        self.load_count = 0
+        self.hit_count = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, language, model_name, device):
+        """
+        Hizalama modelini önbellekten döndürür; yoksa yükler.
+
+        Returns:
+            (model_a, metadata) çifti
+        """
+        key = (language, model_name, device)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hit_count += 1
+            self.log_q.put(f"   ♻️ Hizalama Modeli Bellekte: [{language.upper()}] Yeniden Kullanım #{self.hit_count}")
+            return self._cache[key]
+
+        t_load = time.time()
+        model_a, metadata = whisperx.load_align_model(
+            language_code=language,
+            device=device,
+            model_name=model_name
+        )
+        self.load_count += 1
+        self.log_q.put(f"   📦 Hizalama Modeli Yüklendi: [{language.upper()}] {time.time() - t_load:.1f}s")
+
+        self._cache[key] = (model_a, metadata)
+        while len(self._cache) > self.max_size:
+            old_key, _ = self._cache.popitem(last=False)
+            self.log_q.put(f"   🧹 Hizalama Modeli Boşaltıldı (LRU): [{old_key[0].upper()}]")
+            flush_memory()
+
+        return model_a, metadata
+
+    def clear(self):
+        """Tüm hizalama modellerini bellekten çıkarır."""
+        if not self._cache:
+            return
+        self._cache.clear()
+        flush_memory()
+
+
+# =============================================================================
+# SES ÖN YÜKLEME (Audio Prefetch)
+# =============================================================================
+
+class AudioPrefetcher:
+    """
+    Kuyruktaki sıradaki dosyaların sesini arka planda çözer.
+
+    Mevcut dosya GPU'da işlenirken sonraki en fazla `depth` dosya bir arka
+    plan thread'inde ffmpeg ile 16 kHz float32'ye çözülür. Hazır bekleyen
+    seslerin toplam boyutu `mem_budget_mb` sınırını aşarsa yeni çözme
+    başlatılmaz.
+
+    Görevler bir liste veya paylaşılan bir kuyruktan (Worker Pool) gelen
+    (idx, yol) çiftleridir; yineleme (idx, yol, fetch) üçlüsü döndürür.
+    fetch() çağrısı (audio, decode_süresi, bekleme_süresi) verir.
+
+    Kullanım:
+        prefetch = AudioPrefetcher(enumerate(paths, 1), whisperx.load_audio)
+        for idx, path, fetch in prefetch:
+            audio, t_decode, t_wait = fetch()
+    """
+
+    def __init__(self, tasks, loader, depth=2, mem_budget_mb=2048):
+        """
+        Args:
+            tasks: (idx, yol) çiftleri üreten iterable (işlenme sırasıyla)
+            loader: Ses çözücü fonksiyon (örn: whisperx.load_audio)
+            depth: Önden çözülecek en fazla dosya sayısı (0 = kapalı)
+            mem_budget_mb: Hazır bekleyen sesler için bellek sınırı (MB)
+        """
+        self.tasks = tasks
+        self.loader = loader
+        self.depth = max(0, depth)
+        self.mem_budget = max(0, mem_budget_mb) * 1024 * 1024
+
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whixpi-decode") if self.depth else None
+        self._pending = deque()
+
+    def _decode(self, path):
+        t_start = time.time()
+        audio = self.loader(path)
+        return audio, time.time() - t_start
+
+    def _ready_bytes(self):
+        """Çözülmüş ama henüz alınmamış seslerin toplam boyutu."""
+        total = 0
+        for _, _, fut in self._pending:
+            if fut.done() and not fut.cancelled() and fut.exception() is None:
+                total += fut.result()[0].nbytes
+        return total
+
+    def _fill(self, source, target):
+        """Bekleyen çözme sayısını bellek sınırı içinde `target`'a tamamlar."""
+        while len(self._pending) < target:
+            if self._pending and self._ready_bytes() >= self.mem_budget:
+                break
+            task = next(source, None)
+            if task is None:
+                break
+            idx, path = task
+            self._pending.append((idx, path, self._pool.submit(self._decode, path)))
+
+    def _wait(self, future):
+        t_wait = time.time()
+        audio, t_decode = future.result()
+        return audio, t_decode, time.time() - t_wait
+
+    def _sync(self, path):
+        audio, t_decode = self._decode(path)
+        return audio, t_decode, t_decode
+
+    def __iter__(self):
+        source = iter(self.tasks)
+
+        if self._pool is None:
+            for idx, path in source:
+                yield idx, path, partial(self._sync, path)
+            return
+
+        while True:
+            self._fill(source, 1)
+            if not self._pending:
+                return
+            idx, path, future = self._pending.popleft()
+            # Mevcut dosya işlenirken sıradakiler çözülmeye başlasın
+            self._fill(source, self.depth)
+            yield idx, path, partial(self._wait, future)
+
+    def close(self):
+        """Bekleyen çözmeleri iptal eder ve thread'i kapatır."""
+        if self._pool is None:
+            return
+        for _, _, fut in self._pending:
+            fut.cancel()
+        self._pending.clear()
+        self._pool.shutdown(wait=False)
 
 
 class TranscriptionWorker(mp.Process):
@@ -50,7 +345,11 @@ class TranscriptionWorker(mp.Process):
         vram_profile, 
         align_engine, 
         bridge_ms, 
-        word_bridge_ms
+        word_bridge_ms,
+        device=None,
+        cpu_threads=0,
+        task_q=None,
+        worker_id=None
     ):
         """
         Args:
@@ -68,6 +367,10 @@ class TranscriptionWorker(mp.Process):
             word_bridge_ms: Kelime köprüleme eşiği (ms)
             bridge_ms: Köprüleme süresi (ms)
             word_bridge_ms: Kelime köprüleme eşiği (ms)
+            device: Sabit cihaz ("cuda:0", "cuda:1", "cpu"); None = otomatik
+            cpu_threads: CPU thread bütçesi (0 = kütüphane varsayılanı)
+            task_q: Worker Pool modunda dosyaların çekildiği paylaşılan kuyruk
+            worker_id: Worker Pool içindeki işçi numarası
         """
         super().__init__()
         
@@ -84,372 +387,943 @@ class TranscriptionWorker(mp.Process):
         self.bridge_ms = bridge_ms
         self.word_bridge_ms = word_bridge_ms
         self.stop_event = mp.Event()
-        
+        self.job_id = None
+        self.device_request = device
+        self.device = None
+        self.device_index = 0
+        self.cpu_threads = int(cpu_threads or 0)
+        self.task_q = task_q
+        self.worker_id = worker_id
+        self._stop_reported = False
+
+        # Whisper Model Yöneticisi (Dosyalar arası kalıcı model)
+        default_policy = "flush" if config.get("mem_flush") else "keep"
+        self.models = ModelManager(log_q, policy=config.get("model_policy", default_policy))
+        self.align_models = AlignModelCache(log_q, max_size=config.get("align_cache_size", 2))
+        self._model_path = None
+        self.stage_cache = self._make_stage_cache(config)
+
         # VAD Cache Değişkenleri
         self._vad_model = None
         self._vad_utils = None
         self._vad_device = None
+        self._vad_lock = None
     
     def run(self):
         """Ana işlem döngüsü."""
+        self._boot()
+        self.process_queue()
+        self.unload_models()
+    
+    def _boot(self):
+        """Süreç başlangıcı: whisperx importu ve donanım tespiti (Tek seferlik)."""
         
         # Lazy import - whisperx sadece worker process'te yüklenir
         global whisperx
         import whisperx as wx
         whisperx = wx
         
+        # VAD modeli durumludur; GPU aşaması ve CPU hattı aynı anda kullanamaz
+        # (Kilit süreç içinde oluşturulur, spawn ile taşınamaz)
+        self._vad_lock = threading.Lock()
+        
         # --- EARLY FEEDBACK SYSTEM ---
         self.log_q.put("🚀 [OMEGA] Whixpi İşlem Merkezi Başlatıldı...")
         
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.log_q.put(f"📡 Donanım Algılandı: [{device.upper()}]")
+        if self.device_request:
+            # Worker Pool: İşçi belirli bir cihaza sabitlenir ("cuda:1" -> cuda + index 1)
+            dev, _, index = str(self.device_request).partition(":")
+            self.device = dev
+            self.device_index = int(index or 0)
+        else:
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        
+        if self.device == "cuda":
+            torch.cuda.set_device(self.device_index)
+        if self.cpu_threads > 0:
+            torch.set_num_threads(self.cpu_threads)
+        
+        dev_label = f"{self.device}:{self.device_index}" if self.device == "cuda" else self.device
+        thread_label = f" | Thread: {self.cpu_threads}" if self.cpu_threads > 0 else ""
+        self.log_q.put(f"📡 Donanım Algılandı: [{dev_label.upper()}{thread_label}]")
+    
+    def _emit(self, msg):
+        """result_q'ya iş kimliğiyle birlikte mesaj gönderir."""
+        msg["job_id"] = self.job_id
+        if self.worker_id is not None:
+            msg["worker"] = self.worker_id
+        self.result_q.put(msg)
+    
+    def _iter_tasks(self):
+        """
+        İşlenecek (idx, yol) çiftlerini üretir.
         
+        Normal modda audio_list sırayla döner. Worker Pool modunda dosyalar
+        paylaşılan task_q'dan çekilir; boşta kalan işçi sıradaki dosyayı alır.
+        Başka işe ait (iptal edilmiş) görevler atlanır.
+        """
+        if self.task_q is None:
+            yield from enumerate(self.audio_list, 1)
+            return
+        
+        while True:
+            job_id, idx, path = self.task_q.get()
+            if job_id != self.job_id:
+                continue
+            if path is None:
+                return
+            yield idx, path
+    
+    def unload_models(self):
+        """Bellekteki tüm modelleri (Whisper, Wav2Vec2, VAD) boşaltır."""
+        self.models.release()
+        self.align_models.clear()
+        if hasattr(self._vad_model, "close"):
+            self._vad_model.close()
+        self._vad_model = None
+        self._vad_utils = None
+        flush_memory()
+    
+    def process_queue(self):
+        """audio_list'teki dosyaları işler ve sonuçları sırayla result_q'ya gönderir."""
         total = len(self.audio_list)
         should_exit = False
+        self._stop_reported = False
         
-        for idx, audio_path in enumerate(self.audio_list, 1):
+        # Sıradaki dosyaların sesi GPU çalışırken arka planda çözülür
+        # Uzun dosyalar (long_file_min dakikadan uzun) önden çözülmez, pencere modunda okunur
+        # Worker Pool: Önden çekme kapalı; işçi paylaşılan kuyruktan sadece GPU
+        # aşaması boşaldığında dosya alır (Yük dengesi korunur)
+        loader = make_long_loader(
+            whisperx.load_audio,
+            float(self.config.get("long_file_min", 30)) * 60
+        )
+        prefetch_depth = 0 if self.task_q is not None else int(self.config.get("prefetch_depth", 2))
+        prefetch = AudioPrefetcher(
+            self._iter_tasks(),
+            loader,
+            depth=prefetch_depth,
+            mem_budget_mb=int(self.config.get("prefetch_mem_mb", 2048))
+        )
+        
+        # Stage Pipeline: Adım 1-2 (GPU) bu thread'de, Adım 3-4 (CPU) ayrı
+        # tek thread'li executor'da. Tek thread FIFO çalıştığı için sonuç sırası korunur.
+        pipe_depth = int(self.config.get("pipeline_depth", 1))
+        use_pipeline = (
+            self.config.get("pipeline", True)
+            and pipe_depth > 0
+            and total > 1
+            and self.models.policy != "flush"
+        )
+        cpu_stage = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whixpi-cpu") if use_pipeline else None
+        pending = deque()
+        
+        if use_pipeline:
+            self.log_q.put(f"   🔀 Stage Pipeline Aktif: GPU ve CPU adımları paralel (Derinlik: {pipe_depth})")
+        
+        for idx, audio_path, fetch in prefetch:
             if self.stop_event.is_set() or should_exit:
                 self.log_q.put(self.L.get("stopped", "İşlem durduruldu."))
                 break
             
-            file_success = False
-            res_data = None
-            
+            ctx = None
             try:
-                # --- VRAM CONFIG ---
-                v_prof = self.vram_profile
-                v_map = {
-                    # Sonic: Batch kullanıcıdan, Beam kullanıcıdan
-                    "vram_sonic": (
-                        int(self.config.get("batch_size", 32)), 
-                        int(self.config.get("beam_size", 1)), 
-                        "float16"
-                    ),
-                    # Custom: Batch kullanıcıdan, Beam kullanıcıdan
-                    "vram_custom": (
-                        int(self.config.get("batch_size", 8)), 
-                        int(self.config.get("beam_size", 5)), 
-                        "float16"
-                    ),
-                    "vram_ultra": (10, 20, "float16"),   # Eski 16GB Safe
-                    "vram_high": (10, 10, "float16"),    # Eski 12GB
-                    "vram_mid": (6, 5, "int8"),          # Eski 8GB
-                    "vram_eko": (1, 1, "int8")           # Eski 4GB
-                }
-                # Fallback: Batch 4, Beam 5 (vram_prof tanınmazsa)
-                batch_size, b_size, compute_type = v_map.get(v_prof, (4, 5, "float16"))
-                
-                # Proactive Flush
-                gc.collect()
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                
-                self.log_q.put(f"   ⚙️ VRAM Planı: [Oda: {v_prof} | Batch: {batch_size} | Beam: {b_size}]")
-                
-                base_name = Path(audio_path).stem
+                ctx = self._gpu_stage(idx, total, audio_path, fetch)
+            except Exception as e:
+                self._log_file_error(audio_path, e)
+            finally:
+                # Model politikası (flush ise dosya sonunda boşalt)
+                self.models.after_file()
+                if self.models.policy == "flush":
+                    self.align_models.clear()
+            
+            if cpu_stage is None:
+                should_exit = self._cpu_task(idx, total, audio_path, ctx)
+                continue
+            
+            # Sınırlı kuyruk: CPU en fazla pipe_depth dosya geride kalabilir
+            while len(pending) >= pipe_depth:
+                should_exit = pending.popleft().result() or should_exit
+            pending.append(cpu_stage.submit(self._cpu_task, idx, total, audio_path, ctx))
+            ctx = None
+        
+        while pending:
+            should_exit = pending.popleft().result() or should_exit
+        if cpu_stage is not None:
+            cpu_stage.shutdown(wait=True)
+        
+        prefetch.close()
+        
+        if self.models.load_count:
+            self.log_q.put(
+                f"   📊 Model İstatistiği: Whisper {self.models.load_count} yükleme, "
+                f"Hizalama {self.align_models.load_count} yükleme, "
+                f"{total} dosya [Politika: {self.models.policy.upper()}]"
+            )
+        
+        if self.task_q is not None:
+            self._emit({"type": "worker_exit"})
+        elif not should_exit:
+            self.log_q.put(self.L.get("all_done", "🏁 TÜM İŞLEMLER TAMAMLANDI!"))
+    
+    @staticmethod
+    def _make_stage_cache(config):
+        """Aşama önbelleğini config'e göre oluşturur ("stage_cache": False ile kapanır)."""
+        if not config.get("stage_cache", True):
+            return None
+        return StageCache(config.get("cache_dir"), max_mb=config.get("cache_max_mb", 4096))
+    
+    def _stage_keys(self, audio_path, compute_type, b_size, align_model_name):
+        """
+        Dosyanın aşama anahtarlarını üretir.
+        
+        Returns:
+            {"transcribe", "align", "vad", "vad_reuse"} anahtarları veya önbellek kapalıysa None
+        """
+        cache = self.stage_cache
+        if cache is None:
+            return None
+        try:
+            t_hash = time.time()
+            audio_key = cache.audio_key(audio_path)
+        except OSError as e:
+            self.log_q.put(f"   ⚠️ Önbellek Devre Dışı (Hash Hatası): {e}")
+            return None
+        
+        t_hash = time.time() - t_hash
+        if t_hash > 0.5:
+            self.log_q.put(f"   🔑 İçerik Hash: {t_hash:.1f}s")
+        
+        # Sessizlik atlama açıksa Whisper girdisi değişir (Kapalıyken anahtarlar aynı kalır)
+        skip = self._silence_skip_params()
+        k_trans = cache.make_key(
+            "transcribe", audio_key,
+            model=self.model_name, compute_type=compute_type,
+            beam=b_size, language=self.lang,
+            **({"silence_skip": skip} if skip else {})
+        )
+        k_align = cache.make_key(
+            "align", audio_key,
+            transcribe=k_trans, align_model=align_model_name or "default",
+            align_engine=self.align_engine, language=self.lang
+        )
+        k_vad = cache.make_key(
+            "vad", audio_key,
+            model=self._vad_spec().tag, chunk=512, sr=16000, dtype=np.dtype(MAP_DTYPE).name
+        )
+        # WhisperX'in kendi VAD çıktısı transkripsiyona bağlıdır (Silero haritasından ayrı)
+        k_reuse = cache.make_key("vad", audio_key, source="whisperx", transcribe=k_trans)
+        return {"transcribe": k_trans, "align": k_align, "vad": k_vad, "vad_reuse": k_reuse}
+    
+    def _vram_plan(self):
+        """VRAM profiline göre (batch_size, beam_size, compute_type) döndürür."""
+        v_map = {
+            # Sonic: Batch kullanıcıdan, Beam kullanıcıdan
+            "vram_sonic": (
+                int(self.config.get("batch_size", 32)), 
+                int(self.config.get("beam_size", 1)), 
+                "float16"
+            ),
+            # Custom: Batch kullanıcıdan, Beam kullanıcıdan
+            "vram_custom": (
+                int(self.config.get("batch_size", 8)), 
+                int(self.config.get("beam_size", 5)), 
+                "float16"
+            ),
+            "vram_ultra": (10, 20, "float16"),   # Eski 16GB Safe
+            "vram_high": (10, 10, "float16"),    # Eski 12GB
+            "vram_mid": (6, 5, "int8"),          # Eski 8GB
+            "vram_eko": (1, 1, "int8")           # Eski 4GB
+        }
+        # Fallback: Batch 4, Beam 5 (vram_prof tanınmazsa)
+        batch_size, b_size, compute_type = v_map.get(self.vram_profile, (4, 5, "float16"))
+        
+        # CPU'da float16 verimli çalışmaz (CTranslate2), int8'e düş
+        if self.device == "cpu" and compute_type == "float16":
+            compute_type = "int8"
+        return batch_size, b_size, compute_type
+    
+    def _gpu_stage(self, idx, total, audio_path, fetch):
+        """
+        Adım 1-2: Transkripsiyon ve Hizalama (GPU ağırlıklı).
+        
+        Returns:
+            {"audio_data", "aligned"} bağlamı veya durdurulduysa None
+        """
+        device = self.device
+        
+        # --- VRAM CONFIG ---
+        batch_size, b_size, compute_type = self._vram_plan()
+        
+        # Proactive Flush
+        flush_memory()
+        
+        self.log_q.put(f"   ⚙️ VRAM Planı: [Oda: {self.vram_profile} | Batch: {batch_size} | Beam: {b_size}]")
+        
+        base_name = Path(audio_path).stem
+        self.log_q.put(
+            self.L.get("trans_start", "🚀 [{}/{}] Transkripsiyon ({}): {}")
+            .format(idx, total, self.lang.upper(), base_name)
+        )
+        
+        if self.stop_event.is_set():
+            return None
+        
+        # Türkçe için özel alignment modeli
+        align_model_name = (
+            "ozcangundes/wav2vec2-large-xlsr-53-turkish" 
+            if self.lang == "tr" else None
+        )
+        
+        # Aşama Önbelleği: Daha önce işlenmiş aşamalar atlanır
+        keys = self._stage_keys(audio_path, compute_type, b_size, align_model_name)
+        cache = self.stage_cache if keys else None
+        
+        # Load Audio (Prefetch: Çoğu zaman zaten çözülmüş olur)
+        audio_data, t_decode, t_wait = fetch()
+        self.log_q.put(
+            f"   🎧 Ses Çözme: {t_decode:.1f}s "
+            f"({len(audio_data) / 16000:.0f}s ses | Bekleme: {t_wait:.1f}s)"
+        )
+        
+        if isinstance(audio_data, LongAudio):
+            return self._long_file_stage(
+                audio_path, audio_data, keys, device,
+                batch_size, b_size, compute_type, align_model_name
+            )
+        
+        # WhisperX VAD yeniden kullanımı: Önceki çalışmadan kalan harita varsa Silero hiç yüklenmez
+        reuse = self.config.get("vad_reuse", False)
+        reuse_key = keys["vad_reuse"] if keys and reuse else None
+        
+        aligned = cache.get_json("align", keys["align"]) if cache else None
+        if aligned is not None:
+            self.log_q.put("   ♻️ Önbellek: Hizalama hazır (Transkripsiyon + Hizalama atlandı)")
+            self._emit({"type": "progress", "value": 0.7})
+            compact_aligned(aligned)
+            vad_map = cache.get_array("vad", reuse_key, mmap=True) if reuse_key else None
+            return {"audio_data": audio_data, "aligned": aligned, "vad_key": keys["vad"], "vad_map": vad_map}
+        
+        # --- STEP 1: TRANSCRIBE ---
+        vad_map = None
+        result = cache.get_json("transcribe", keys["transcribe"]) if cache else None
+        if result is not None:
+            self.log_q.put("   ♻️ Önbellek: Transkripsiyon hazır (Whisper atlandı)")
+            vad_map = cache.get_array("vad", reuse_key, mmap=True) if reuse_key else None
+        else:
+            # Sessizlik atlama: VAD haritası Whisper'dan önce hesaplanır (Refinery de kullanır)
+            if self._silence_skip_params():
+                vad_map = self._vad_map_for(audio_data, keys["vad"] if keys else None)
+            vad_out = {} if reuse and vad_map is None else None
+            result = self._transcribe(audio_data, device, batch_size, b_size, compute_type, vad_map, vad_out)
+            if result is None:
+                return None
+            if cache:
+                cache.put_json("transcribe", keys["transcribe"], result)
+            if vad_out is not None:
+                vad_map = self._accept_reused_vad(vad_out, cache, reuse_key)
+        
+        if self.stop_event.is_set():
+            return None
+        
+        self._emit({"type": "progress", "value": 0.4})
+        
+        # --- STEP 2: ALIGNMENT ---
+        # VRAM yetmiyorsa Whisper'ı boşalt (Yetiyorsa iki model birlikte kalır)
+        self._ensure_align_headroom(device)
+        
+        self.log_q.put(self.L.get("step_align", "   2/4 Hizalama..."))
+        
+        if self.stop_event.is_set():
+            return None
+        
+        model_a, metadata = self.align_models.get(self.lang, align_model_name, device)
+        t_infer = time.time()
+        aligned = whisperx.align(
+            result["segments"], 
+            model_a, 
+            metadata, 
+            audio_data, 
+            device, 
+            return_char_alignments=False
+        )
+        self.log_q.put(f"   ⏱️ Hizalama: {time.time() - t_infer:.1f}s")
+        del model_a, result
+        
+        if cache and not self.stop_event.is_set():
+            cache.put_json("align", keys["align"], aligned)
+        
+        # Kelime dict'leri -> Word/Segment (Bellek ve UI'a giden pickle küçülür)
+        compact_aligned(aligned)
+        
+        self._emit({"type": "progress", "value": 0.7})
+        
+        return {
+            "audio_data": audio_data,
+            "aligned": aligned,
+            "vad_key": keys["vad"] if keys else None,
+            "vad_map": vad_map
+        }
+    
+    def _silence_skip_params(self):
+        """
+        Sessizlik atlama ayarları (Kapalıysa None).
+        
+        Returns:
+            {"min_silence_s", "pad_s", "threshold"} veya None
+        """
+        if not self.config.get("silence_skip", False):
+            return None
+        return {
+            "min_silence_s": float(self.config.get("silence_skip_min_s", 2.0)),
+            "pad_s": float(self.config.get("silence_skip_pad_s", 0.3)),
+            "threshold": float(self.config.get("silence_skip_threshold", 0.1))
+        }
+    
+    def _transcribe(self, audio_data, device, batch_size, b_size, compute_type, vad_map=None, vad_out=None):
+        """
+        Adım 1: Whisper transkripsiyonu (Model ModelManager'dan gelir).
+        
+        vad_map verilirse ve sessizlik atlama açıksa Whisper'a sadece konuşma
+        bölgeleri gider; segment zamanları orijinal zaman çizgisine geri taşınır.
+        
+        vad_out (dict) verilirse whisperx'in kendi VAD çıktısı yakalanır ve
+        Silero ızgarasına çevrilmiş olarak "map"/"kind" anahtarlarına yazılır
+        (Yakalanamazsa veya ses sıkıştırıldıysa boş kalır).
+        
+        Returns:
+            whisperx sonuç dict'i veya durdurulduysa None
+        """
+        if not self.models.is_loaded:
+            self.log_q.put("   📦 AI Motoru Hazırlanıyor (Large v3)... Lütfen Bekleyin.")
+        
+        if self.stop_event.is_set():
+            return None
+        
+        asr_options = {"beam_size": b_size}
+        
+        load_kwargs = {"device_index": self.device_index}
+        if self.cpu_threads > 0:
+            load_kwargs["threads"] = self.cpu_threads
+        
+        model = self.models.get(
+            self._resolve_model_path(),
+            device,
+            compute_type,
+            self.lang,
+            asr_options,
+            **load_kwargs
+        )
+        # Sessizlik Atlama (Ön geçiş: Uzun konuşmasız aralıklar Whisper'a gitmez)
+        plan = None
+        skip = self._silence_skip_params()
+        if skip and vad_map is not None:
+            plan = plan_speech(vad_map, skip["threshold"], len(audio_data),
+                               skip["min_silence_s"], skip["pad_s"])
+            if plan.skipped_ratio < 0.05:
+                plan = None
+            else:
                 self.log_q.put(
-                    self.L.get("trans_start", "🚀 [{}/{}] Transkripsiyon ({}): {}")
-                    .format(idx, total, self.lang.upper(), base_name)
+                    f"   🔇 Sessizlik Atlama: {len(audio_data) / 16000 / 60:.1f} dk → "
+                    f"{plan.kept / 16000 / 60:.1f} dk (%{plan.skipped_ratio * 100:.0f} atlandı)"
                 )
-                
-                if self.stop_event.is_set():
-                    should_exit = True
-                    continue
-                
-                # Load Audio
-                audio_data = whisperx.load_audio(audio_path)
-                
-                # --- STEP 1: TRANSCRIBE ---
-                self.log_q.put("   📦 AI Motoru Hazırlanıyor (Large v3)... Lütfen Bekleyin.")
-                
-                if self.stop_event.is_set():
-                    should_exit = True
-                    continue
-                
-                asr_options = {"beam_size": b_size}
-                
-                # --- FIX: EXE Path ---
-                if getattr(sys, 'frozen', False):
-                    # EXE modunda: EXE'nin oldugu klasor
-                    base_path = os.path.dirname(sys.executable)
-                else:
-                    # Script modunda: Proje kok dizini
-                    base_path = os.getcwd()
-                
-                # Yerel model kontrolü
-                local_model_path = os.path.join(base_path, "models", "large-v3")
-                model_to_load = self.model_name
-                
-                if not os.path.exists(local_model_path):
-                    self.log_q.put("   🌐 Model İndiriliyor... (Bu işlem bir seferliktir, yaklaşık 3.1 GB)")
-                    try:
-                        import threading
-                        from huggingface_hub import snapshot_download
-                        
-                        total_size_gb = 3.09 # large-v3 yaklaşık boyutu
-                        stop_monitor = threading.Event()
-                        
-                        def monitor_progress():
-                            last_size = 0
-                            start_time = time.time()
-                            while not stop_monitor.is_set():
-                                try:
-                                    current_size = sum(f.stat().st_size for f in Path(local_model_path).rglob('*') if f.is_file())
-                                    current_gb = current_size / (1024**3)
-                                    percent = (current_gb / total_size_gb) * 100
-                                    
-                                    # Hız hesapla
-                                    elapsed = time.time() - start_time
-                                    if elapsed > 0:
-                                        speed = (current_size - last_size) / (1024**2) # MB/s
-                                        if speed > 0:
-                                            self.log_q.put(f"   📥 İndiriliyor: {current_gb:.2f} GB / {total_size_gb} GB [%{int(percent)}] | Hız: {speed:.1f} MB/s")
-                                    
-                                    last_size = current_size
-                                    start_time = time.time()
-                                except: pass
-                                time.sleep(2) # 2 saniyede bir guncelle
-
-                        # Monitoru baslat
-                        monitor_thread = threading.Thread(target=monitor_progress, daemon=True)
-                        if not os.path.exists(local_model_path): os.makedirs(local_model_path, exist_ok=True)
-                        monitor_thread.start()
-
-                        # Asıl indirme
-                        snapshot_download(
-                            repo_id="Systran/faster-whisper-large-v3",
-                            local_dir=local_model_path,
-                            local_dir_use_symlinks=False,
-                            resume_download=True
-                        )
-                        
-                        stop_monitor.set() # Izlemeyi durdur
-                        self.log_q.put("   ✅ Model başarıyla yerel klasöre indirildi.")
-                    except Exception as e:
-                        self.log_q.put(f"   ⚠️ İndirme sisteminde hata: {e}")
-
-                if os.path.exists(local_model_path):
-                    self.log_q.put(f"   📂 Yerel Model Aktif: {local_model_path}")
-                    model_to_load = local_model_path
-
-                model = whisperx.load_model(
-                    model_to_load, 
-                    device, 
-                    compute_type=compute_type,
-                    language=self.lang, 
-                    asr_options=asr_options
-                )
-                result = model.transcribe(audio_data, batch_size=batch_size)
-                
-                if self.stop_event.is_set():
-                    del model
-                    gc.collect()
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                    should_exit = True
-                    continue
-                
-                self.log_q.put("   🧹 VRAM Arındırıldı, sıradaki adıma geçiliyor.")
-                del model
-                gc.collect()
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                
-                if self.stop_event.is_set():
-                    should_exit = True
-                    continue
-                
-                self.result_q.put({"type": "progress", "value": 0.4})
-                
-                # --- STEP 2: ALIGNMENT ---
-                gc.collect()
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                
-                self.log_q.put(self.L.get("step_align", "   2/4 Hizalama..."))
-                
+        
+        capture = install_vad_capture(model) if vad_out is not None else None
+        
+        t_infer = time.time()
+        result = model.transcribe(plan.compact(audio_data) if plan else audio_data, batch_size=batch_size)
+        self.log_q.put(f"   ⏱️ Transkripsiyon: {time.time() - t_infer:.1f}s")
+        del model
+        
+        if capture is not None:
+            captured = capture.take_vad_output()
+            converted = vad_output_to_map(captured, len(audio_data)) if plan is None else None
+            if converted is not None:
+                vad_out["map"], vad_out["kind"] = converted
+        
+        if plan is not None:
+            plan.remap_segments(result["segments"])
+        
+        return result
+    
+    def _accept_reused_vad(self, vad_out, cache, reuse_key):
+        """
+        _transcribe()'ın yakaladığı whisperx VAD haritasını Refinery için kabul eder.
+        
+        Returns:
+            Harita veya yakalanamadıysa None (Refinery Silero'ya döner)
+        """
+        vad_map = vad_out.get("map")
+        if vad_map is None:
+            self.log_q.put("   ℹ️ WhisperX VAD çıktısı kullanılamadı: Silero çalışacak")
+            return None
+        kind = "Kare Skorları" if vad_out.get("kind") == "scores" else "Konuşma Bölgeleri"
+        self.log_q.put(f"   ♻️ WhisperX VAD Yeniden Kullanıldı ({kind}): Silero atlandı")
+        if cache and reuse_key:
+            cache.put_array("vad", reuse_key, vad_map)
+        return vad_map
+    
+    def _long_file_stage(self, audio_path, long_audio, keys, device,
+                         batch_size, b_size, compute_type, align_model_name):
+        """
+        Uzun Dosya Modu: Adım 1-3'ü VAD sınırlı pencerelerle çalıştırır.
+        
+        Her pencere (long_window_s, varsayılan 300s) ffmpeg ile ayrı çözülür;
+        kesim noktası pencere sonundaki en uzun sessizliğe denk getirilir, böylece
+        hiçbir kelime iki pencereye bölünmez. Her pencerenin segmentleri dosya
+        zamanına kaydırılıp birleştirilir. Bellekte aynı anda tek pencere bulunur;
+        tepe bellek kullanımı dosya süresinden bağımsızdır.
+        
+        Returns:
+            {"audio_data", "aligned", "refined"} bağlamı veya durdurulduysa None
+        """
+        sr = 16000
+        win = float(self.config.get("long_window_s", 300))
+        margin = float(self.config.get("long_margin_s", 30))
+        duration = long_audio.duration
+        cache = self.stage_cache if keys else None
+        
+        self.log_q.put(
+            f"   📼 Uzun Dosya Modu: {duration / 60:.0f} dk | "
+            f"~{int(np.ceil(duration / win))} pencere ({win:.0f}s)"
+        )
+        
+        segments = []
+        start = 0.0
+        n_win = 0
+        
+        # Akış: Her pencerenin altyazıları hemen UI'a ve .partial.srt'ye gider
+        base_name = Path(audio_path).stem
+        stream = self.config.get("stream_partial", True)
+        next_index = 1
+        if stream:
+            self._reset_partial(base_name)
+        
+        while start < duration - 0.05:
+            if self.stop_event.is_set():
+                return None
+            
+            span = min(win + margin, duration - start)
+            audio = load_audio_window(audio_path, start, span, sr)
+            if audio.size == 0:
+                break
+            span = len(audio) / sr
+            
+            # VAD haritası: Kesim noktası ve Refinery için tek sefer hesaplanır
+            w_pos = [round(start, 3), round(span, 3)]
+            vad_key = cache.make_key("vad", keys["vad"], window=w_pos) if cache else None
+            vad_map = self._vad_map_for(audio, vad_key)
+            if vad_map is None:
                 if self.stop_event.is_set():
-                    should_exit = True
-                    continue
-                
-                # Türkçe için özel alignment modeli
-                align_model_name = (
-                    "ozcangundes/wav2vec2-large-xlsr-53-turkish" 
-                    if self.lang == "tr" else None
-                )
+                    return None
+                raise RuntimeError("VAD modeli yüklenemedi (Uzun dosya modu için gerekli)")
+            
+            # Son pencere değilse sessizlikten kes
+            if start + span < duration - 0.05:
+                cut = find_silence_cut(vad_map, max(win - margin, span / 2), span)
+            else:
+                cut = span
+            cut_n = int(cut * sr)
+            audio = audio[:cut_n]
+            vad_map = vad_map[:int(np.ceil(cut_n / 512))]
+            
+            # Adım 1-2 (Pencere için)
+            w_key = None
+            if cache:
+                w_key = cache.make_key("align", keys["align"], window=[round(start, 3), round(cut, 3)])
+            aligned = cache.get_json("align", w_key) if cache else None
+            
+            if aligned is None:
+                result = self._transcribe(audio, device, batch_size, b_size, compute_type, vad_map)
+                if result is None or self.stop_event.is_set():
+                    return None
                 
-                model_a, metadata = whisperx.load_align_model(
-                    language_code=self.lang, 
-                    device=device, 
-                    model_name=align_model_name
-                )
+                self._ensure_align_headroom(device)
+                model_a, metadata = self.align_models.get(self.lang, align_model_name, device)
                 aligned = whisperx.align(
                     result["segments"], 
                     model_a, 
                     metadata, 
-                    audio_data, 
+                    audio, 
                     device, 
                     return_char_alignments=False
                 )
+                del model_a, result
+                if cache:
+                    cache.put_json("align", w_key, aligned)
+            compact_aligned(aligned)
+            
+            if self.stop_event.is_set():
+                return None
+            
+            # Adım 3 (Pencere için, aynı VAD haritasıyla)
+            self._refine_aligned(aligned, audio, vad_map=vad_map)
+            segments.extend(offset_aligned(aligned["segments"], start))
+            if stream:
+                next_index = self._stream_partial(base_name, aligned["segments"], next_index)
+            
+            n_win += 1
+            self.log_q.put(
+                f"   🪟 Pencere {n_win}: {start / 60:.1f}-{(start + cut) / 60:.1f} dk | "
+                f"{len(aligned['segments'])} segment"
+            )
+            start += cut
+            self._emit({"type": "progress", "value": 0.7 * min(1.0, start / duration)})
+            
+            del audio, vad_map, aligned
+        
+        word_segments = WordList(w for seg in segments for w in seg.get("words", []))
+        merged = {
+            "segments": SegmentList(segments, word_segments),
+            "word_segments": word_segments,
+            "chronos": {
+                "finetuned": self.bridge_ms > 0 or self.word_bridge_ms > 0,
+                "refined": True
+            }
+        }
+        return {"audio_data": None, "aligned": merged, "refined": True}
+    
+    def _reset_partial(self, base_name):
+        """Önceki (yarım kalmış) çalıştırmadan kalan ara SRT'yi siler."""
+        try:
+            partial_srt_path(self.out_dir, base_name).unlink(missing_ok=True)
+        except OSError:
+            pass
+    
+    def _stream_partial(self, base_name, window_segments, start_index):
+        """
+        Tamamlanan bir bölgenin altyazı bloklarını UI'a gönderir ve ara SRT'ye ekler.
+        
+        Bloklar önizleme amaçlıdır; kesin çıktı dosya sonunda tüm zaman çizgisi
+        üzerinden (pencere sınırları arası köprüleme dahil) yeniden üretilir.
+        
+        Returns:
+            Sonraki SRT blok numarası
+        """
+        blocks, _ = reformat_aligned(
+            {"segments": window_segments}, self.config, self.bridge_ms, 0
+        )
+        if not blocks:
+            return start_index
+        
+        next_index = start_index + len(blocks)
+        try:
+            next_index = append_srt(partial_srt_path(self.out_dir, base_name), blocks, start_index)
+        except OSError as e:
+            self.log_q.put(f"   ⚠️ Ara SRT Yazılamadı: {e}")
+        
+        self._emit({
+            "type": "partial",
+            "data": {"base_name": base_name, "segments_s": blocks, "index": start_index}
+        })
+        return next_index
+    
+    def _cpu_stage(self, audio_path, ctx):
+        """
+        Adım 3-4: Chronos/Diamond Refinery ve Miller Split (CPU ağırlıklı).
+        
+        Returns:
+            UI'a gidecek sonuç dict'i veya durdurulduysa None
+        """
+        audio_data = ctx["audio_data"]
+        aligned = ctx["aligned"]
+        
+        # --- STEP 3: CHRONOS TIMING ---
+        self.log_q.put(self.L.get("step_wave", "   3/4 Akıllı Köprüleme..."))
+        
+        # Uzun dosya modunda Adım 3 pencere pencere zaten uygulandı (ve akıtıldı).
+        # Normal dosyada akış yok: Adım 4 refinery'nin hemen ardından geldiği için
+        # ara blok üretmek formatlamayı iki kez yapmaktan öteye geçmez.
+        if not ctx.get("refined"):
+            self._refine_aligned(
+                aligned, audio_data, vad_key=ctx.get("vad_key"), vad_map=ctx.get("vad_map")
+            )
+        
+        # --- STEP 4: SMART SPLIT ---
+        self.log_q.put(self.L.get("step_fmt", "   4/4 Akıllı Formatlama..."))
+        
+        segments_s, segments_w = reformat_aligned(
+            aligned, 
+            self.config, 
+            self.bridge_ms, 
+            self.word_bridge_ms
+        )
+        
+        if self.stop_event.is_set():
+            return None
+        
+        return {
+            "base_name": Path(audio_path).stem,
+            "segments_s": segments_s,
+            "segments_w": segments_w,
+            "raw": aligned
+        }
+    
+    def _refine_aligned(self, aligned, audio_data, vad_key=None, vad_map=None):
+        """
+        Adım 3: Waveform Finetune + Diamond Refinery (Cümle ve kelime seviyesi).
+        
+        Args:
+            aligned: Hizalanmış sonuç (yerinde güncellenir)
+            audio_data: 16 kHz ses (Tam dosya veya uzun dosya penceresi)
+            vad_key: VAD haritası önbellek anahtarı
+            vad_map: Hazır VAD haritası (Uzun dosya modu)
+        """
+        # 1. Waveform Finetune (Sadece köprüleme aktifse uygulanır)
+        finetuned = self.bridge_ms > 0 or self.word_bridge_ms > 0
+        if finetuned:
+            aligned["segments"] = waveform_finetune_chronos(aligned["segments"])
+        
+        # 2. Diamond Refinery (ALWAYS ON - STANDARD)
+        # Artık opsiyonel değil, standart prosedür.
+        self.log_q.put(f"   💎 Chronos VAD Refinery: Auto-Pilot Active")
+        
+        # VAD haritası + kalibrasyon tek sefer (Cümle ve kelime geçişleri paylaşır)
+        vad = self.analyze_vad(audio_data, vad_key=vad_key, vad_map=vad_map)
+        if vad is None:
+            aligned["chronos"] = {"finetuned": finetuned, "refined": False}
+            return
+        
+        # Sentence level refinery
+        aligned["segments"] = self.diamond_refinery(
+            aligned["segments"], 
+            audio_data, 
+            mode="sentence",
+            vad=vad
+        )
+            
+        # Word level refinery (Global Batch Optimization)
+        all_words = []
+        for s in aligned["segments"]:
+            if "words" in s:
+                all_words.extend(s["words"])
+        
+        if all_words:
+            self.log_q.put(f"   💎 Kelime Analizi: {len(all_words)} kelime tek seferde işleniyor...")
+            refined_words = self.diamond_refinery(
+                all_words, audio_data, mode="word", vad=vad
+            )
+            
+            # Dağıtım
+            curr = 0
+            for s in aligned["segments"]:
+                if "words" in s:
+                    count = len(s["words"])
+                    s["words"] = refined_words[curr : curr+count]
+                    curr += count
+        
+        vad.release()
+        
+        # Ham JSON işaretçisi: "Yeniden Formatla" modu hangi adımların uygulandığını bilir
+        aligned["chronos"] = {"finetuned": finetuned, "refined": True}
+    
+    def _cpu_task(self, idx, total, audio_path, ctx):
+        """
+        Bir dosyanın CPU adımlarını çalıştırır ve sonucunu bildirir.
+        
+        Returns:
+            bool: İşlem durdurulduysa True
+        """
+        res_data = None
+        if ctx is not None and not self.stop_event.is_set():
+            try:
+                res_data = self._cpu_stage(audio_path, ctx)
+            except Exception as e:
+                self._log_file_error(audio_path, e)
+        
+        # Memory Cleanup
+        ctx = None
+        flush_memory()
+        
+        return self._finish_file(idx, total, res_data)
+    
+    def _finish_file(self, idx, total, res_data):
+        """
+        Dosya sonucunu result_q'ya gönderir.
+        
+        Returns:
+            bool: İşlem durdurulduysa True
+        """
+        # Durdurulmuşsa işaretle (Tek seferlik final mesajı)
+        if self.stop_event.is_set():
+            if not self._stop_reported:
+                self._stop_reported = True
+                self.log_q.put(self.L.get("stopped", "İşlem durduruldu."))
+                self._emit({"type": "done", "data": None, "is_final": True})
+            return True
+        
+        if self.task_q is not None:
+            # Worker Pool: Final kararını havuz verir, her dosya bildirilir
+            self._emit({"type": "done", "data": res_data, "is_final": False})
+            return False
+        
+        is_final = idx == total
+        if is_final:
+            # %100 final "done"dan önce gider: UI final mesajında işi kapatır,
+            # sonraki mesajları eski iş sayıp yok sayar
+            self._emit({"type": "progress", "value": 1.0})
+        if res_data is not None or is_final:
+            self._emit({
+                "type": "done", 
+                "data": res_data, 
+                "is_final": is_final
+            })
+        return False
+    
+    def _log_file_error(self, audio_path, e):
+        """Dosya hatasını loglar ve belleği temizler."""
+        self.log_q.put(
+            self.L.get("error_file", "❌ HATA [{}]: {}")
+            .format(Path(audio_path).name, str(e))
+        )
+        flush_memory()
+    
+    def _ensure_align_headroom(self, device):
+        """
+        Hizalama modeli için yer açar.
+        
+        Whisper ve Wav2Vec2 modelleri VRAM yettiği sürece birlikte tutulur.
+        Politika "flush" ise veya boş VRAM "align_headroom_gb" değerinin
+        altındaysa Whisper modeli hizalamadan önce boşaltılır.
+        """
+        if not self.models.is_loaded:
+            flush_memory()
+            return
+        
+        if self.models.policy == "flush":
+            self.models.release()
+            self.log_q.put("   🧹 VRAM Arındırıldı, sıradaki adıma geçiliyor.")
+            return
+        
+        if device != "cuda" or len(self.align_models):
+            return
+        
+        try:
+            free_bytes, _ = torch.cuda.mem_get_info()
+        except Exception:
+            return
+        
+        need_gb = float(self.config.get("align_headroom_gb", 2.0))
+        if free_bytes / (1024**3) < need_gb:
+            self.models.release()
+            self.log_q.put(
+                f"   🧹 VRAM Yetersiz ({free_bytes / (1024**3):.1f} GB boş), "
+                f"Whisper boşaltıldı."
+            )
+    
+    def _resolve_model_path(self):
+        """
+        Whisper model yolunu belirler (Tek seferlik).
+        
+        Yerel "models/large-v3" klasörü yoksa HuggingFace'ten indirir.
+        Sonuç worker ömrü boyunca önbellekte tutulur.
+        
+        Returns:
+            Yerel klasör yolu veya model adı (string)
+        """
+        if self._model_path is not None:
+            return self._model_path
+        
+        # --- FIX: EXE Path ---
+        if getattr(sys, 'frozen', False):
+            # EXE modunda: EXE'nin oldugu klasor
+            base_path = os.path.dirname(sys.executable)
+        else:
+            # Script modunda: Proje kok dizini
+            base_path = os.getcwd()
+        
+        # Yerel model kontrolü
+        local_model_path = os.path.join(base_path, "models", "large-v3")
+        model_to_load = self.model_name
+        
+        if not os.path.exists(local_model_path):
+            self.log_q.put("   🌐 Model İndiriliyor... (Bu işlem bir seferliktir, yaklaşık 3.1 GB)")
+            try:
+                import threading
+                from huggingface_hub import snapshot_download
                 
-                del model_a
-                gc.collect()
-                if device == "cuda":
-                    torch.cuda.empty_cache()
-                
-                self.result_q.put({"type": "progress", "value": 0.7})
-                
-                # --- STEP 3: CHRONOS TIMING ---
-                self.log_q.put(self.L.get("step_wave", "   3/4 Akıllı Köprüleme..."))
-                
-                # 1. Waveform Finetune (Sadece köprüleme aktifse uygulanır)
-                if self.bridge_ms > 0 or self.word_bridge_ms > 0:
-                    aligned["segments"] = waveform_finetune_chronos(aligned["segments"])
-                
-                # 2. Diamond Refinery (Optional)
-                # 2. Diamond Refinery (ALWAYS ON - STANDARD)
-                # Artık opsiyonel değil, standart prosedür.
-                self.log_q.put(f"   💎 Chronos VAD Refinery: Auto-Pilot Active")
+                total_size_gb = 3.09 # large-v3 yaklaşık boyutu
+                stop_monitor = threading.Event()
                 
-                # Sentence level refinery
-                aligned["segments"] = self.diamond_refinery(
-                    aligned["segments"], 
-                    audio_data, 
-                    mode="sentence"
+                def monitor_progress():
+                    last_size = 0
+                    start_time = time.time()
+                    while not stop_monitor.is_set():
+                        try:
+                            current_size = sum(f.stat().st_size for f in Path(local_model_path).rglob('*') if f.is_file())
+                            current_gb = current_size / (1024**3)
+                            percent = (current_gb / total_size_gb) * 100
+                            
+                            # Hız hesapla
+                            elapsed = time.time() - start_time
+                            if elapsed > 0:
+                                speed = (current_size - last_size) / (1024**2) # MB/s
+                                if speed > 0:
+                                    self.log_q.put(f"   📥 İndiriliyor: {current_gb:.2f} GB / {total_size_gb} GB [%{int(percent)}] | Hız: {speed:.1f} MB/s")
+                            
+                            last_size = current_size
+                            start_time = time.time()
+                        except: pass
+                        time.sleep(2) # 2 saniyede bir guncelle
+
+                # Monitoru baslat
+                monitor_thread = threading.Thread(target=monitor_progress, daemon=True)
+                if not os.path.exists(local_model_path): os.makedirs(local_model_path, exist_ok=True)
+                monitor_thread.start()
+
+                # Asıl indirme
+                snapshot_download(
+                    repo_id="Systran/faster-whisper-large-v3",
+                    local_dir=local_model_path,
+                    local_dir_use_symlinks=False,
+                    resume_download=True
                 )
-                    
-                # Word level refinery (Global Batch Optimization)
-                all_words = []
-                for s in aligned["segments"]:
-                    if "words" in s:
-                        all_words.extend(s["words"])
-                
-                if all_words:
-                    self.log_q.put(f"   💎 Kelime Analizi: {len(all_words)} kelime tek seferde işleniyor...")
-                    refined_words = self.diamond_refinery(all_words, audio_data, mode="word")
-                    
-                    # Dağıtım
-                    curr = 0
-                    for s in aligned["segments"]:
-                        if "words" in s:
-                            count = len(s["words"])
-                            s["words"] = refined_words[curr : curr+count]
-                            curr += count
-                
-                # --- STEP 4: SMART SPLIT ---
-                self.log_q.put(self.L.get("step_fmt", "   4/4 Akıllı Formatlama..."))
                 
-                segments_s = miller_hybrid_split(aligned, self.config)
-                
-                # Sentence level seamless bridge
-                if self.bridge_ms > 0:
-                    segments_s = chronos_seamless_core(
-                        segments_s, 
-                        self.bridge_ms / 1000.0, 
-                        min_dur=0.2
-                    )
-                
-                # Word-Based Segment Collection
-                segments_w = []
-                for s in aligned["segments"]:
-                    for w in s.get("words", []):
-                        if "start" in w:
-                            segments_w.append(w)
-                
-                # Word level seamless bridge
-                if self.word_bridge_ms > 0 and segments_w:
-                    segments_w = chronos_seamless_core(
-                        segments_w, 
-                        self.word_bridge_ms / 1000.0, 
-                        min_dur=0.08
-                    )
-                
-                res_data = {
-                    "base_name": Path(audio_path).stem,
-                    "segments_s": segments_s,
-                    "segments_w": segments_w,
-                    "raw": aligned
-                }
-                file_success = True
-                
-                # Memory Cleanup
-                del audio_data, result
-                gc.collect()
-                if device == "cuda":
-                    torch.cuda.empty_cache()
-                
-                if self.stop_event.is_set():
-                    should_exit = True
-                    continue
-                
-                time.sleep(0.01)
-            
+                stop_monitor.set() # Izlemeyi durdur
+                self.log_q.put("   ✅ Model başarıyla yerel klasöre indirildi.")
             except Exception as e:
-                self.log_q.put(
-                    self.L.get("error_file", "❌ HATA [{}]: {}")
-                    .format(Path(audio_path).name, str(e))
-                )
-                gc.collect()
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
-                file_success = False
-            
-            finally:
-                # Durdurulmuşsa işaretle (return yerine flag kullan)
-                if self.stop_event.is_set():
-                    self.log_q.put(self.L.get("stopped", "İşlem durduruldu."))
-                    self.result_q.put({"type": "done", "data": None, "is_final": True})
-                    should_exit = True
-                elif file_success:
-                    self.result_q.put({
-                        "type": "done", 
-                        "data": res_data, 
-                        "is_final": (idx == total)
-                    })
-                elif idx == total:
-                    self.result_q.put({"type": "done", "data": None, "is_final": True})
-        
-        if not should_exit:
-            self.result_q.put({"type": "progress", "value": 1.0})
-            self.log_q.put(self.L.get("all_done", "🏁 TÜM İŞLEMLER TAMAMLANDI!"))
+                self.log_q.put(f"   ⚠️ İndirme sisteminde hata: {e}")
+
+        if os.path.exists(local_model_path):
+            self.log_q.put(f"   📂 Yerel Model Aktif: {local_model_path}")
+            model_to_load = local_model_path
+        
+        self._model_path = model_to_load
+        return model_to_load
     
-    def analyze_vad_params(self, audio_np):
+    def analyze_vad_params(self, audio_np, probs):
         """
         Ses dosyasının karakteristiğine göre ideal VAD parametrelerini hesaplar.
         UI'sız, arka planda çalışan 'Akıllı Analiz' sistemi.
+        
+        "vad_calibration": "adaptive" (Seviye histogramı + duraklama süreleri)
+        veya "fixed" (Sabit agresif preset).
+        
+        Args:
+            audio_np: 16 kHz ses
+            probs: VAD olasılık haritası
+        
+        Returns:
+            Calibration
         """
+        mode = self.config.get("vad_calibration", "adaptive")
         try:
-            # 1. Gürültü Tabanı (Noise Floor) Analizi
-            # Sesi 50ms'lik pencerelere bölüp en sessiz %10'luk kısmın enerjisine bakıyoruz.
-            chunk_n = int(16000 * 0.05)
-            # Hız için %1'lik örneklem (stride) alıyoruz
-            stride = max(1, len(audio_np) // 1000)
-            samples = np.abs(audio_np[::stride])
-            
-            # Alt %10 (Noise) ve Üst %10 (Speech) Enerjisi
-            sorted_energy = np.sort(samples)
-            noise_level = np.mean(sorted_energy[:int(len(sorted_energy)*0.1)])
-            speech_level = np.mean(sorted_energy[-int(len(sorted_energy)*0.1):])
-            
-            # Dinamik Aralık (Speech / Noise Ratio)
-            snr = speech_level / (noise_level + 1e-9)
-            
-            # --- PARAMETRE HESAPLAMA (SABİT AGRESIF PRESET) ---
-            # Kullanıcı geri bildirimine göre başlangıç gecikmelerini (Late Attack) önlemek için:
-            # 1. Threshold ÇOK DÜŞÜK (0.08) -> Fısıltıları ve başlangıç nefeslerini yakala.
-            # 2. Pad Start ÇOK YÜKSEK (0.5s) -> Kelimeden yarım saniye öncesini de al.
-            
-            threshold = 0.08
-            pad_start = 0.50
-            pad_end = 0.50
-            min_silence = 0.50
-            
-            self.log_q.put(f"   🧠 Smart VAD: [FIXED] Thr={threshold} | Pad={pad_start}/{pad_end}s | Attack=AGGRESSIVE")
-            return threshold, pad_start, pad_end, min_silence
-            
+            calib = calibrate_vad(audio_np, probs, mode=mode)
         except Exception as e:
             print(f"Smart VAD Error: {e}")
-            return 0.15, 0.1, 0.2, 0.4
+            calib = Calibration(FIXED_CALIBRATION, "fallback")
+        
+        self.log_q.put(f"   🧠 Smart VAD: {calib.describe()}")
+        return calib
+    
+    def _vad_spec(self):
+        """
+        Bu işçinin VAD modeli tarifi ("vad_backend": torch / onnx / auto).
+        
+        Yerel dosya (models/, resources/) varsa torch.hub'a hiç gidilmez.
+        """
+        device = self.device or ("cuda" if torch.cuda.is_available() else "cpu")
+        return resolve_vad(self.config.get("vad_backend", "torch"), device)
     
     def get_vad_model(self):
         """VAD Modelini Cache'ten getir veya yükle (Tek Seferlik Yük)"""
@@ -457,144 +1331,136 @@ class TranscriptionWorker(mp.Process):
             return self._vad_model, getattr(self, '_vad_utils', None)
 
         try:
-            self.log_q.put("   ⏳ VAD Modeli İlk Kez Yükleniyor... (Bir kerelik işlem)")
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            model, utils = torch.hub.load(repo_or_dir='snakers4/silero-vad', model='silero_vad', 
-                                        force_reload=False, trust_repo=True, verbose=False)
-            model = model.to(device)
+            device = self.device or ("cuda" if torch.cuda.is_available() else "cpu")
+            spec = self._vad_spec()
+            self.log_q.put(f"   ⏳ VAD Modeli İlk Kez Yükleniyor ({spec.label})... (Bir kerelik işlem)")
+            model = load_vad(spec, device, threads=self.cpu_threads)
             self._vad_model = model
-            self._vad_utils = utils
-            self._vad_device = device
-            return model, utils
+            self._vad_utils = None
+            self._vad_device = device if spec.backend == "torch" else "cpu"
+            return model, None
         except Exception as e:
             self.log_q.put(f"⚠️ VAD Model Yükleme Hatası: {e}")
             return None, None
 
-    def diamond_refinery(self, segments, audio_np, mode="sentence"):
-        """Diamond Precision v7.0 (Fast + Vectorized + Cached + Auto-Pilot)"""
+    def _compute_vad_map(self, audio_np, model_v, device, sr):
+        """
+        Silero VAD olasılık haritasını (512 örneklik pencereler) hesaplar.
+        
+        Toplu iş boyu boş bellekten planlanır ("vad_meta_batch" > 0 ile sabitlenebilir);
+        seçilen boy ve hız loglanır.
+        
+        Returns:
+            np.ndarray olasılık haritası veya durdurulduysa None
+        """
+        fixed = int(self.config.get("vad_meta_batch", 0) or 0)
+        stats = {}
+        t_infer = time.time()
+        vad_map = compute_vad_map(
+            audio_np, model_v, device,
+            meta_batch=fixed if fixed > 0 else None,
+            stop_event=self.stop_event,
+            sr=sr,
+            stats=stats
+        )
+        if vad_map is None:
+            return None
+        
+        elapsed = max(time.time() - t_infer, 1e-6)
+        backoff = f" | Geri Çekilme: {stats['backoffs']}x" if stats.get("backoffs") else ""
+        self.log_q.put(
+            f"   ⏱️ VAD Haritası: {elapsed:.2f}s | Batch: {stats.get('meta_batch')} | "
+            f"{stats.get('windows', 0) / elapsed:.0f} pencere/s{backoff}"
+        )
+        return vad_map
+    
+    def _vad_map_for(self, audio_np, vad_key=None):
+        """
+        VAD haritasını önbellekten (mmap, kopyasız) okur; yoksa hesaplayıp kaydeder.
+        
+        Önbellek isabetinde Silero modeli hiç yüklenmez.
+        
+        Args:
+            audio_np: 16 kHz ses
+            vad_key: Aşama önbelleği anahtarı (None = önbelleksiz)
+        
+        Returns:
+            Olasılık haritası (MAP_DTYPE) veya model yoksa/durdurulduysa None
+        """
+        cache = self.stage_cache if vad_key else None
+        if cache:
+            vad_map = cache.get_array("vad", vad_key, mmap=True)
+            if vad_map is not None:
+                return vad_map
+        
+        # GPU thread'i (Uzun dosya / sessizlik atlama) ve CPU hattı (İyileştirme)
+        # aynı durumlu Silero modelini paylaşır: Yükleme ve çıkarım sıralı
+        with self._vad_lock:
+            model_v, _ = self.get_vad_model()
+            if model_v is None:
+                return None
+            vad_map = self._compute_vad_map(audio_np, model_v, self._vad_device, 16000)
+        if vad_map is None:
+            return None
+        if cache:
+            cache.put_array("vad", vad_key, vad_map)
+        return vad_map
+    
+    def analyze_vad(self, audio_np, vad_key=None, vad_map=None):
+        """
+        Dosya başına VAD analizi: Olasılık haritası + Smart VAD kalibrasyonu.
+        
+        Tek sefer hesaplanır; cümle ve kelime refinery geçişleri aynı nesneyi kullanır.
+        
+        Args:
+            audio_np: 16 kHz ses
+            vad_key: Aşama önbelleği anahtarı (Harita diskten okunur/yazılır)
+            vad_map: Hazır harita (Uzun dosya penceresi)
+        
+        Returns:
+            VadAnalysis veya model yoksa/durdurulduysa None
+        """
+        sr = 16000
+        full_map = vad_map
+        if full_map is None:
+            full_map = self._vad_map_for(audio_np, vad_key)
+            if full_map is None:
+                return None
+        
+        # --- SMART VAD ANALIZI ---
+        # Kullanıcıdan bağımsız, her dosyaya özel ayarlar
+        calib = self.analyze_vad_params(audio_np, full_map)
+        
+        return VadAnalysis(audio_np, full_map, *calib.values, sr=sr, calib=calib)
+    
+    def diamond_refinery(self, segments, audio_np, mode="sentence", vad=None):
+        """Diamond Precision v7.0 (Fast + Vectorized + Cached + Auto-Pilot)
+
+        vad (VadAnalysis) verilirse harita ve kalibrasyon yeniden hesaplanmaz.
+        """
         import time
         t_start = time.time()
         
         try:
-            model_v, utils = self.get_vad_model()
-            if model_v is None: return segments
-            
-            device = self._vad_device
-            sr = 16000
-            
-            # --- SMART VAD ANALIZI ---
-            # Kullanıcıdan bağımsız, her dosyaya özel ayarlar
-            dyn_thresh, dyn_pad_s, dyn_pad_e, dyn_min_sil = self.analyze_vad_params(audio_np)
-            
-            # Threshold Override - TAM OTOMATİK
-            # Kullanıcı hassasiyeti kalktı. Direkt Smart VAD değerini kullanıyoruz.
-            vad_threshold = dyn_thresh
-            
-            # --- ZAMANLAMA BAŞLANGICI (HATA DÜZELTME) ---
-            t_infer_start = time.time()
-            
-            audio_t = torch.from_numpy(audio_np).to(device)
-            v_prof = self.vram_profile
-            
-            # Smart Batch Sizing
-            # Smart Batch Sizing
-            if "vram_eko" in v_prof: meta_batch = 2000
-            elif "vram_mid" in v_prof: meta_batch = 10000
-            elif "vram_ultra" in v_prof or "vram_sonic" in v_prof or "vram_custom" in v_prof: meta_batch = 40000
-            else: meta_batch = 20000 # vram_high ve default
-            
-            chunk_size = 512
-            
-            # Padding
-            flat_len = len(audio_t)
-            pad_needed = chunk_size - (flat_len % chunk_size)
-            if pad_needed != chunk_size:
-                audio_t = torch.nn.functional.pad(audio_t, (0, pad_needed))
-            
-            batched_audio = audio_t.view(-1, chunk_size)
-            global_probs = []
-            
-            model_v.eval()
-            with torch.no_grad():
-                for i in range(0, len(batched_audio), meta_batch):
-                    if self.stop_event.is_set(): return segments
-                    b = batched_audio[i:i+meta_batch]
-                    out = model_v(b, sr)
-                    if out.dim() > 1 and out.shape[-1] > 1:
-                         global_probs.append(out[:, 1].cpu())
-                    else:
-                         global_probs.append(out.view(-1).cpu())
-            
-            full_map = torch.cat(global_probs).numpy()
-            t_infer_end = time.time()
+            if vad is None:
+                vad = self.analyze_vad(audio_np)
+                if vad is None: return segments
             
             # --- CPU SOLVER (Vectorized & Smart) ---
-            t_solve_start = time.time()
-            
-            seg_count = len(segments)
+            # Tüm segmentler tek seferde: ilk/son eşik aşımı + toplu zero-crossing snap
             starts = np.array([s["start"] for s in segments])
             ends = np.array([s["end"] for s in segments])
             
-            # Smart Padding Uygulaması
-            # VAD'ın bulduğu sınırları biraz esnetiyoruz (Nefes payı)
-            SAFETY = 0.02
-            prev_ends = np.concatenate(([0], ends[:-1] + SAFETY))
-            next_starts = np.concatenate((starts[1:] - SAFETY, [len(audio_np)/sr]))
+            new_s, new_e, set_s, set_e = solve_boundaries(vad, starts, ends, mode=mode)
             
-            # Dinamik Padding Değerleri Kullanılıyor
-            w_starts = np.maximum(prev_ends, starts - dyn_pad_s)
-            w_ends = np.minimum(next_starts, ends + dyn_pad_e)
-            
-            idx_starts = (w_starts * sr / 512).astype(int)
-            idx_ends = (w_ends * sr / 512).astype(int)
-            idx_starts = np.clip(idx_starts, 0, len(full_map))
-            idx_ends = np.clip(idx_ends, 0, len(full_map))
-            
-            # Window Analysis (Genişletilmiş Tolerans - V10 Klasik Ayarı)
-            MAX_S_DRIFT = 0.30 if mode == "sentence" else 0.15 # Başlangıçta esneklik (Efendim sorunu için)
-            MAX_E_DRIFT = dyn_min_sil # Bitişte esneklik (Smart Analysis'ten gelen)
-            SNAP_WIN = 1200 
-            
-            for i in range(seg_count):
-                s_idx, e_idx = idx_starts[i], idx_ends[i]
-                if s_idx >= e_idx: continue
-                
-                local_probs = full_map[s_idx:e_idx]
-                hits = np.where(local_probs > vad_threshold)[0]
-                
-                if hits.size > 0:
-                    first_hit = s_idx + hits[0]
-                    last_hit = s_idx + hits[-1]
-                    
-                    raw_s = first_hit * 512
-                    raw_e = (last_hit * 512) + 512
-                    
-                    # Zero Crossing Snap
-                    sw1 = max(0, raw_s - SNAP_WIN)
-                    ew1 = min(len(audio_np), raw_s + SNAP_WIN)
-                    if ew1 > sw1: snap_s = sw1 + np.argmin(np.abs(audio_np[sw1:ew1]))
-                    else: snap_s = raw_s
-                    
-                    sw2 = max(0, raw_e - SNAP_WIN)
-                    ew2 = min(len(audio_np), raw_e + SNAP_WIN)
-                    if ew2 > sw2: snap_e = sw2 + np.argmin(np.abs(audio_np[sw2:ew2]))
-                    else: snap_e = raw_e
-                    
-                    cand_s = snap_s / sr
-                    cand_e = (snap_e / sr) + 0.04
-                    
-                    if abs(cand_s - starts[i]) < MAX_S_DRIFT:
-                        segments[i]["start"] = round(max(prev_ends[i], cand_s), 3)
-                    if abs(cand_e - ends[i]) < MAX_E_DRIFT:
-                        segments[i]["end"] = round(min(next_starts[i] - 0.01, cand_e), 3)
-                
-                if segments[i]["end"] <= segments[i]["start"]: 
-                    segments[i]["end"] = segments[i]["start"] + 0.1
+            for i in np.flatnonzero(set_s):
+                segments[i]["start"] = new_s[i]
+            for i in np.flatnonzero(set_e):
+                segments[i]["end"] = new_e[i]
             
             t_total = time.time() - t_start
-            self.log_q.put(f"   ⏱️ VAD Analiz: {t_total:.2f}s (GPU: {t_infer_end-t_infer_start:.2f}s)")
+            self.log_q.put(f"   ⏱️ VAD Analiz ({mode}): {t_total:.2f}s")
             
-            del batched_audio; del full_map; del audio_t
             gc.collect(); torch.cuda.empty_cache()
             return segments
 
@@ -602,3 +1468,159 @@ class TranscriptionWorker(mp.Process):
             print(f"Diamond Error: {e}")
             self.log_q.put(f"⚠️ VAD Hatası: {str(e)[:50]}")
             return segments
+
+
+# =============================================================================
+# KALICI MOTOR (Warm Engine Daemon)
+# =============================================================================
+
+class EngineDaemon(TranscriptionWorker):
+    """
+    START basışları arasında yaşayan kalıcı (sıcak) motor süreci.
+
+    UI bu süreci bir kez başlatır ve işleri job_q üzerinden gönderir.
+    torch/whisperx importu, CUDA bağlamı ve yüklenen modeller işler
+    arasında korunur. İptal sadece o anki işi durdurur, süreç yaşamaya
+    devam eder. Belirli bir süre iş gelmezse modeller boşaltılır.
+
+    Kullanım (UI tarafı):
+        engine = EngineDaemon(log_q, result_q, locale_dict)
+        engine.start()
+        engine.submit(job_id, audio_list=[...], config={...}, ...)
+        engine.cancel(job_id)
+        engine.shutdown()
+    """
+
+    # İş sözlüğünde kabul edilen alanlar (TranscriptionWorker parametreleri)
+    JOB_FIELDS = (
+        "audio_list", "out_dir", "config", "lang", "model_name", "locale_dict",
+        "vram_profile", "align_engine", "bridge_ms", "word_bridge_ms"
+    )
+
+    def __init__(
+        self,
+        log_q,
+        result_q,
+        locale_dict,
+        idle_timeout=600,
+        device=None,
+        cpu_threads=0,
+        task_q=None,
+        worker_id=None
+    ):
+        """
+        Args:
+            log_q: Log mesajları için multiprocessing.Queue
+            result_q: Sonuçlar için multiprocessing.Queue
+            locale_dict: Başlangıç çeviri sözlüğü (her işle güncellenir)
+            idle_timeout: Bu kadar saniye iş gelmezse modeller boşaltılır (0 = asla)
+            device, cpu_threads, task_q, worker_id: Worker Pool ayarları
+                (bkz. TranscriptionWorker)
+        """
+        super().__init__(
+            audio_list=[],
+            out_dir=None,
+            config={},
+            lang="tr",
+            model_name="large-v3",
+            log_q=log_q,
+            result_q=result_q,
+            locale_dict=locale_dict,
+            vram_profile="vram_eko",
+            align_engine="Wav2Vec2",
+            bridge_ms=0,
+            word_bridge_ms=0,
+            device=device,
+            cpu_threads=cpu_threads,
+            task_q=task_q,
+            worker_id=worker_id
+        )
+        self.daemon = True
+        self.job_q = mp.Queue()
+        self.idle_timeout = idle_timeout
+        # İptal edilen en son iş kimliği (kuyrukta bekleyen işler de atlanır)
+        self.cancelled_job = mp.Value("i", 0)
+
+    # --- UI TARAFI ---
+
+    def submit(self, job_id, **job):
+        """İşi motor kuyruğuna ekler (job_id pozitif tamsayı olmalı)."""
+        job["job_id"] = job_id
+        self.job_q.put(job)
+
+    def cancel(self, job_id):
+        """Belirtilen işi (ve ondan önce kuyrukta bekleyenleri) iptal eder."""
+        with self.cancelled_job.get_lock():
+            self.cancelled_job.value = max(self.cancelled_job.value, job_id)
+        self.stop_event.set()
+
+    def shutdown(self, timeout=3.0):
+        """Motoru temiz şekilde kapatır; süre aşılırsa zorla sonlandırır."""
+        if not self.is_alive():
+            return
+        self.stop_event.set()
+        self.job_q.put(None)
+        self.join(timeout=timeout)
+        if self.is_alive():
+            self.terminate()
+            self.join(timeout=0.1)
+
+    # --- MOTOR TARAFI ---
+
+    def run(self):
+        """İş bekleme döngüsü."""
+        self._boot()
+        self.log_q.put("🔥 Motor Hazır: İşler arası sıcak bekleme modunda.")
+        last_active = time.time()
+
+        while True:
+            try:
+                job = self.job_q.get(timeout=1.0)
+            except queue.Empty:
+                idle = time.time() - last_active
+                if self.idle_timeout and idle > self.idle_timeout and self._has_models():
+                    self.unload_models()
+                    self.log_q.put(f"💤 Motor {int(idle)}s boşta kaldı, modeller bellekten boşaltıldı.")
+                continue
+
+            if job is None:
+                break
+
+            # Önce bayrağı temizle, sonra iptal kontrolü yap (Yarış durumuna karşı)
+            self.stop_event.clear()
+            if job["job_id"] <= self.cancelled_job.value:
+                continue
+
+            self._apply_job(job)
+            try:
+                self.process_queue()
+            except Exception as e:
+                self.log_q.put(f"❌ Motor Hatası: {e}")
+                self._emit({"type": "done", "data": None, "is_final": True})
+            last_active = time.time()
+
+        self.unload_models()
+
+    def _has_models(self):
+        return self.models.is_loaded or len(self.align_models) > 0 or self._vad_model is not None
+
+    def _apply_job(self, job):
+        """İş parametrelerini worker alanlarına uygular."""
+        for field in self.JOB_FIELDS:
+            if field in job:
+                setattr(self, "L" if field == "locale_dict" else field, job[field])
+        self.job_id = job["job_id"]
+
+        config = self.config
+        default_policy = "flush" if config.get("mem_flush") else "keep"
+        self.models.policy = config.get("model_policy", default_policy)
+        if self.models.policy not in ModelManager.POLICIES:
+            self.models.policy = "keep"
+        self.align_models.max_size = max(1, int(config.get("align_cache_size", 2)))
+        
+        cache = self._make_stage_cache(config)
+        if cache is None or self.stage_cache is None or cache.root != self.stage_cache.root:
+            self.stage_cache = cache
+        else:
+            # Aynı klasör: Süreç içi hash belleği korunur
+            self.stage_cache.max_bytes = cache.max_bytes
@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import subprocess
+import threading
 import multiprocessing
 from pathlib import Path
 from tkinter import filedialog, messagebox
@@ -20,7 +21,6 @@ from PIL import Image, ImageTk
 from src.utils.helpers import (
     LocaleManager, 
     get_resource_path, 
-    get_unique_path,
     _dnd_queue,
     shell32,
     WNDPROC_TYPE,
@@ -30,7 +30,10 @@ from src.utils.helpers import (
 import src.utils.helpers as helpers
 from src.ui.styles import THEMES, FONTS, SIZES
 from src.ui.dialogs import CustomNamingDialog
-from src.engine.worker import TranscriptionWorker
+from src.engine.worker import EngineDaemon
+from src.engine.pool import EnginePool, plan_devices
+from src.engine.export import write_results, reformat_results, partial_srt_path, RAW_SUFFIXES
+from src.engine.logic import format_timestamp
 
 
 class WhisperXApp(ctk.CTk):
@@ -79,7 +82,10 @@ class WhisperXApp(ctk.CTk):
         
         # --- WORKER & QUEUES ---
         self.is_running = False
-        self.current_worker = None
+        self.reformat_thread = None
+        self.engine = None
+        self.job_counter = 0
+        self.current_job_id = None
         self.queue_files = []
         self.log_q = multiprocessing.Queue()
         self.result_q = multiprocessing.Queue()
@@ -98,6 +104,9 @@ class WhisperXApp(ctk.CTk):
         self.check_logs()
         self.check_results()
         
+        # --- WARM ENGINE (Arka planda bir kez başlar, açık kalır) ---
+        self.after(1500, self.ensure_engine)
+        
         # --- CLOSE EVENT ---
         self.protocol("WM_DELETE_WINDOW", self.on_close)
     
@@ -193,6 +202,19 @@ class WhisperXApp(ctk.CTk):
                     "mem_flush": self.mem_flush_var.get(),
                     "base_limit": self.base_limit_var.get(),
                     "context_prompt": self.perf_context_var.get(),
+                    "engine_idle_timeout": self.saved_settings.get("perf_options", {}).get("engine_idle_timeout", 600),
+                    "engine_devices": self.saved_settings.get("perf_options", {}).get("engine_devices"),
+                    "engine_cpu_workers": self.saved_settings.get("perf_options", {}).get("engine_cpu_workers", 1),
+                    "stage_cache": self.saved_settings.get("perf_options", {}).get("stage_cache", True),
+                    "cache_dir": self.saved_settings.get("perf_options", {}).get("cache_dir"),
+                    "cache_max_mb": self.saved_settings.get("perf_options", {}).get("cache_max_mb", 4096),
+                    "long_file_min": self.saved_settings.get("perf_options", {}).get("long_file_min", 30),
+                    "long_window_s": self.saved_settings.get("perf_options", {}).get("long_window_s", 300),
+                    "silence_skip": self.saved_settings.get("perf_options", {}).get("silence_skip", False),
+                    "silence_skip_min_s": self.saved_settings.get("perf_options", {}).get("silence_skip_min_s", 2.0),
+                    "vad_backend": self.saved_settings.get("perf_options", {}).get("vad_backend", "torch"),
+                    "vad_calibration": self.saved_settings.get("perf_options", {}).get("vad_calibration", "adaptive"),
+                    "vad_reuse": self.saved_settings.get("perf_options", {}).get("vad_reuse", False),
                     # Custom Ayarları Koru (Başka moda geçince silinmesin)
                     "custom_batch": self.man_batch_val if "custom" in self.vram_var.get() else self.saved_settings.get("perf_options", {}).get("custom_batch", 8),
                     "custom_beam": self.perf_beam_var.get() if "custom" in self.vram_var.get() else self.saved_settings.get("perf_options", {}).get("custom_beam", 5)
@@ -284,6 +306,16 @@ class WhisperXApp(ctk.CTk):
         self.p_bar.pack(padx=20, pady=(10, 5), fill="x")
         self.p_bar.set(0)
         
+        # Canlı Önizleme (Uzun dosyalarda bölümler bittikçe dolar)
+        self.preview_box = ctk.CTkTextbox(
+            self, 
+            height=60, 
+            fg_color=self.C("fg"), 
+            text_color=self.C("text"),
+            font=FONTS["monospace"]
+        )
+        self.preview_box.pack(padx=20, pady=(5, 0), fill="x")
+        
         self.log_box = ctk.CTkTextbox(
             self, 
             height=100, 
@@ -303,7 +335,35 @@ class WhisperXApp(ctk.CTk):
             hover_color=self.C("accent_hover"),
             command=self.start_process
         )
-        self.btn_go.pack(padx=20, pady=15, fill="x")
+        self.btn_go.pack(padx=20, pady=(15, 5), fill="x")
+        
+        # Re-Format Butonları (GPU'suz, ham JSON'dan: Dosyalar veya klasör)
+        f_reformat = ctk.CTkFrame(self, fg_color="transparent")
+        f_reformat.pack(padx=20, pady=(0, 15), fill="x")
+        
+        self.btn_reformat = ctk.CTkButton(
+            f_reformat,
+            text=self.T("reformat_btn"),
+            height=SIZES["button_height"],
+            font=FONTS["button"],
+            fg_color=self.C("fg"),
+            text_color=self.C("text"),
+            hover_color=self.C("accent_hover"),
+            command=self.reformat_outputs
+        )
+        self.btn_reformat.pack(side="left", fill="x", expand=True)
+        
+        self.btn_reformat_dir = ctk.CTkButton(
+            f_reformat,
+            text=self.T("reformat_folder_btn"),
+            height=SIZES["button_height"],
+            font=FONTS["button"],
+            fg_color=self.C("fg"),
+            text_color=self.C("text"),
+            hover_color=self.C("accent_hover"),
+            command=lambda: self.reformat_outputs(folder=True)
+        )
+        self.btn_reformat_dir.pack(side="right", padx=(10, 0))
     
     def setup_transcribe_tab(self, parent):
         """Transkripsiyon tabını oluşturur."""
@@ -953,17 +1013,49 @@ class WhisperXApp(ctk.CTk):
     
     # --- PROCESSING ---
     
+    def ensure_engine(self):
+        """Kalıcı motor sürecini başlatır (Zaten çalışıyorsa dokunmaz)."""
+        if self.engine and self.engine.is_alive():
+            return self.engine
+        
+        perf = self.saved_settings.get("perf_options", {})
+        idle_timeout = perf.get("engine_idle_timeout", 600)
+        
+        # Worker Pool: "engine_devices" ayarı ile birden fazla cihaz/işçi
+        devices = perf.get("engine_devices")
+        if devices:
+            devices = plan_devices(devices, perf.get("engine_cpu_workers", 1))
+        
+        if devices and len(devices) > 1:
+            self.engine = EnginePool(
+                log_q=self.log_q,
+                result_q=self.result_q,
+                locale_dict=self.L.current_locale,
+                devices=devices,
+                idle_timeout=idle_timeout
+            )
+            self.log_q.put(f"🧩 Worker Pool: {len(devices)} işçi [{', '.join(devices)}]")
+        else:
+            self.engine = EngineDaemon(
+                log_q=self.log_q,
+                result_q=self.result_q,
+                locale_dict=self.L.current_locale,
+                idle_timeout=idle_timeout,
+                device=devices[0] if devices else None
+            )
+        self.engine.start()
+        return self.engine
+    
     def start_process(self):
         """İşlemi başlatır/durdurur."""
         if self.is_running:
-            # ZORLA DURDURMA (Terminate)
-            if self.current_worker and self.current_worker.is_alive():
-                self.log_q.put("🛑 İşlem zorla durduruluyor...")
-                self.current_worker.terminate()
-                self.current_worker.join(timeout=0.1)
+            # İPTAL: Sadece o anki iş durur, motor sıcak kalır
+            if self.engine and self.engine.is_alive() and self.current_job_id:
+                self.log_q.put(self.T("stop_hint"))
+                self.engine.cancel(self.current_job_id)
             
             self.is_running = False
-            self.current_worker = None
+            self.current_job_id = None
             self.btn_go.configure(text=self.T("start_btn"), state="normal", fg_color=self.C("accent"))
             self.log_q.put("⛔ İşlem iptal edildi.")
             self.p_bar.set(0)
@@ -975,6 +1067,7 @@ class WhisperXApp(ctk.CTk):
         
         self.is_running = True
         self.btn_go.configure(text=self.T("stop_btn"), fg_color=self.C("del_btn"))
+        self.preview_box.delete("1.0", "end")
         
         # Worker Config Hazırlama
         # KRİTİK DÜZELTME: Kullanıcı o an ne görüyorsa o çalışmalı.
@@ -985,30 +1078,50 @@ class WhisperXApp(ctk.CTk):
         
         # Sonic veya Custom modda kontrol (Gereksiz karmaşayı önlemek için basitleştirildi)
         curr_vram = self.vram_var.get()
+        perf = self.saved_settings.get("perf_options", {})
         
         config = {
             "max_lines": self.mx_l.get(),
             "max_words": self.mx_w.get(),
             "base_limit": self.base_limit_var.get(),
+            # Miller kural paketi (Bağlaçlar/noktalama) transkripsiyon diline göre seçilir
+            "language": self.CURR_LANG,
             "beam_size": final_beam, 
-            "batch_size": final_batch 
+            "batch_size": final_batch,
+            "mem_flush": self.mem_flush_var.get(),
+            # Aşama Önbelleği (Çöken işler kaldığı yerden devam eder)
+            "stage_cache": perf.get("stage_cache", True),
+            "cache_dir": perf.get("cache_dir") or os.path.join(self.base_dir, "cache"),
+            "cache_max_mb": perf.get("cache_max_mb", 4096),
+            # Uzun Dosya Modu (Bu süreden uzun kayıtlar pencere pencere işlenir)
+            "long_file_min": perf.get("long_file_min", 30),
+            "long_window_s": perf.get("long_window_s", 300),
+            # Sessizlik Atlama (Uzun konuşmasız aralıklar Whisper'a gönderilmez)
+            "silence_skip": perf.get("silence_skip", False),
+            "silence_skip_min_s": perf.get("silence_skip_min_s", 2.0),
+            # VAD Arka Ucu: "torch", "onnx" veya "auto" (CPU işçilerinde ONNX)
+            "vad_backend": perf.get("vad_backend", "torch"),
+            # Smart VAD: "adaptive" (Dosyadan ölçülür) veya "fixed" (Sabit agresif preset)
+            "vad_calibration": perf.get("vad_calibration", "adaptive"),
+            # WhisperX'in transkripsiyon sırasındaki VAD çıktısı Refinery'de kullanılır (Silero yüklenmez)
+            "vad_reuse": perf.get("vad_reuse", False)
         }
         
-        self.current_worker = TranscriptionWorker(
+        self.job_counter += 1
+        self.current_job_id = self.job_counter
+        self.ensure_engine().submit(
+            self.current_job_id,
             audio_list=self.queue_files.copy(),
             out_dir=self.out_p.get(),
             config=config,
             lang=self.CURR_LANG,
             model_name="large-v3",
-            log_q=self.log_q,
-            result_q=self.result_q,
             locale_dict=self.L.current_locale,
             vram_profile=self.vram_var.get(),
             align_engine="Wav2Vec2",
             bridge_ms=self.bridge_ms,
             word_bridge_ms=self.word_bridge_ms
         )
-        self.current_worker.start()
     
     def done(self, res, is_final):
         """İşlem tamamlandığında."""
@@ -1034,65 +1147,60 @@ class WhisperXApp(ctk.CTk):
         
         if is_final:
             self.is_running = False
-            self.current_worker = None
+            self.current_job_id = None
             self.btn_go.configure(
                 text=self.T("start_btn"),
                 fg_color=self.C("accent"),
                 state="normal"
             )
     
+    def show_partial(self, data):
+        """Akış modunda gelen altyazı bloklarını önizleme kutusuna ekler."""
+        try:
+            lines = [
+                f"[{format_timestamp(s['start'])[:8]}] {s['text'].replace(chr(10), ' ')}"
+                for s in data["segments_s"]
+            ]
+            self.preview_box.insert("end", "\n".join(lines) + "\n")
+            
+            # Önizleme kutusu sınırsız büyümesin
+            extra = int(self.preview_box.index("end-1c").split(".")[0]) - 500
+            if extra > 0:
+                self.preview_box.delete("1.0", f"{extra + 1}.0")
+            self.preview_box.see("end")
+        except Exception:
+            pass
+    
+    def output_formats(self):
+        """Seçili çıktı formatları."""
+        return {
+            "sentence": self.chk_ls.get(),
+            "word": self.chk_ws.get(),
+            "json": self.chk_js.get(),
+            "txt_flat": self.chk_tx.get(),
+            "txt_time": self.chk_tt.get()
+        }
+    
+    def output_suffixes(self):
+        """Yerelleştirilmiş dosya sonekleri (örn: _cumle). Çeviri yoksa _format."""
+        suffixes = {}
+        for k in ("sentence", "word", "json", "txt_flat", "txt_time"):
+            default_suffix = self.T(f"suffix_{k}")
+            suffixes[k] = f"_{k}" if default_suffix == f"suffix_{k}" else default_suffix
+        return suffixes
+    
     def save_results(self, res, names, is_final):
         """Sonuçları kaydeder."""
         try:
             out = Path(self.out_p.get())
-            out.mkdir(parents=True, exist_ok=True)
+            paths = write_results(res, out, self.output_formats(), names, self.output_suffixes())
+            for path in paths:
+                self.log_q.put(f"   💾 OK: {Path(path).name}")
             
-            def f_t(s):
-                """Zaman damgası formatlar."""
-                ms = int((s % 1) * 1000)
-                s = int(s)
-                return f"{s//3600:02}:{(s%3600)//60:02}:{s%60:02},{ms:03}"
-            
-            format_map = {
-                "sentence": (self.chk_ls, "srt"),
-                "word": (self.chk_ws, "srt"),
-                "json": (self.chk_js, "json"),
-                "txt_flat": (self.chk_tx, "txt"),
-                "txt_time": (self.chk_tt, "txt")
-            }
-            
-            for k, (var, ext) in format_map.items():
-                if var.get():
-                    # Yerelleştirilmiş sonek (örn: _cumle)
-                    default_suffix = self.T(f"suffix_{k}")
-                    # Eğer çeviri yoksa fallback olarak ingilizce _k kullan
-                    if default_suffix == f"suffix_{k}": default_suffix = f"_{k}"
-                    
-                    name = names.get(k, f"{res['base_name']}{default_suffix}")
-                    path = get_unique_path(out / f"{name}.{ext}")
-                    
-                    with open(path, "w", encoding="utf-8", newline="\r\n") as f:
-                        if k == "sentence":
-                            for i, s in enumerate(res['segments_s'], 1):
-                                f.write(f"{i}\n{f_t(s['start'])} --> {f_t(s['end'])}\n{s['text']}\n\n")
-                        
-                        elif k == "word":
-                            for i, w in enumerate(res['segments_w'], 1):
-                                word_text = w.get('word', w.get('text', ''))
-                                f.write(f"{i}\n{f_t(w['start'])} --> {f_t(w['end'])}\n{word_text}\n\n")
-                        
-                        elif k == "json":
-                            import json as js
-                            js.dump(res['raw'], f, ensure_ascii=False, indent=2)
-                        
-                        elif k == "txt_flat":
-                            f.write(" ".join([s["text"].strip() for s in res['segments_s']]))
-                        
-                        elif k == "txt_time":
-                            for s in res['segments_s']:
-                                f.write(f"[{f_t(s['start'])}] {s['text'].strip()} [{f_t(s['end'])}]\n")
-                    
-                    self.log_q.put(f"   💾 OK: {Path(path).name}")
+            # Kesin çıktı yazıldı: Akış sırasında oluşan ara SRT artık gereksiz
+            partial = partial_srt_path(out, res['base_name'])
+            if partial.exists():
+                partial.unlink()
             
             if is_final and self.auto_o.get():
                 subprocess.Popen(f'explorer "{out}"')
@@ -1100,6 +1208,75 @@ class WhisperXApp(ctk.CTk):
         except Exception as e:
             self.log_q.put(f"❌ Kayıt Hatası: {e}")
     
+    def reformat_outputs(self, folder=False):
+        """
+        Yeniden Formatla: Ham JSON'lardan sadece Chronos + Miller çalışır.
+        GPU motoru başlatılmaz; çıktılar JSON'un yanındaki dosyaların üzerine yazılır.
+        
+        Args:
+            folder: True ise klasör seçilir ve içindeki tüm ham JSON'lar işlenir
+        """
+        if self.is_running:
+            return
+        if self.reformat_thread is not None and self.reformat_thread.is_alive():
+            self.log_q.put("⚠️ Yeniden formatlama zaten sürüyor.")
+            return
+        
+        if folder:
+            path = filedialog.askdirectory(
+                title=self.T("reformat_folder_btn"),
+                initialdir=self.out_p.get()
+            )
+            paths = [path] if path else []
+        else:
+            paths = filedialog.askopenfilenames(
+                title=self.T("reformat_btn"),
+                initialdir=self.out_p.get(),
+                filetypes=[("JSON", "*.json")]
+            )
+        if not paths:
+            return
+        
+        config = {
+            "max_lines": self.mx_l.get(),
+            "max_words": self.mx_w.get(),
+            "base_limit": self.base_limit_var.get(),
+            "language": self.CURR_LANG
+        }
+        formats = self.output_formats()
+        formats["json"] = False  # Kaynak dosyanın kendisi
+        
+        suffixes = self.output_suffixes()
+        raw_suffixes = (suffixes["json"],) + RAW_SUFFIXES
+        
+        # Dosya okuma/yazma arka planda; ilerleme log kuyruğundan gelir
+        self.log_q.put(f"🔁 Yeniden Formatlama Başladı: {len(paths)} kaynak")
+        self.reformat_thread = threading.Thread(
+            target=self._reformat_task,
+            args=(list(paths), config, formats, suffixes, raw_suffixes,
+                  self.bridge_ms, self.word_bridge_ms),
+            daemon=True
+        )
+        self.reformat_thread.start()
+    
+    def _reformat_task(self, paths, config, formats, suffixes, raw_suffixes, bridge_ms, word_bridge_ms):
+        """Yeniden formatlama döngüsü (Arka plan thread'i; UI'a sadece log_q ile yazar)."""
+        count = 0
+        try:
+            for res, elapsed in reformat_results(paths, config, bridge_ms, word_bridge_ms, raw_suffixes):
+                written = write_results(
+                    res, Path(res["source"]).parent, formats, suffixes=suffixes, overwrite=True
+                )
+                count += 1
+                self.log_q.put(f"   ⚡ Yeniden Formatlandı: {res['base_name']} ({elapsed * 1000:.0f} ms, {len(written)} dosya)")
+        except Exception as e:
+            self.log_q.put(f"❌ Kayıt Hatası: {e}")
+        
+        if count == 0:
+            self.log_q.put("⚠️ Hizalanmış ham JSON bulunamadı.")
+        else:
+            self.log_q.put(f"✅ Yeniden Formatlama Bitti: {count} dosya")
+    
     # --- BACKGROUND TASKS ---
     
     def check_logs(self):
@@ -1119,8 +1296,14 @@ class WhisperXApp(ctk.CTk):
             while not self.result_q.empty():
                 msg = self.result_q.get_nowait()
                 
+                # İptal edilmiş eski işlerden gelen mesajları yok say
+                if msg.get("job_id") != self.current_job_id:
+                    continue
+                
                 if msg["type"] == "progress":
                     self.p_bar.set(msg["value"])
+                elif msg["type"] == "partial":
+                    self.show_partial(msg["data"])
                 elif msg["type"] == "done":
                     self.done(msg["data"], msg["is_final"])
         except:
@@ -1131,8 +1314,7 @@ class WhisperXApp(ctk.CTk):
         """Pencere kapatıldığında."""
         self.save_settings()
         
-        if self.current_worker and self.current_worker.is_alive():
-            self.current_worker.terminate()
-            self.current_worker.join(timeout=0.1)
+        if self.engine:
+            self.engine.shutdown(timeout=3.0)
         
         self.destroy()